@@ -3,61 +3,37 @@
 - GET /api/analysis/servers: 서버 목록 + 양호/취약 개수
 - GET /api/analysis/servers/{server_id}/results: 서버별 점검 결과 (카테고리별)
 - GET /api/analysis/servers/{server_id}/remediation: 서버별 조치 이력 (카테고리별)
+- GET /api/analysis/servers/{server_id}/evidence: 항목별 raw_evidence (단건/다건, 목록에서 제외한 증적 지연 조회)
+- GET /api/analysis/servers/{server_id}/trend: 기간별 점검 실행 추이 (scan_results_history)
+- GET /api/analysis/servers/{server_id}/as-of: 특정 시점의 점검 결과 (scan_results_history)
+- GET /api/analysis/history: 점검/조치 이력 (keyset 페이지네이션, legacy=true면 전체 목록)
 """
 
-import json
-import re
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, case
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, case, select
 from sqlalchemy.orm import Session
 
 from db.session import get_db
-from datetime import datetime
-from db.models import User, Server, ScanHistory, KisaItem, RemediationLog, Exception as ExceptionModel
+from datetime import datetime, timedelta
+from db.models import (
+    User, Server, ScanHistory, KisaItem, RemediationLog, ServerCategoryScore, ScanResultHistory,
+    Exception as ExceptionModel
+)
+from db.evidence import EvidenceResolver, extract_evidence_fields
 from core.deps import get_current_user
+from core.etag import company_exception_etag, data_version_etag, server_exception_etag
+from core.responses import encode_json
+from core.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, parse_cursor_datetime, parse_date_param
+)
 
 
 router = APIRouter()
 
 
-def _extract_field_from_evidence(raw: str, field: str) -> str:
-    """raw_evidence JSON에서 특정 필드 추출 (다단계 파싱)"""
-    if not raw:
-        return ""
-
-    # 1차: 직접 JSON 파싱
-    try:
-        parsed = json.loads(raw)
-        if isinstance(parsed, dict) and parsed.get(field):
-            return str(parsed[field])
-        # 이중 인코딩 시도
-        if isinstance(parsed, str):
-            try:
-                inner = json.loads(parsed)
-                if isinstance(inner, dict) and inner.get(field):
-                    return str(inner[field])
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # 2차: 이스케이프된 JSON에서 필드 추출
-    escaped_pattern = rf'\\"{field}\\"\s*:\s*\\"([\s\S]*?)\\"'
-    match = re.search(escaped_pattern, raw)
-    if match:
-        return match.group(1).replace("\\n", "\n").replace("\\t", "\t")
-
-    # 3차: 일반 JSON에서 필드 추출
-    normal_pattern = rf'"{field}"\s*:\s*"((?:[^"\\]|\\.)*)"'
-    match = re.search(normal_pattern, raw)
-    if match:
-        return match.group(1).replace("\\n", "\n").replace('\\"', '"')
-
-    return ""
-
-
-@router.get("/servers")
-async def get_analysis_servers(
+@router.get("/servers", dependencies=[Depends(company_exception_etag)])
+def get_analysis_servers(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -69,17 +45,18 @@ async def get_analysis_servers(
         Server.company == company
     ).order_by(Server.hostname).all()
 
-    # UPSERT 방식이므로 (server_id, item_code) 당 1행만 존재 → 바로 집계
-    vuln_stats = db.query(
-        ScanHistory.server_id,
-        func.sum(case((ScanHistory.status == "양호", 1), else_=0)).label("secure_count"),
-        func.sum(case((ScanHistory.status == "취약", 1), else_=0)).label("vulnerable_count")
+    # 파이프라인이 미리 계산한 server_category_scores에서 서버별 합계만 읽는다 (unknown 카테고리 제외)
+    score_stats = db.query(
+        ServerCategoryScore.server_id,
+        func.sum(ServerCategoryScore.secure_count).label("secure_count"),
+        func.sum(ServerCategoryScore.vulnerable_count).label("vulnerable_count")
     ).join(
-        KisaItem, ScanHistory.item_code == KisaItem.item_code
+        Server, ServerCategoryScore.server_id == Server.server_id
     ).filter(
-        KisaItem.category != "unknown"
+        Server.company == company,
+        ServerCategoryScore.category != "unknown"
     ).group_by(
-        ScanHistory.server_id
+        ServerCategoryScore.server_id
     ).all()
 
     stats_map = {
@@ -87,22 +64,25 @@ async def get_analysis_servers(
             "secure_count": int(s.secure_count or 0),
             "vulnerable_count": int(s.vulnerable_count or 0)
         }
-        for s in vuln_stats
+        for s in score_stats
     }
 
-    # 서버별 활성 예외 개수
-    now = datetime.now()
+    # 서버별 활성 예외 개수는 현재 시각 기준으로 직접 센다
+    # (점수 테이블의 exception_count는 마지막 갱신 시점 기준이라 이후 만료를 반영하지 못함)
     exception_counts = db.query(
         ExceptionModel.server_id,
         func.count(ExceptionModel.exception_id).label("exception_count")
+    ).join(
+        Server, ExceptionModel.server_id == Server.server_id
     ).filter(
-        ExceptionModel.valid_date > now
+        Server.company == company,
+        ExceptionModel.valid_date > datetime.now()
     ).group_by(
         ExceptionModel.server_id
     ).all()
     exception_map = {e.server_id: int(e.exception_count) for e in exception_counts}
 
-    return [
+    return encode_json([
         {
             "server_id": s.server_id,
             "hostname": s.hostname,
@@ -115,17 +95,103 @@ async def get_analysis_servers(
             "exception_count": exception_map.get(s.server_id, 0)
         }
         for s in servers
-    ]
+    ])
+
+
+# 점검 결과 / 조치 이력 항목에서 fields=로 선택할 수 있는 필드 (item_code는 항상 포함)
+SCAN_RESULT_FIELDS = (
+    "item_code", "title", "status", "has_exception", "auto_fix", "severity",
+    "raw_evidence", "scan_date", "guide", "auto_fix_description"
+)
+REMEDIATION_RESULT_FIELDS = (
+    "item_code", "title", "is_success", "failure_reason", "raw_evidence",
+    "action_date", "severity", "auto_fix"
+)
+
+# evidence 엔드포인트 한 번에 조회할 수 있는 최대 항목 수
+MAX_EVIDENCE_ITEMS = 200
+
+
+def _select_fields(fields: Optional[str], include_evidence: bool, allowed: tuple) -> set:
+    """
+    fields(쉼표 구분) / include_evidence → 응답 항목에 남길 필드 집합
+
+    fields가 없으면 전체 필드. include_evidence=false면 raw_evidence를 뺀다.
+    """
+    if fields:
+        selected = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = selected - set(allowed)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"알 수 없는 fields: {', '.join(sorted(unknown))} (허용: {', '.join(allowed)})"
+            )
+        selected.add("item_code")
+    else:
+        selected = set(allowed)
+    if not include_evidence:
+        selected.discard("raw_evidence")
+    return selected
+
+
+def _sparse(item: dict, selected: set) -> dict:
+    if len(selected) == len(item):
+        return item
+    return {k: v for k, v in item.items() if k in selected}
+
+
+def _load_scan_evidence(db: Session, server_id: str, item_codes) -> dict:
+    """scan_history 항목별 raw_evidence {item_code: str}"""
+    rows = db.query(
+        ScanHistory.item_code,
+        ScanHistory.raw_evidence,
+        ScanHistory.evidence_hash
+    ).filter(
+        ScanHistory.server_id == server_id,
+        ScanHistory.item_code.in_(item_codes)
+    ).all()
+    evidence = EvidenceResolver(db, [r.evidence_hash for r in rows if not r.raw_evidence])
+    return {r.item_code: evidence.get(r.raw_evidence, r.evidence_hash) for r in rows}
 
 
-@router.get("/servers/{server_id}/results")
-async def get_server_results(
+def _load_remediation_evidence(db: Session, server_id: str, item_codes) -> dict:
+    """remediation_logs 항목별 최신 조치의 raw_evidence {item_code: str}"""
+    latest_logs = db.query(
+        func.max(RemediationLog.log_id)
+    ).filter(
+        RemediationLog.server_id == server_id,
+        RemediationLog.item_code.in_(item_codes)
+    ).group_by(
+        RemediationLog.item_code
+    )
+    rows = db.query(
+        RemediationLog.item_code,
+        RemediationLog.raw_evidence,
+        RemediationLog.evidence_hash
+    ).filter(
+        RemediationLog.log_id.in_(latest_logs)
+    ).all()
+    evidence = EvidenceResolver(db, [r.evidence_hash for r in rows if not r.raw_evidence])
+    return {r.item_code: evidence.get(r.raw_evidence, r.evidence_hash) for r in rows}
+
+
+@router.get("/servers/{server_id}/results", dependencies=[Depends(server_exception_etag)])
+def get_server_results(
     server_id: str,
+    include_evidence: bool = Query(True, description="false면 raw_evidence 제외 (evidence 엔드포인트로 지연 조회)"),
+    fields: Optional[str] = Query(None, description="항목에 포함할 필드 (쉼표 구분, 예: item_code,status,title)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """서버별 점검 결과 (카테고리별 그룹핑)"""
+    """
+    서버별 점검 결과 (카테고리별 그룹핑)
+
+    raw_evidence(LONGTEXT)를 빼면 해당 컬럼/evidence_blobs를 아예 읽지 않는다.
+    카테고리별 개수는 fields와 관계없이 항상 계산한다.
+    """
     company = current_user.company
+    selected = _select_fields(fields, include_evidence, SCAN_RESULT_FIELDS)
+    with_evidence = "raw_evidence" in selected
 
     # 서버 확인
     server = db.query(Server).filter(
@@ -137,10 +203,12 @@ async def get_server_results(
         raise HTTPException(status_code=404, detail="서버를 찾을 수 없습니다")
 
     # UPSERT 방식이므로 (server_id, item_code) 당 1행 → 바로 조회
+    evidence_columns = [ScanHistory.raw_evidence, ScanHistory.evidence_hash] if with_evidence else []
     results = db.query(
         ScanHistory.item_code,
         ScanHistory.status,
-        ScanHistory.raw_evidence,
+        *evidence_columns,
+        ScanHistory.evidence_guide,
         ScanHistory.scan_date,
         KisaItem.category,
         KisaItem.title,
@@ -181,9 +249,22 @@ async def get_server_results(
         "patch": {"secure_count": 0, "vulnerable_count": 0, "exception_count": 0, "items": []},
     }
 
+    if with_evidence:
+        # raw_evidence가 evidence_blobs로 옮겨진 행은 필요한 blob만 한 번에 조회
+        evidence = EvidenceResolver(db, [r.evidence_hash for r in results if not r.raw_evidence])
+        raw_map = {r.item_code: evidence.get(r.raw_evidence, r.evidence_hash) for r in results}
+    else:
+        # 증적 제외: evidence_guide 추출 이전 행의 guide 계산에 필요한 증적만 읽는다
+        legacy_codes = [r.item_code for r in results if r.evidence_guide is None]
+        raw_map = _load_scan_evidence(db, server_id, legacy_codes) if "guide" in selected and legacy_codes else {}
+
     for r in results:
-        # raw_evidence에서 guide 파싱, 없으면 KisaItem.guide 폴백
-        evidence_guide = _extract_field_from_evidence(r.raw_evidence, "guide")
+        raw_evidence = raw_map.get(r.item_code, "")
+
+        # 적재 시 추출한 evidence_guide 사용 (추출 이전 행만 raw_evidence 파싱), 없으면 KisaItem.guide 폴백
+        evidence_guide = r.evidence_guide
+        if evidence_guide is None:
+            evidence_guide = extract_evidence_fields(raw_evidence)["guide"]
         guide = evidence_guide if evidence_guide else (r.guide or "")
 
         # 예외 상태 오버레이
@@ -197,11 +278,12 @@ async def get_server_results(
             "has_exception": has_exception,
             "auto_fix": r.auto_fix,
             "severity": r.severity,
-            "raw_evidence": r.raw_evidence,
+            "raw_evidence": raw_evidence,
             "scan_date": r.scan_date.strftime("%Y-%m-%d %H:%M") if r.scan_date else "",
             "guide": guide,
             "auto_fix_description": r.auto_fix_description or ""
         }
+        item = _sparse(item, selected)
 
         if r.item_code.startswith("U-"):
             cat = r.category
@@ -226,7 +308,7 @@ async def get_server_results(
                 else:
                     db_categories[cat]["vulnerable_count"] += 1
 
-    return {
+    return encode_json({
         "server_info": {
             "server_id": server.server_id,
             "hostname": server.hostname,
@@ -237,17 +319,21 @@ async def get_server_results(
         },
         "os_results": os_categories,
         "db_results": db_categories
-    }
+    })
 
 
-@router.get("/servers/{server_id}/remediation")
-async def get_server_remediation(
+@router.get("/servers/{server_id}/remediation", dependencies=[Depends(data_version_etag)])
+def get_server_remediation(
     server_id: str,
+    include_evidence: bool = Query(True, description="false면 raw_evidence 제외 (evidence 엔드포인트로 지연 조회)"),
+    fields: Optional[str] = Query(None, description="항목에 포함할 필드 (쉼표 구분, 예: item_code,is_success,title)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """서버별 조치 이력 (카테고리별 그룹핑)"""
     company = current_user.company
+    selected = _select_fields(fields, include_evidence, REMEDIATION_RESULT_FIELDS)
+    with_evidence = "raw_evidence" in selected
 
     # 서버 확인
     server = db.query(Server).filter(
@@ -271,7 +357,7 @@ async def get_server_remediation(
         RemediationLog.item_code,
         RemediationLog.is_success,
         RemediationLog.failure_reason,
-        RemediationLog.raw_evidence,
+        *([RemediationLog.raw_evidence, RemediationLog.evidence_hash] if with_evidence else []),
         RemediationLog.action_date,
         KisaItem.category,
         KisaItem.title,
@@ -301,17 +387,22 @@ async def get_server_remediation(
         "patch": {"success_count": 0, "fail_count": 0, "items": []},
     }
 
+    evidence = None
+    if with_evidence:
+        evidence = EvidenceResolver(db, [r.evidence_hash for r in results if not r.raw_evidence])
+
     for r in results:
         item = {
             "item_code": r.item_code,
             "title": r.title,
             "is_success": r.is_success,
             "failure_reason": r.failure_reason or "",
-            "raw_evidence": r.raw_evidence or "",
+            "raw_evidence": evidence.get(r.raw_evidence, r.evidence_hash) if evidence else "",
             "action_date": r.action_date.strftime("%Y-%m-%d %H:%M") if r.action_date else "",
             "severity": r.severity,
             "auto_fix": r.auto_fix
         }
+        item = _sparse(item, selected)
 
         if r.item_code.startswith("U-"):
             cat = r.category
@@ -330,20 +421,191 @@ async def get_server_remediation(
                 else:
                     db_categories[cat]["fail_count"] += 1
 
-    return {
+    return encode_json({
         "os_results": os_categories,
         "db_results": db_categories
+    })
+
+
+def _get_company_server(db: Session, server_id: str, company: str) -> Server:
+    server = db.query(Server).filter(
+        Server.server_id == server_id,
+        Server.company == company
+    ).first()
+    if not server:
+        raise HTTPException(status_code=404, detail="서버를 찾을 수 없습니다")
+    return server
+
+
+@router.get("/servers/{server_id}/evidence", dependencies=[Depends(data_version_etag)])
+def get_server_evidence(
+    server_id: str,
+    item_codes: str = Query(..., description="항목 코드 (쉼표 구분, 예: U-01 또는 U-01,U-02)"),
+    source: str = Query("scan", pattern="^(scan|remediation)$", description="scan | remediation(최신 조치)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    항목별 raw_evidence 지연 조회 (results/remediation을 include_evidence=false로 받은 경우)
+
+    Returns:
+        {"server_id", "source", "items": {item_code: raw_evidence}}  (결과가 없는 항목은 제외)
+    """
+    _get_company_server(db, server_id, current_user.company)
+
+    codes = sorted({c.strip() for c in item_codes.split(",") if c.strip()})
+    if not codes:
+        raise HTTPException(status_code=400, detail="item_codes를 입력해주세요")
+    if len(codes) > MAX_EVIDENCE_ITEMS:
+        raise HTTPException(status_code=400, detail=f"item_codes는 최대 {MAX_EVIDENCE_ITEMS}개까지 조회할 수 있습니다")
+
+    if source == "scan":
+        items = _load_scan_evidence(db, server_id, codes)
+    else:
+        items = _load_remediation_evidence(db, server_id, codes)
+
+    return encode_json({"server_id": server_id, "source": source, "items": items})
+
+
+@router.get("/servers/{server_id}/trend")
+def get_server_trend(
+    server_id: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    기간별 점검 실행 추이 (실행당 양호/취약 건수)
+    scan_date 범위 조건으로 scan_results_history의 해당 월 파티션만 읽는다. (기본: 최근 90일)
+    """
+    _get_company_server(db, server_id, current_user.company)
+
+    end_date = parse_date_param(end, datetime.now())
+    start_date = parse_date_param(start, end_date - timedelta(days=90))
+    if end and len(end) == 10:
+        end_date += timedelta(days=1)  # 날짜만 주면 해당 일자 포함
+
+    rows = db.query(
+        ScanResultHistory.run_id,
+        ScanResultHistory.scan_date,
+        func.count().label("total"),
+        func.sum(case((ScanResultHistory.status == "양호", 1), else_=0)).label("secure_count"),
+        func.sum(case((ScanResultHistory.status == "취약", 1), else_=0)).label("vulnerable_count")
+    ).filter(
+        ScanResultHistory.server_id == server_id,
+        ScanResultHistory.scan_date >= start_date,
+        ScanResultHistory.scan_date < end_date
+    ).group_by(
+        ScanResultHistory.run_id, ScanResultHistory.scan_date
+    ).order_by(
+        ScanResultHistory.scan_date
+    ).all()
+
+    return {
+        "server_id": server_id,
+        "start": start_date.strftime("%Y-%m-%d %H:%M:%S"),
+        "end": end_date.strftime("%Y-%m-%d %H:%M:%S"),
+        "runs": [
+            {
+                "run_id": r.run_id,
+                "scan_date": r.scan_date.strftime("%Y-%m-%d %H:%M"),
+                "total": int(r.total),
+                "secure_count": int(r.secure_count or 0),
+                "vulnerable_count": int(r.vulnerable_count or 0)
+            }
+            for r in rows
+        ]
     }
 
 
-@router.get("/history")
-async def get_history(
+@router.get("/servers/{server_id}/as-of")
+def get_server_results_as_of(
+    server_id: str,
+    at: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """전체 점검 이력 + 조치 이력 (플랫 리스트)"""
-    company = current_user.company
+    """
+    특정 시점(at) 기준 가장 최근 점검 실행의 항목별 결과
+    PK(server_id, scan_date, ...)로 시점을 찾은 뒤 그 scan_date 파티션 하나만 읽는다.
+    """
+    _get_company_server(db, server_id, current_user.company)
+
+    as_of = parse_date_param(at, datetime.now())
+    if at and len(at) == 10:
+        as_of = as_of.replace(hour=23, minute=59, second=59)  # 날짜만 주면 해당 일자 끝까지
+
+    snapshot_date = db.query(func.max(ScanResultHistory.scan_date)).filter(
+        ScanResultHistory.server_id == server_id,
+        ScanResultHistory.scan_date <= as_of
+    ).scalar()
+
+    if snapshot_date is None:
+        return {"server_id": server_id, "as_of": as_of.strftime("%Y-%m-%d %H:%M:%S"),
+                "scan_date": None, "run_id": None, "items": []}
+
+    run_id = db.query(func.max(ScanResultHistory.run_id)).filter(
+        ScanResultHistory.server_id == server_id,
+        ScanResultHistory.scan_date == snapshot_date
+    ).scalar()
+
+    rows = db.query(
+        ScanResultHistory.item_code,
+        ScanResultHistory.status,
+        KisaItem.title,
+        KisaItem.category,
+        KisaItem.severity
+    ).join(
+        KisaItem, ScanResultHistory.item_code == KisaItem.item_code
+    ).filter(
+        ScanResultHistory.server_id == server_id,
+        ScanResultHistory.scan_date == snapshot_date,
+        ScanResultHistory.run_id == run_id
+    ).order_by(
+        ScanResultHistory.item_code
+    ).all()
+
+    return {
+        "server_id": server_id,
+        "as_of": as_of.strftime("%Y-%m-%d %H:%M:%S"),
+        "scan_date": snapshot_date.strftime("%Y-%m-%d %H:%M"),
+        "run_id": run_id,
+        "items": [
+            {
+                "item_code": r.item_code,
+                "title": r.title,
+                "category": r.category,
+                "severity": r.severity,
+                "status": r.status
+            }
+            for r in rows
+        ]
+    }
+
+
+def _scan_history_item(s) -> dict:
+    return {
+        "scan_date": s.scan_date.strftime("%Y-%m-%d %H:%M") if s.scan_date else "",
+        "server_id": s.server_id,
+        "item_code": s.item_code,
+        "title": s.title,
+        "status": s.status
+    }
+
 
+def _remediation_history_item(r) -> dict:
+    return {
+        "action_date": r.action_date.strftime("%Y-%m-%d %H:%M") if r.action_date else "",
+        "server_id": r.server_id,
+        "item_code": r.item_code,
+        "title": r.title,
+        "is_success": r.is_success
+    }
+
+
+def _get_history_legacy(db: Session, company: str) -> dict:
+    """이전 응답 형식 (전체 점검 이력 + 조치 이력 플랫 리스트, 페이지네이션 없음)"""
     # 해당 회사 서버 ID 목록
     server_ids = [
         s.server_id for s in
@@ -385,24 +647,107 @@ async def get_history(
     ).all()
 
     return {
-        "scans": [
-            {
-                "scan_date": s.scan_date.strftime("%Y-%m-%d %H:%M") if s.scan_date else "",
-                "server_id": s.server_id,
-                "item_code": s.item_code,
-                "title": s.title,
-                "status": s.status
-            }
-            for s in scans
-        ],
-        "remediations": [
-            {
-                "action_date": r.action_date.strftime("%Y-%m-%d %H:%M") if r.action_date else "",
-                "server_id": r.server_id,
-                "item_code": r.item_code,
-                "title": r.title,
-                "is_success": r.is_success
-            }
-            for r in remediations
-        ]
+        "scans": [_scan_history_item(s) for s in scans],
+        "remediations": [_remediation_history_item(r) for r in remediations]
     }
+
+
+@router.get("/history")
+def get_history(
+    kind: str = Query("scans", pattern="^(scans|remediations)$", description="scans | remediations"),
+    server_id: Optional[str] = None,
+    item_code: Optional[str] = None,
+    status: Optional[str] = Query(None, description="scans: 양호/취약, remediations: success/fail"),
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    legacy: bool = Query(False, description="true면 이전 형식({scans, remediations} 전체 목록)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    점검 이력 / 조치 이력 (keyset 페이지네이션)
+
+    - kind=scans: scan_date 내림차순, kind=remediations: action_date 내림차순
+    - 응답의 next_cursor를 cursor로 넘기면 다음 페이지 (null이면 마지막 페이지)
+    """
+    company = current_user.company
+    if legacy:
+        return encode_json(_get_history_legacy(db, company))
+
+    start_dt = parse_date_param(start)
+    end_dt = parse_date_param(end)
+    company_servers = select(Server.server_id).where(Server.company == company)
+
+    if kind == "scans":
+        query = db.query(
+            ScanHistory.scan_date,
+            ScanHistory.server_id,
+            ScanHistory.item_code,
+            ScanHistory.status,
+            KisaItem.title
+        ).join(
+            KisaItem, ScanHistory.item_code == KisaItem.item_code
+        ).filter(
+            ScanHistory.server_id.in_(company_servers),
+            KisaItem.category != "unknown"
+        )
+        if server_id:
+            query = query.filter(ScanHistory.server_id == server_id)
+        if item_code:
+            query = query.filter(ScanHistory.item_code == item_code)
+        if status:
+            if status not in ("양호", "취약"):
+                raise HTTPException(status_code=400, detail="status는 양호 또는 취약이어야 합니다")
+            query = query.filter(ScanHistory.status == status)
+        if start_dt:
+            query = query.filter(ScanHistory.scan_date >= start_dt)
+        if end_dt:
+            query = query.filter(ScanHistory.scan_date <= end_dt)
+
+        rows, next_cursor = paginate(
+            query,
+            [ScanHistory.scan_date, ScanHistory.server_id, ScanHistory.item_code],
+            cursor, limit, parsers=[parse_cursor_datetime, str, str]
+        )
+        items = [_scan_history_item(r) for r in rows]
+    else:
+        query = db.query(
+            RemediationLog.log_id,
+            RemediationLog.action_date,
+            RemediationLog.server_id,
+            RemediationLog.item_code,
+            RemediationLog.is_success,
+            KisaItem.title
+        ).join(
+            KisaItem, RemediationLog.item_code == KisaItem.item_code
+        ).filter(
+            RemediationLog.server_id.in_(company_servers)
+        )
+        if server_id:
+            query = query.filter(RemediationLog.server_id == server_id)
+        if item_code:
+            query = query.filter(RemediationLog.item_code == item_code)
+        if status:
+            if status not in ("success", "fail"):
+                raise HTTPException(status_code=400, detail="status는 success 또는 fail이어야 합니다")
+            query = query.filter(RemediationLog.is_success == (status == "success"))
+        if start_dt:
+            query = query.filter(RemediationLog.action_date >= start_dt)
+        if end_dt:
+            query = query.filter(RemediationLog.action_date <= end_dt)
+
+        rows, next_cursor = paginate(
+            query,
+            [RemediationLog.action_date, RemediationLog.log_id],
+            cursor, limit, parsers=[parse_cursor_datetime, int]
+        )
+        items = [_remediation_history_item(r) for r in rows]
+
+    return encode_json({
+        "kind": kind,
+        "items": items,
+        "next_cursor": next_cursor,
+        "limit": limit
+    })
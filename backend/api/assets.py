@@ -4,12 +4,15 @@
 
 import subprocess
 from pathlib import Path
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from core.deps import get_db, get_admin_user
-from db.models import User, Server, ScanHistory, RemediationLog, Exception
+from core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
+from db.models import User, Server, ScanHistory, RemediationLog, Exception, ServerScore, ServerCategoryScore
+from db.data_version import bump_data_version_in_session
 from schemas.asset import (
     ServerCreate,
     BulkServerCreate,
@@ -44,7 +47,7 @@ def _run_sync_inventory():
 
 
 @router.post("/test/ssh")
-async def test_ssh(
+def test_ssh(
     request: SSHTestRequest,
     current_user: User = Depends(get_admin_user)
 ):
@@ -71,7 +74,7 @@ async def test_ssh(
 
 
 @router.post("/test/db-port")
-async def test_db_port_endpoint(
+def test_db_port_endpoint(
     request: DBPortTestRequest,
     current_user: User = Depends(get_admin_user)
 ):
@@ -97,7 +100,7 @@ async def test_db_port_endpoint(
 
 
 @router.post("/test/db-login")
-async def test_db_login_endpoint(
+def test_db_login_endpoint(
     request: DBLoginTestRequest,
     current_user: User = Depends(get_admin_user)
 ):
@@ -126,7 +129,7 @@ async def test_db_login_endpoint(
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
-async def register_server(
+def register_server(
     server: ServerCreate,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -148,6 +151,7 @@ async def register_server(
     try:
         new_server = create_server(db, server)
         _run_sync_inventory()
+        bump_data_version_in_session(db, [new_server.company])
 
         return {
             "id": new_server.id,
@@ -178,7 +182,7 @@ async def register_server(
 
 
 @router.post("/bulk", status_code=status.HTTP_201_CREATED)
-async def register_servers_bulk(
+def register_servers_bulk(
     request: BulkServerCreate,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -226,6 +230,9 @@ async def register_servers_bulk(
 
     if success_count > 0:
         _run_sync_inventory()
+        bump_data_version_in_session(db, [
+            s.company for s, r in zip(request.servers, results) if r["status"] == "success"
+        ])
 
     return {
         "total": len(results),
@@ -236,26 +243,50 @@ async def register_servers_bulk(
 
 
 @router.get("")
-async def list_servers(
+def list_servers(
+    server_id: Optional[str] = None,
+    company: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    legacy: bool = Query(False, description="true면 이전 형식(활성 서버 전체 배열)"),
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
 ):
     """
-    서버 목록 조회
+    서버 목록 조회 (id 오름차순 keyset 페이지네이션)
 
     Args:
+        server_id / company: 필터 (정확히 일치)
+        cursor: 이전 응답의 next_cursor
+        limit: 페이지 크기
+        legacy: 이전 응답 형식 사용 여부
         current_user: 현재 사용자 (ADMIN 권한 필요)
         db: 데이터베이스 세션
 
     Returns:
-        서버 목록
+        {"items": 서버 목록, "next_cursor", "limit"} (legacy=true면 서버 목록 배열)
     """
-    servers = db.query(Server).filter(Server.is_active == True).all()
-    return servers
+    query = db.query(Server).filter(Server.is_active == True)
+    if legacy:
+        return query.all()
+
+    if server_id:
+        query = query.filter(Server.server_id == server_id)
+    if company:
+        query = query.filter(Server.company == company)
+
+    servers, next_cursor = paginate(
+        query, [Server.id], cursor, limit, parsers=[int], descending=False
+    )
+    return {
+        "items": servers,
+        "next_cursor": next_cursor,
+        "limit": limit
+    }
 
 
 @router.delete("/{server_id}")
-async def delete_server(
+def delete_server(
     server_id: str,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -292,10 +323,16 @@ async def delete_server(
         # 3. 예외 관리 삭제
         deleted_exceptions = db.query(Exception).filter(Exception.server_id == server_id).delete()
 
-        # 4. 서버 삭제
+        # 4. 점수 삭제
+        db.query(ServerCategoryScore).filter(ServerCategoryScore.server_id == server_id).delete()
+        db.query(ServerScore).filter(ServerScore.server_id == server_id).delete()
+
+        # 5. 서버 삭제
+        company = server.company
         db.delete(server)
         db.commit()
         _run_sync_inventory()
+        bump_data_version_in_session(db, [company])
 
         return {
             "message": f"서버 '{server_id}' 삭제 완료",
@@ -3,8 +3,13 @@
 - POST /api/auth/login: 로그인 (JWT 발급)
 - GET /api/auth/me: 현재 사용자 정보
 - POST /api/auth/change-password: 비밀번호 변경
+
+로그인/비밀번호 변경은 PBKDF2 계산을 전용 프로세스 풀(core/concurrency.password_pool)에서
+수행하고, DB 작업은 스레드풀로 넘긴다. 풀 대기열이 가득 차면 503, 같은 계정의 요청이
+이미 처리 중이면 429로 즉시 응답한다.
 """
 
+from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
@@ -18,19 +23,62 @@ from schemas.auth import (
     ChangePasswordRequest
 )
 from core.security import (
-    verify_password,
-    hash_password,
+    verify_password_async,
+    hash_password_async,
     create_access_token
 )
 from core.deps import get_current_user
+from core import auth_cache
+from core.concurrency import (
+    run_in_thread,
+    password_user_limit,
+    ConcurrencyLimitError,
+    PoolBusyError
+)
 from core.config import PASSWORD_MIN_LEN, PASSWORD_MAX_LEN
 
 
 router = APIRouter()
 
 
+@asynccontextmanager
+async def _password_slot(username: str):
+    """계정별 동시 처리 제한 + 해싱 풀 포화 시 즉시 거절"""
+    try:
+        async with password_user_limit.acquire(username):
+            yield
+    except ConcurrencyLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+    except PoolBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+
+
+def _get_user(db: Session, **filters) -> User:
+    return db.query(User).filter_by(**filters).first()
+
+
+def _save_user(db: Session, user: User, credentials_changed: bool = False) -> None:
+    # commit 후 만료된 속성을 스레드 안에서 다시 읽어 둔다 (이벤트 루프에서 지연 로딩 방지)
+    db.commit()
+    db.refresh(user)
+    if credentials_changed:
+        # 비밀번호/권한 변경: 스탬프를 갱신해 모든 워커의 캐시를 무효화
+        auth_cache.invalidate_user(user.user_id)
+    else:
+        # last_login 등: 이 워커의 항목만 갱신 (다른 워커 캐시는 유지)
+        auth_cache.forget_user(user.user_id)
+
+
 @router.post("/login", response_model=LoginResponse)
-def login(
+async def login(
     request: LoginRequest,
     db: Session = Depends(get_db)
 ):
@@ -47,25 +95,26 @@ def login(
     Raises:
         HTTPException: 인증 실패
     """
-    # 사용자 조회
-    user = db.query(User).filter(User.user_name == request.username).first()
+    async with _password_slot(request.username):
+        # 사용자 조회
+        user = await run_in_thread(_get_user, db, user_name=request.username)
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="아이디 또는 비밀번호가 올바르지 않습니다"
-        )
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="아이디 또는 비밀번호가 올바르지 않습니다"
+            )
 
-    # 비밀번호 검증
-    if not verify_password(request.password, user.user_passwd):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="아이디 또는 비밀번호가 올바르지 않습니다"
-        )
+        # 비밀번호 검증
+        if not await verify_password_async(request.password, user.user_passwd):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="아이디 또는 비밀번호가 올바르지 않습니다"
+            )
 
     # last_login 업데이트
     user.last_login = datetime.now()
-    db.commit()
+    await run_in_thread(_save_user, db, user)
 
     # JWT 토큰 생성
     access_token = create_access_token(
@@ -101,7 +150,7 @@ def get_current_user_info(
 
 
 @router.post("/change-password")
-def change_password(
+async def change_password(
     request: ChangePasswordRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -120,47 +169,58 @@ def change_password(
     Raises:
         HTTPException: 비밀번호 검증 실패
     """
-    # 기존 비밀번호 검증
-    if not verify_password(request.old_password, current_user.user_passwd):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="현재 비밀번호가 올바르지 않습니다"
-        )
+    async with _password_slot(current_user.user_name):
+        # current_user는 인증 캐시에서 온 분리 객체일 수 있으므로 세션에서 다시 조회
+        user = await run_in_thread(_get_user, db, user_id=current_user.user_id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="사용자를 찾을 수 없습니다. 다시 로그인해주세요.",
+            )
 
-    # 새 비밀번호 검증
-    if len(request.new_password) < PASSWORD_MIN_LEN:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"비밀번호는 최소 {PASSWORD_MIN_LEN}자 이상이어야 합니다"
-        )
+        # 기존 비밀번호 검증
+        if not await verify_password_async(request.old_password, user.user_passwd):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="현재 비밀번호가 올바르지 않습니다"
+            )
 
-    if len(request.new_password) > PASSWORD_MAX_LEN:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"비밀번호는 {PASSWORD_MAX_LEN}자 이하여야 합니다"
-        )
+        # 새 비밀번호 검증
+        if len(request.new_password) < PASSWORD_MIN_LEN:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"비밀번호는 최소 {PASSWORD_MIN_LEN}자 이상이어야 합니다"
+            )
 
-    # 이전 비밀번호와 동일한지 확인
-    if verify_password(request.new_password, current_user.user_passwd):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="새 비밀번호는 현재 비밀번호와 달라야 합니다"
-        )
+        if len(request.new_password) > PASSWORD_MAX_LEN:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"비밀번호는 {PASSWORD_MAX_LEN}자 이하여야 합니다"
+            )
 
-    # prev_user_passwd가 있으면 그것과도 비교
-    if current_user.prev_user_passwd:
-        if verify_password(request.new_password, current_user.prev_user_passwd):
+        # 이전 비밀번호와 동일한지 확인
+        if await verify_password_async(request.new_password, user.user_passwd):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="새 비밀번호는 이전 비밀번호와 달라야 합니다"
+                detail="새 비밀번호는 현재 비밀번호와 달라야 합니다"
             )
 
+        # prev_user_passwd가 있으면 그것과도 비교
+        if user.prev_user_passwd:
+            if await verify_password_async(request.new_password, user.prev_user_passwd):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="새 비밀번호는 이전 비밀번호와 달라야 합니다"
+                )
+
+        new_hash = await hash_password_async(request.new_password)
+
     # 비밀번호 변경
-    current_user.prev_user_passwd = current_user.user_passwd
-    current_user.user_passwd = hash_password(request.new_password)
-    current_user.password_changed_at = datetime.now()
-    current_user.must_change_password = False
+    user.prev_user_passwd = user.user_passwd
+    user.user_passwd = new_hash
+    user.password_changed_at = datetime.now()
+    user.must_change_password = False
 
-    db.commit()
+    await run_in_thread(_save_user, db, user, True)
 
     return {"message": "비밀번호가 변경되었습니다"}
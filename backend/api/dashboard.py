@@ -1,22 +1,34 @@
 """
 대시보드 API
 - GET /api/dashboard/data: 메인 대시보드 전체 데이터
+
+항목 단위 집계(카테고리/서버별 취약 개수, 리스크 분포)는 파이프라인이 미리 계산해 둔
+server_category_scores(서버 × OS/DB × 카테고리)만 읽는다. (scan_history 전체를 매번 집계하지 않음)
+활성 서버와 카테고리 점수를 한 번의 조회로 가져와 모든 카운터를 Python에서 재구성한다.
+(최근 점검 시간만 별도의 MAX(scan_date) 조회이며, 건수 집계에는 scan_date 조건이 없다)
+
+OS 카테고리/TOP 5는 'U-' 항목, DB 카테고리/TOP 5는 'D-' 항목만 센다. (item_prefix 'U' / 'D')
+미해결 건수, 리스크 분포, 양호/위험 비율은 모든 항목(PG-D-, MY-D- 포함)을 센다.
 """
 
+from collections import Counter
+
 from fastapi import APIRouter, Depends
-from sqlalchemy import func, case, distinct
+from sqlalchemy import func, and_
 from sqlalchemy.orm import Session
 
 from db.session import get_db
-from db.models import User, Server, ScanHistory, KisaItem
+from db.models import User, Server, ScanHistory, ServerCategoryScore
 from core.deps import get_current_user
+from core.etag import data_version_etag
+from core.responses import encode_json
 
 
 router = APIRouter()
 
 
-@router.get("/data")
-async def get_dashboard_data(
+@router.get("/data", dependencies=[Depends(data_version_etag)])
+def get_dashboard_data(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -26,9 +38,55 @@ async def get_dashboard_data(
     """
     company = current_user.company
 
+    # ===== 단일 조회 =====
+    # 활성 서버 × (OS/DB × 카테고리) 행을 한 번에 읽고, 모든 카운터는 아래에서 Python으로 재구성한다.
+    # 건수는 scan_date와 무관하게 scan_history 현재 행 전체를 집계한 server_category_scores 값이다.
+    rows = db.query(
+        Server.server_id,
+        Server.hostname,
+        Server.ip_address,
+        Server.os_type,
+        Server.db_type,
+        ServerCategoryScore.item_prefix,
+        ServerCategoryScore.category,
+        ServerCategoryScore.vulnerable_count,
+        ServerCategoryScore.secure_count,
+        ServerCategoryScore.vuln_high,
+        ServerCategoryScore.vuln_medium,
+        ServerCategoryScore.vuln_low
+    ).outerjoin(
+        ServerCategoryScore,
+        and_(
+            ServerCategoryScore.server_id == Server.server_id,
+            ServerCategoryScore.category != "unknown"
+        )
+    ).filter(
+        Server.company == company,
+        Server.is_active == True
+    ).all()
+
+    servers = {}                                         # server_id → 서버 정보
+    server_vulns = {"U": Counter(), "D": Counter()}      # item_prefix → server_id → 취약 개수
+    category_vulns = {"U": Counter(), "D": Counter()}    # item_prefix → category → 취약 개수
+    totals = Counter()
+
+    for r in rows:
+        servers.setdefault(r.server_id, r)
+        if r.item_prefix is None:
+            continue
+        vulnerable = int(r.vulnerable_count or 0)
+        if r.item_prefix in server_vulns:
+            server_vulns[r.item_prefix][r.server_id] += vulnerable
+            category_vulns[r.item_prefix][r.category] += vulnerable
+        totals["vulnerable"] += vulnerable
+        totals["secure"] += int(r.secure_count or 0)
+        totals["high"] += int(r.vuln_high or 0)
+        totals["medium"] += int(r.vuln_medium or 0)
+        totals["low"] += int(r.vuln_low or 0)
+
     # ===== 1. 상단 정보 =====
 
-    # 최근 점검 시간 (모든 점검 이력에서 가장 최근 것)
+    # 최근 점검 시간 (모든 점검 이력에서 가장 최근 것, 표시용이며 건수 집계에는 쓰지 않음)
     last_scan = db.query(func.max(ScanHistory.scan_date)).join(
         Server, ScanHistory.server_id == Server.server_id
     ).filter(
@@ -37,59 +95,16 @@ async def get_dashboard_data(
     ).scalar()
 
     # 점검한 서버 개수
-    total_servers = db.query(func.count(distinct(Server.id))).filter(
-        Server.company == company,
-        Server.is_active == True
-    ).scalar() or 0
+    total_servers = len(servers)
 
-    # OS 버전 정보 (가장 많이 사용하는 버전 2개)
-    os_versions = db.query(
-        Server.os_type,
-        func.count(Server.id).label("count")
-    ).filter(
-        Server.company == company,
-        Server.is_active == True
-    ).group_by(
-        Server.os_type
-    ).order_by(
-        func.count(Server.id).desc()
-    ).limit(2).all()
-
-    # DB 버전 정보 (가장 많이 사용하는 버전 2개)
-    db_versions = db.query(
-        Server.db_type,
-        func.count(Server.id).label("count")
-    ).filter(
-        Server.company == company,
-        Server.is_active == True,
-        Server.db_type.isnot(None)
-    ).group_by(
-        Server.db_type
-    ).order_by(
-        func.count(Server.id).desc()
-    ).limit(2).all()
+    # OS / DB 버전 정보 (가장 많이 사용하는 버전 2개)
+    os_versions = Counter(s.os_type for s in servers.values()).most_common(2)
+    db_versions = Counter(s.db_type for s in servers.values() if s.db_type is not None).most_common(2)
 
-    os_info = " • ".join([v.os_type for v in os_versions]) if os_versions else "N/A"
-    db_info = " • ".join([v.db_type for v in db_versions]) if db_versions else "N/A"
+    os_info = " • ".join([name for name, _ in os_versions]) if os_versions else "N/A"
+    db_info = " • ".join([name for name, _ in db_versions]) if db_versions else "N/A"
 
     # ===== 2. OS 보안 카테고리 =====
-    os_categories_raw = db.query(
-        KisaItem.category,
-        func.count(ScanHistory.scan_id).label("count")
-    ).join(
-        ScanHistory, KisaItem.item_code == ScanHistory.item_code
-    ).join(
-        Server, ScanHistory.server_id == Server.server_id
-    ).filter(
-        Server.company == company,
-        Server.is_active == True,
-        ScanHistory.status == "취약",
-        KisaItem.item_code.like("U-%"),
-        KisaItem.category != "unknown"
-    ).group_by(
-        KisaItem.category
-    ).all()
-
     os_categories = {
         "account": 0,
         "directory": 0,
@@ -97,28 +112,11 @@ async def get_dashboard_data(
         "patch": 0,
         "log": 0
     }
-    for cat in os_categories_raw:
-        if cat.category in os_categories:
-            os_categories[cat.category] = cat.count
+    for category, count in category_vulns["U"].items():
+        if category in os_categories:
+            os_categories[category] = count
 
     # ===== 3. DB 보안 카테고리 =====
-    db_categories_raw = db.query(
-        KisaItem.category,
-        func.count(ScanHistory.scan_id).label("count")
-    ).join(
-        ScanHistory, KisaItem.item_code == ScanHistory.item_code
-    ).join(
-        Server, ScanHistory.server_id == Server.server_id
-    ).filter(
-        Server.company == company,
-        Server.is_active == True,
-        ScanHistory.status == "취약",
-        KisaItem.item_code.like("D-%"),
-        KisaItem.category != "unknown"
-    ).group_by(
-        KisaItem.category
-    ).all()
-
     # 카테고리 매핑 (한글/영문 모두 지원)
     category_mapping = {
         "계정관리": "account", "account": "account",
@@ -133,86 +131,38 @@ async def get_dashboard_data(
         "patch": 0,
         "option": 0
     }
-    for cat in db_categories_raw:
-        eng_cat = category_mapping.get(cat.category)
+    for category, count in category_vulns["D"].items():
+        eng_cat = category_mapping.get(category)
         if eng_cat and eng_cat in db_categories:
-            db_categories[eng_cat] = cat.count
+            db_categories[eng_cat] += count
 
     # ===== 4. 미해결 취약점 =====
-    unresolved_count = db.query(func.count(ScanHistory.scan_id)).join(
-        Server, ScanHistory.server_id == Server.server_id
-    ).join(
-        KisaItem, ScanHistory.item_code == KisaItem.item_code
-    ).filter(
-        Server.company == company,
-        Server.is_active == True,
-        ScanHistory.status == "취약",
-        KisaItem.category != "unknown"
-    ).scalar() or 0
+    unresolved_count = totals["vulnerable"]
+
+    # ===== 5~6. OS / DB 보안 취약 서버 TOP 5 =====
+    def top_servers(item_prefix):
+        ranked = sorted(
+            ((count, sid) for sid, count in server_vulns[item_prefix].items() if count > 0),
+            key=lambda x: (-x[0], x[1])
+        )[:5]
+        return [
+            {
+                "rank": idx + 1,
+                "server_id": sid,
+                "hostname": servers[sid].hostname,
+                "ip_address": servers[sid].ip_address,
+                "vuln_count": count
+            }
+            for idx, (count, sid) in enumerate(ranked)
+        ]
 
-    # ===== 5. OS 보안 취약 서버 TOP 5 =====
-    os_top_servers = db.query(
-        Server.server_id,
-        Server.hostname,
-        Server.ip_address,
-        func.count(ScanHistory.scan_id).label("vuln_count")
-    ).join(
-        ScanHistory, Server.server_id == ScanHistory.server_id
-    ).join(
-        KisaItem, ScanHistory.item_code == KisaItem.item_code
-    ).filter(
-        Server.company == company,
-        Server.is_active == True,
-        ScanHistory.status == "취약",
-        KisaItem.item_code.like("U-%"),
-        KisaItem.category != "unknown"
-    ).group_by(
-        Server.server_id, Server.hostname, Server.ip_address
-    ).order_by(
-        func.count(ScanHistory.scan_id).desc()
-    ).limit(5).all()
-
-    # ===== 6. DB 보안 취약 서버 TOP 5 =====
-    db_top_servers = db.query(
-        Server.server_id,
-        Server.hostname,
-        Server.ip_address,
-        func.count(ScanHistory.scan_id).label("vuln_count")
-    ).join(
-        ScanHistory, Server.server_id == ScanHistory.server_id
-    ).join(
-        KisaItem, ScanHistory.item_code == KisaItem.item_code
-    ).filter(
-        Server.company == company,
-        Server.is_active == True,
-        ScanHistory.status == "취약",
-        KisaItem.item_code.like("D-%"),
-        KisaItem.category != "unknown"
-    ).group_by(
-        Server.server_id, Server.hostname, Server.ip_address
-    ).order_by(
-        func.count(ScanHistory.scan_id).desc()
-    ).limit(5).all()
+    os_top_servers = top_servers("U")
+    db_top_servers = top_servers("D")
 
     # ===== 7. 리스크 분포 (저/중/고) =====
-    risk_dist_raw = db.query(
-        func.sum(case((KisaItem.severity == "상", 1), else_=0)).label("high"),
-        func.sum(case((KisaItem.severity == "중", 1), else_=0)).label("medium"),
-        func.sum(case((KisaItem.severity == "하", 1), else_=0)).label("low")
-    ).join(
-        ScanHistory, KisaItem.item_code == ScanHistory.item_code
-    ).join(
-        Server, ScanHistory.server_id == Server.server_id
-    ).filter(
-        Server.company == company,
-        Server.is_active == True,
-        ScanHistory.status == "취약",
-        KisaItem.category != "unknown"
-    ).first()
-
-    high_count = int(risk_dist_raw.high or 0)
-    medium_count = int(risk_dist_raw.medium or 0)
-    low_count = int(risk_dist_raw.low or 0)
+    high_count = totals["high"]
+    medium_count = totals["medium"]
+    low_count = totals["low"]
     total_risk = high_count + medium_count + low_count
 
     if total_risk > 0:
@@ -233,21 +183,8 @@ async def get_dashboard_data(
         }
 
     # ===== 8. 양호/위험 비율 =====
-    vuln_stats = db.query(
-        func.sum(case((ScanHistory.status == "취약", 1), else_=0)).label("vulnerable"),
-        func.sum(case((ScanHistory.status == "양호", 1), else_=0)).label("secure")
-    ).join(
-        Server, ScanHistory.server_id == Server.server_id
-    ).join(
-        KisaItem, ScanHistory.item_code == KisaItem.item_code
-    ).filter(
-        Server.company == company,
-        Server.is_active == True,
-        KisaItem.category != "unknown"
-    ).first()
-
-    vulnerable_count = int(vuln_stats.vulnerable or 0)
-    secure_count = int(vuln_stats.secure or 0)
+    vulnerable_count = totals["vulnerable"]
+    secure_count = totals["secure"]
     total_checks = vulnerable_count + secure_count
 
     if total_checks > 0:
@@ -266,7 +203,7 @@ async def get_dashboard_data(
         }
 
     # ===== 응답 =====
-    return {
+    return encode_json({
         "summary": {
             "company": company,
             "last_scan_date": last_scan.strftime("%Y-%m-%d %H:%M:%S") if last_scan else "N/A",
@@ -277,26 +214,8 @@ async def get_dashboard_data(
         "os_categories": os_categories,
         "db_categories": db_categories,
         "unresolved_count": unresolved_count,
-        "os_top_servers": [
-            {
-                "rank": idx + 1,
-                "server_id": s.server_id,
-                "hostname": s.hostname,
-                "ip_address": s.ip_address,
-                "vuln_count": s.vuln_count
-            }
-            for idx, s in enumerate(os_top_servers)
-        ],
-        "db_top_servers": [
-            {
-                "rank": idx + 1,
-                "server_id": s.server_id,
-                "hostname": s.hostname,
-                "ip_address": s.ip_address,
-                "vuln_count": s.vuln_count
-            }
-            for idx, s in enumerate(db_top_servers)
-        ],
+        "os_top_servers": os_top_servers,
+        "db_top_servers": db_top_servers,
         "risk_distribution": risk_distribution,
         "vulnerability_ratio": vulnerability_ratio
-    }
+    })
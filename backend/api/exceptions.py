@@ -8,13 +8,18 @@
 
 from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from db.session import get_db
 from db.models import User, Server, KisaItem, Exception as ExceptionModel
+from db.scores import refresh_scores_in_session
+from db.data_version import bump_data_version_in_session
 from core.deps import get_current_user, get_admin_user
+from core.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, parse_cursor_datetime, parse_date_param
+)
 
 
 router = APIRouter()
@@ -38,23 +43,43 @@ class ExceptionBulkCreate(BaseModel):
 
 # ── Endpoints ────────────────────────────────────────────────
 
+def _exception_item(e, now: datetime) -> dict:
+    return {
+        "exception_id": e.exception_id,
+        "server_id": e.server_id,
+        "hostname": e.hostname,
+        "ip_address": e.ip_address,
+        "item_code": e.item_code,
+        "item_title": e.item_title,
+        "severity": e.severity,
+        "reason": e.reason,
+        "valid_date": e.valid_date.strftime("%Y-%m-%d %H:%M"),
+        "is_active": e.valid_date > now,
+    }
+
+
 @router.get("")
-async def get_exceptions(
+def get_exceptions(
+    server_id: Optional[str] = None,
+    item_code: Optional[str] = None,
+    status: Optional[str] = Query(None, pattern="^(active|expired)$", description="active | expired"),
+    start: Optional[str] = Query(None, description="valid_date 하한"),
+    end: Optional[str] = Query(None, description="valid_date 상한"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    legacy: bool = Query(False, description="true면 이전 형식(total/active_count/expired_count + 전체 목록)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """예외 목록 조회 (회사별)"""
-    company = current_user.company
-
-    server_ids = [
-        s.server_id for s in
-        db.query(Server.server_id).filter(Server.company == company).all()
-    ]
+    """
+    예외 목록 조회 (회사별, valid_date 내림차순 keyset 페이지네이션)
 
-    if not server_ids:
-        return {"total": 0, "active_count": 0, "expired_count": 0, "items": []}
+    응답의 next_cursor를 cursor로 넘기면 다음 페이지 (null이면 마지막 페이지)
+    """
+    company = current_user.company
+    now = datetime.now()
 
-    exceptions = db.query(
+    query = db.query(
         ExceptionModel.exception_id,
         ExceptionModel.server_id,
         ExceptionModel.item_code,
@@ -69,46 +94,50 @@ async def get_exceptions(
     ).join(
         KisaItem, ExceptionModel.item_code == KisaItem.item_code
     ).filter(
-        ExceptionModel.server_id.in_(server_ids)
-    ).order_by(
-        ExceptionModel.valid_date.desc()
-    ).all()
+        Server.company == company
+    )
 
-    now = datetime.now()
-    items = []
-    active_count = 0
-    expired_count = 0
-
-    for e in exceptions:
-        is_active = e.valid_date > now
-        if is_active:
-            active_count += 1
-        else:
-            expired_count += 1
-
-        items.append({
-            "exception_id": e.exception_id,
-            "server_id": e.server_id,
-            "hostname": e.hostname,
-            "ip_address": e.ip_address,
-            "item_code": e.item_code,
-            "item_title": e.item_title,
-            "severity": e.severity,
-            "reason": e.reason,
-            "valid_date": e.valid_date.strftime("%Y-%m-%d %H:%M"),
-            "is_active": is_active,
-        })
+    if legacy:
+        exceptions = query.order_by(ExceptionModel.valid_date.desc()).all()
+        items = [_exception_item(e, now) for e in exceptions]
+        active_count = sum(1 for item in items if item["is_active"])
+        return {
+            "total": len(items),
+            "active_count": active_count,
+            "expired_count": len(items) - active_count,
+            "items": items,
+        }
+
+    if server_id:
+        query = query.filter(ExceptionModel.server_id == server_id)
+    if item_code:
+        query = query.filter(ExceptionModel.item_code == item_code)
+    if status == "active":
+        query = query.filter(ExceptionModel.valid_date > now)
+    elif status == "expired":
+        query = query.filter(ExceptionModel.valid_date <= now)
+    start_dt = parse_date_param(start)
+    end_dt = parse_date_param(end)
+    if start_dt:
+        query = query.filter(ExceptionModel.valid_date >= start_dt)
+    if end_dt:
+        query = query.filter(ExceptionModel.valid_date <= end_dt)
+
+    rows, next_cursor = paginate(
+        query,
+        [ExceptionModel.valid_date, ExceptionModel.exception_id],
+        cursor, limit, parsers=[parse_cursor_datetime, int]
+    )
 
     return {
-        "total": len(items),
-        "active_count": active_count,
-        "expired_count": expired_count,
-        "items": items,
+        "items": [_exception_item(e, now) for e in rows],
+        "next_cursor": next_cursor,
+        "limit": limit,
     }
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
-async def create_exception(
+def create_exception(
     request: ExceptionCreate,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -150,15 +179,20 @@ async def create_exception(
     db.add(new_exception)
     db.commit()
     db.refresh(new_exception)
+    exception_id = new_exception.exception_id
+
+    # 예외는 점수에 '양호'로 반영되므로 해당 서버 점수만 재계산
+    refresh_scores_in_session(db, [request.server_id])
+    bump_data_version_in_session(db, [current_user.company])
 
     return {
-        "exception_id": new_exception.exception_id,
+        "exception_id": exception_id,
         "message": "예외가 등록되었습니다"
     }
 
 
 @router.post("/bulk", status_code=status.HTTP_201_CREATED)
-async def create_bulk_exception(
+def create_bulk_exception(
     request: ExceptionBulkCreate,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -188,6 +222,7 @@ async def create_bulk_exception(
     now = datetime.now()
     created_count = 0
     skipped_count = 0
+    created_server_ids = []
 
     for server in servers:
         existing = db.query(ExceptionModel).filter(
@@ -207,9 +242,14 @@ async def create_bulk_exception(
         )
         db.add(new_exception)
         created_count += 1
+        created_server_ids.append(server.server_id)
 
     db.commit()
 
+    if created_server_ids:
+        refresh_scores_in_session(db, created_server_ids)
+        bump_data_version_in_session(db, [current_user.company])
+
     return {
         "created_count": created_count,
         "skipped_count": skipped_count,
@@ -219,7 +259,7 @@ async def create_bulk_exception(
 
 
 @router.delete("/{exception_id}")
-async def delete_exception(
+def delete_exception(
     exception_id: int,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -239,7 +279,11 @@ async def delete_exception(
     if not server:
         raise HTTPException(status_code=403, detail="권한이 없습니다")
 
+    server_id = exception.server_id
     db.delete(exception)
     db.commit()
 
+    refresh_scores_in_session(db, [server_id])
+    bump_data_version_in_session(db, [current_user.company])
+
     return {"message": "예외가 삭제되었습니다"}
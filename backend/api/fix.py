@@ -2,17 +2,21 @@
 자동조치 API
 """
 
+from functools import partial
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from core.deps import get_db, get_admin_user, get_current_user
+from core.job_client import JobAPIUnavailable
+from core.progress_stream import progress_event_response
 from db.models import User
 from services.fix_service import (
     start_fix, start_batch_fix,
     get_fix_progress, get_fix_result,
-    get_affected_servers,
+    get_affected_servers, preview_batch_fix,
 )
 
 
@@ -103,6 +107,33 @@ class AffectedServersResponse(BaseModel):
     total_fixable: int
 
 
+class FixPlanRun(BaseModel):
+    """실행 그룹 (ansible-playbook 1회, 대상 서버의 조치 항목이 모두 같음)"""
+    index: int
+    group: str
+    server_ids: List[str]
+    item_codes: List[str]
+    estimated_seconds: int
+
+
+class FixPlanSection(BaseModel):
+    """OS / DB 조치 실행 계획 (waves: 웨이브별 동시 실행 그룹 index)"""
+    runs: List[FixPlanRun]
+    waves: List[List[int]]
+    estimated_seconds: int
+
+
+class FixPlanResponse(BaseModel):
+    """일괄 조치 실행 계획 응답"""
+    server_ids: List[str]
+    total_items: int
+    os: FixPlanSection
+    db: FixPlanSection
+    total_runs: int
+    estimated_seconds: int
+    single_run_estimated_seconds: int
+
+
 # ── 엔드포인트 ──────────────────────────────────────
 
 @router.post("/execute", status_code=status.HTTP_202_ACCEPTED)
@@ -115,7 +146,7 @@ async def execute_fix(
     자동조치 실행 (단일 서버)
     """
     try:
-        job_id, total_items = start_fix(request.server_id, request.item_codes, db)
+        job_id, total_items = await start_fix(request.server_id, request.item_codes, db)
 
         return {
             "job_id": job_id,
@@ -129,6 +160,11 @@ async def execute_fix(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except JobAPIUnavailable as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except RuntimeError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -146,7 +182,7 @@ async def execute_batch_fix(
     일괄 자동조치 실행 (다중 서버)
     """
     try:
-        job_id, total_items = start_batch_fix(
+        job_id, total_items = await start_batch_fix(
             request.server_ids, request.item_codes, db
         )
 
@@ -162,6 +198,11 @@ async def execute_batch_fix(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except JobAPIUnavailable as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except RuntimeError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -169,8 +210,29 @@ async def execute_batch_fix(
         )
 
 
+@router.post("/plan", response_model=FixPlanResponse)
+def plan_batch_fix(
+    request: BatchFixExecuteRequest,
+    current_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    일괄 자동조치 실행 계획 조회 (작업을 시작하지 않음)
+
+    서버를 OS/DB 그룹과 취약 항목 집합이 같은 실행 그룹으로 묶고, 병렬 실행 웨이브와 예상 시간을 반환한다.
+    execute-batch는 같은 계획으로 실행된다.
+    """
+    try:
+        return FixPlanResponse(**preview_batch_fix(request.server_ids, request.item_codes, db))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.post("/affected-servers", response_model=AffectedServersResponse)
-async def get_affected_servers_endpoint(
+def get_affected_servers_endpoint(
     request: AffectedServersRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -180,14 +242,8 @@ async def get_affected_servers_endpoint(
     return AffectedServersResponse(**result)
 
 
-@router.get("/progress/{job_id}", response_model=FixProgressResponse)
-async def get_fix_progress_endpoint(
-    job_id: str,
-    current_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
-):
-    """조치 진행률 조회"""
-    progress_data = get_fix_progress(job_id)
+async def _fix_progress_response(job_id: str) -> FixProgressResponse:
+    progress_data = await get_fix_progress(job_id)
 
     return FixProgressResponse(
         job_id=job_id,
@@ -198,6 +254,34 @@ async def get_fix_progress_endpoint(
     )
 
 
+async def _fix_progress_payload(job_id: str) -> dict:
+    return (await _fix_progress_response(job_id)).model_dump()
+
+
+@router.get("/progress/{job_id}", response_model=FixProgressResponse)
+async def get_fix_progress_endpoint(
+    job_id: str,
+    current_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """조치 진행률 조회"""
+    return await _fix_progress_response(job_id)
+
+
+@router.get("/progress/{job_id}/stream")
+async def stream_fix_progress(
+    job_id: str,
+    current_user: User = Depends(get_admin_user)
+):
+    """
+    조치 진행률 SSE (text/event-stream)
+
+    상태가 바뀔 때마다 progress 이벤트(data: 진행률 조회 응답 JSON)를 보내고
+    completed / failed 이후 스트림을 닫는다. 같은 job의 구독자는 Job API 조회를 공유한다.
+    """
+    return progress_event_response(("fix", job_id), partial(_fix_progress_payload, job_id))
+
+
 @router.get("/result/{job_id}", response_model=FixResultResponse)
 async def get_fix_result_endpoint(
     job_id: str,
@@ -205,7 +289,7 @@ async def get_fix_result_endpoint(
     db: Session = Depends(get_db)
 ):
     """조치 결과 조회"""
-    result = get_fix_result(job_id, db)
+    result = await get_fix_result(job_id, db)
 
     if not result:
         raise HTTPException(
@@ -1,5 +1,8 @@
 """
 보고서 생성/다운로드 API
+
+- 데이터 조회(DB)는 스레드풀, 엑셀 생성(CPU 바운드)은 프로세스 풀에서 실행해
+  보고서 생성 중에도 이벤트 루프가 다른 요청을 처리할 수 있도록 한다.
 """
 
 import os
@@ -10,6 +13,7 @@ from urllib.parse import quote
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import FileResponse
 
+from core.concurrency import run_in_thread, run_in_process
 from core.deps import get_current_user
 from db.models import User
 from processors.generate_report import fetch_report_data, generate_report
@@ -29,7 +33,7 @@ async def generate_report_endpoint(
     - 점검 결과가 없으면 404 반환
     """
     try:
-        servers, kisa_items, kisa_map, results = fetch_report_data()
+        servers, kisa_items, kisa_map, results, scores = await run_in_thread(fetch_report_data)
     except RuntimeError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -50,7 +54,9 @@ async def generate_report_endpoint(
     output_path = os.path.join(tmp_dir, filename)
 
     try:
-        generate_report(servers, kisa_items, kisa_map, results, output_path, company_name)
+        await run_in_process(
+            generate_report, servers, kisa_items, kisa_map, results, scores, output_path, company_name
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
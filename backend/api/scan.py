@@ -2,10 +2,13 @@
 전수 점검 API
 """
 
+from functools import partial
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from core.deps import get_db, get_admin_user
+from core.progress_stream import progress_event_response
 from db.models import User
 from schemas.scan import (
     FullScanRequest,
@@ -23,7 +26,7 @@ router = APIRouter()
 
 
 @router.post("/full", status_code=status.HTTP_202_ACCEPTED)
-async def start_full_scan_endpoint(
+def start_full_scan_endpoint(
     request: FullScanRequest,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -61,8 +64,30 @@ async def start_full_scan_endpoint(
         )
 
 
+def _scan_progress_response(job_id: str) -> ScanProgressResponse:
+    progress_data = get_scan_progress(job_id)
+
+    total_servers = progress_data.get("total_servers", 1)
+    completed_servers = int(progress_data["progress"] / 100 * total_servers)
+
+    return ScanProgressResponse(
+        job_id=job_id,
+        status=progress_data["status"],
+        progress=progress_data["progress"],
+        current_step=progress_data["current_step"],
+        current_server=None,
+        completed_servers=completed_servers,
+        total_servers=total_servers,
+        message=progress_data["message"]
+    )
+
+
+def _scan_progress_payload(job_id: str) -> dict:
+    return _scan_progress_response(job_id).model_dump()
+
+
 @router.get("/progress/{job_id}", response_model=ScanProgressResponse)
-async def get_scan_progress_endpoint(
+def get_scan_progress_endpoint(
     job_id: str,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -78,25 +103,25 @@ async def get_scan_progress_endpoint(
     Returns:
         진행 상황 정보
     """
-    progress_data = get_scan_progress(job_id)
+    return _scan_progress_response(job_id)
 
-    total_servers = progress_data.get("total_servers", 1)
-    completed_servers = int(progress_data["progress"] / 100 * total_servers)
 
-    return ScanProgressResponse(
-        job_id=job_id,
-        status=progress_data["status"],
-        progress=progress_data["progress"],
-        current_step=progress_data["current_step"],
-        current_server=None,
-        completed_servers=completed_servers,
-        total_servers=total_servers,
-        message=progress_data["message"]
-    )
+@router.get("/progress/{job_id}/stream")
+async def stream_scan_progress(
+    job_id: str,
+    current_user: User = Depends(get_admin_user)
+):
+    """
+    점검 진행률 SSE (text/event-stream)
+
+    상태가 바뀔 때마다 progress 이벤트(data: 진행률 조회 응답 JSON)를 보내고
+    completed / failed 이후 스트림을 닫는다. 같은 job의 구독자는 Job API 조회를 공유한다.
+    """
+    return progress_event_response(("scan", job_id), partial(_scan_progress_payload, job_id))
 
 
 @router.get("/result/{job_id}", response_model=ScanResultResponse)
-async def get_scan_result_endpoint(
+def get_scan_result_endpoint(
     job_id: str,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -27,6 +27,9 @@ SCAN_OUTPUT_DIR = os.getenv('SCAN_OUTPUT_DIR', '/tmp/audit/check')
 # 조치 결과 JSON 저장 경로
 FIX_OUTPUT_DIR = os.getenv('FIX_OUTPUT_DIR', '/tmp/audit/fix')
 
+# 점검 결과 일괄 UPSERT 배치 크기 (multi-row INSERT 1회당 행 수)
+SCAN_INSERT_BATCH_SIZE = int(os.getenv('SCAN_INSERT_BATCH_SIZE', 500))
+
 # Ansible 경로 설정
 ANSIBLE_ROOT = PROJECT_ROOT / 'ansible'
 ANSIBLE_INVENTORY = ANSIBLE_ROOT / 'inventories' / 'hosts.ini'
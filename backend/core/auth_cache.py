@@ -0,0 +1,142 @@
+"""
+인증 캐시 (get_current_user 빠른 경로)
+
+- 검증된 토큰: sha256(token) → JWT payload. payload의 exp까지만 유지 (jose 디코딩 생략)
+- 사용자 행: user_id → users 컬럼 값. AUTH_USER_CACHE_TTL초 동안 DB 조회 생략
+- 두 캐시 모두 AUTH_CACHE_MAX_ENTRIES 개수 제한 (LRU)
+
+무효화:
+- 비밀번호/권한 변경 시 invalidate_user()를 호출한다. 로컬 캐시를 비우고 스탬프 파일
+  (AUTH_CACHE_STAMP_FILE)을 갱신해 다른 uvicorn 워커와 scripts/manage_users.py 변경분도
+  반영되도록 한다. 조회 시에는 스탬프 파일 mtime만 확인한다. (DB 조회 없음)
+- 스탬프가 바뀌면 모든 워커가 사용자 캐시 전체를 비우므로, 로그인(last_login 갱신)처럼
+  권한과 무관한 변경은 forget_user()로 해당 워커의 항목만 지운다.
+
+`def` 엔드포인트가 스레드풀에서 동시에 호출하므로 모든 접근은 잠금으로 보호한다.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from core.config import AUTH_CACHE_MAX_ENTRIES, AUTH_USER_CACHE_TTL, AUTH_CACHE_STAMP_FILE
+
+
+class _TTLCache:
+    """만료 시각(epoch초)을 항목별로 갖는 LRU 캐시"""
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._items: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= now:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at: float) -> None:
+        if self._max_entries <= 0 or expires_at <= time.time():
+            return
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_entries:
+                self._items.popitem(last=False)
+
+    def pop(self, key) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_tokens = _TTLCache(AUTH_CACHE_MAX_ENTRIES)
+_users = _TTLCache(AUTH_CACHE_MAX_ENTRIES)
+_stamp_lock = threading.Lock()
+_stamp_seen: Optional[int] = None
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _read_stamp() -> Optional[int]:
+    try:
+        return os.stat(AUTH_CACHE_STAMP_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _sync_stamp() -> None:
+    """다른 프로세스가 스탬프를 갱신했으면 사용자 캐시를 비운다."""
+    global _stamp_seen
+    stamp = _read_stamp()
+    with _stamp_lock:
+        if stamp != _stamp_seen:
+            _stamp_seen = stamp
+            _users.clear()
+
+
+def get_token_payload(token: str) -> Optional[Dict[str, Any]]:
+    """캐시된 검증 토큰 payload (없거나 만료되면 None)"""
+    return _tokens.get(_token_key(token))
+
+
+def cache_token_payload(token: str, payload: Dict[str, Any]) -> None:
+    """검증된 토큰 payload 저장 (exp까지 유지, exp가 없으면 저장하지 않음)"""
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _tokens.set(_token_key(token), payload, float(exp))
+
+
+def get_user(user_id: int) -> Optional[Dict[str, Any]]:
+    """캐시된 사용자 컬럼 값 (없으면 None)"""
+    _sync_stamp()
+    return _users.get(user_id)
+
+
+def cache_user(user_id: int, values: Dict[str, Any]) -> None:
+    """사용자 컬럼 값 저장"""
+    _users.set(user_id, values, time.time() + AUTH_USER_CACHE_TTL)
+
+
+def forget_user(user_id: int) -> None:
+    """
+    이 프로세스의 사용자 캐시에서만 제거 (로그인 시 last_login 갱신 등 권한과 무관한 변경)
+
+    스탬프를 갱신하지 않으므로 다른 워커의 캐시는 유지되고 TTL 이후 반영된다.
+    """
+    _users.pop(user_id)
+
+
+def invalidate_user(user_id: Optional[int] = None) -> None:
+    """
+    사용자 캐시 무효화 (비밀번호/권한 변경 후 호출)
+
+    user_id가 None이면 전체를 비운다. 스탬프 파일도 갱신해 다른 워커에 전파한다.
+    """
+    if user_id is None:
+        _users.clear()
+    else:
+        _users.pop(user_id)
+    try:
+        os.makedirs(os.path.dirname(AUTH_CACHE_STAMP_FILE), exist_ok=True)
+        with open(AUTH_CACHE_STAMP_FILE, "a"):
+            pass
+        os.utime(AUTH_CACHE_STAMP_FILE, None)
+    except OSError as e:
+        print(f"[WARN] 인증 캐시 스탬프 갱신 실패: {e}")
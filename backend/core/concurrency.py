@@ -0,0 +1,120 @@
+"""
+블로킹 작업 오프로드 정책
+
+이벤트 루프(uvicorn)에서는 블로킹 호출을 직접 실행하지 않는다.
+- 동기 SQLAlchemy 세션, 소켓/SSH 프로브를 쓰는 엔드포인트는
+  `def`로 선언한다. → FastAPI가 스레드풀에서 실행 (api/auth.py와 동일)
+- Job API 호출은 비동기 클라이언트(core/job_client.py)를 쓰므로 해당 엔드포인트는 `async def`이고,
+  그 안의 DB 조회만 run_in_thread()로 넘긴다. (services/fix_service.py)
+- `async def` 엔드포인트 안에서 블로킹 I/O가 필요하면 run_in_thread()로 넘긴다.
+- 엑셀 생성처럼 GIL을 오래 잡는 CPU 바운드 작업은 run_in_process()로 넘긴다.
+  (인자/반환값은 pickle 가능한 값이어야 한다)
+- 비밀번호 해싱/검증(PBKDF2)은 전용 password_pool에서 실행한다. 대기열이 가득 차면
+  PoolBusyError로 즉시 거절해 로그인 폭주가 다른 엔드포인트를 굶기지 않도록 한다.
+"""
+
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Optional
+
+import anyio.to_thread
+from fastapi.concurrency import run_in_threadpool
+
+from core.config import (
+    API_THREADPOOL_SIZE, API_PROCESS_POOL_SIZE,
+    AUTH_HASH_WORKERS, AUTH_HASH_MAX_PENDING, AUTH_PER_USER_CONCURRENCY,
+)
+
+
+class PoolBusyError(RuntimeError):
+    """프로세스 풀 대기열이 가득 참 (호출 측에서 503으로 응답)"""
+
+
+class ConcurrencyLimitError(RuntimeError):
+    """키(사용자명 등)별 동시 실행 한도 초과 (호출 측에서 429로 응답)"""
+
+
+class BoundedProcessPool:
+    """
+    대기열 길이가 제한된 프로세스 풀
+
+    실행 중 + 대기 중 작업이 max_workers + max_pending에 도달하면 제출하지 않고
+    PoolBusyError를 던진다. (max_pending=None이면 제한 없음)
+    카운터는 이벤트 루프 스레드에서만 변경되므로 잠금이 필요 없다.
+    """
+
+    def __init__(self, max_workers: int, max_pending: Optional[int] = None):
+        self._max_workers = max_workers
+        self._limit = None if max_pending is None else max_workers + max_pending
+        self._inflight = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def run(self, func, *args, **kwargs):
+        if self._limit is not None and self._inflight >= self._limit:
+            raise PoolBusyError("처리 대기 중인 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.")
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+
+        self._inflight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+        finally:
+            self._inflight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class KeyedConcurrencyLimit:
+    """키별 동시 실행 개수 제한 (이벤트 루프 전용)"""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._counts: dict = defaultdict(int)
+
+    @asynccontextmanager
+    async def acquire(self, key):
+        if self._counts[key] >= self._limit:
+            raise ConcurrencyLimitError("동일 계정의 요청이 처리 중입니다. 잠시 후 다시 시도해주세요.")
+        self._counts[key] += 1
+        try:
+            yield
+        finally:
+            self._counts[key] -= 1
+            if self._counts[key] <= 0:
+                del self._counts[key]
+
+
+# 보고서 생성 등 일반 CPU 바운드 작업
+_process_pool = BoundedProcessPool(API_PROCESS_POOL_SIZE)
+
+# PBKDF2 해싱/검증 전용 (core/security.py)
+password_pool = BoundedProcessPool(AUTH_HASH_WORKERS, AUTH_HASH_MAX_PENDING)
+password_user_limit = KeyedConcurrencyLimit(AUTH_PER_USER_CONCURRENCY)
+
+
+def configure_threadpool() -> None:
+    """`def` 엔드포인트/의존성이 공유하는 AnyIO 스레드풀 크기 설정 (앱 시작 시 1회)"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """블로킹 I/O 함수를 스레드풀에서 실행"""
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+async def run_in_process(func, *args, **kwargs):
+    """CPU 바운드 함수를 프로세스 풀에서 실행 (func는 모듈 최상위 함수여야 함)"""
+    return await _process_pool.run(func, *args, **kwargs)
+
+
+def shutdown_process_pool() -> None:
+    """앱 종료 시 프로세스 풀 정리"""
+    _process_pool.shutdown()
+    password_pool.shutdown()
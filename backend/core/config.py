@@ -33,3 +33,49 @@ CORS_ORIGINS = os.getenv(
 
 # Fernet 암호화 키 (서버 패스워드 암호화용)
 FERNET_KEY = os.getenv("FERNET_KEY")
+
+# 블로킹 작업 오프로드 (core/concurrency.py)
+# 스레드풀 크기는 SQLAlchemy 커넥션 풀(pool_size + max_overflow)과 맞춘다.
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "30"))
+API_PROCESS_POOL_SIZE = int(os.getenv("API_PROCESS_POOL_SIZE", "2"))
+
+# 조회 API ETag 데이터 버전 캐시 (core/etag.py)
+# 같은 호스트의 변경은 스탬프 파일로 바로 반영하고, 다른 호스트(파이프라인/API 워커)의 변경은
+# 이 시간(초) 안에 DB(data_versions)를 다시 읽어 반영한다. 0이면 요청마다 DB 조회
+DATA_VERSION_CACHE_TTL = float(os.getenv("DATA_VERSION_CACHE_TTL", "2"))
+
+# 인증 캐시 (core/auth_cache.py)
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "1024"))
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "300"))  # 5분
+# scripts/manage_users.py도 같은 경로를 갱신한다 (다른 프로세스의 사용자 캐시 무효화)
+AUTH_CACHE_STAMP_FILE = os.getenv("AUTH_CACHE_STAMP_FILE", "/tmp/audit/auth_cache.stamp")
+
+# 비밀번호 해싱/검증 전용 프로세스 풀 (core/concurrency.password_pool)
+AUTH_HASH_WORKERS = int(os.getenv("AUTH_HASH_WORKERS", "2"))
+AUTH_HASH_MAX_PENDING = int(os.getenv("AUTH_HASH_MAX_PENDING", "16"))   # 초과 시 503
+AUTH_PER_USER_CONCURRENCY = int(os.getenv("AUTH_PER_USER_CONCURRENCY", "1"))  # 초과 시 429
+
+# 응답 압축 (core/middleware.CompressionMiddleware)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # bytes, 미만이면 압축하지 않음
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+# 작업 진행률 SSE (core/progress_stream.py)
+JOB_PROGRESS_POLL_INTERVAL = float(os.getenv("JOB_PROGRESS_POLL_INTERVAL", "1.0"))  # 작업당 Job API 조회 간격(초)
+SSE_KEEPALIVE_INTERVAL = float(os.getenv("SSE_KEEPALIVE_INTERVAL", "15"))
+
+# Job API(:8001) 클라이언트 (core/job_client.py)
+JOB_API_URL = os.getenv("JOB_API_URL", "http://localhost:8001")
+JOB_API_TIMEOUT = float(os.getenv("JOB_API_TIMEOUT", "5"))
+JOB_API_CONNECT_TIMEOUT = float(os.getenv("JOB_API_CONNECT_TIMEOUT", "2"))
+JOB_API_MAX_CONNECTIONS = int(os.getenv("JOB_API_MAX_CONNECTIONS", "20"))
+JOB_API_RETRIES = int(os.getenv("JOB_API_RETRIES", "2"))              # 최초 요청 제외 재시도 횟수
+JOB_API_RETRY_BACKOFF = float(os.getenv("JOB_API_RETRY_BACKOFF", "0.2"))  # 백오프 기준(초), full jitter
+JOB_API_BREAKER_THRESHOLD = int(os.getenv("JOB_API_BREAKER_THRESHOLD", "5"))  # 연속 실패 시 open
+JOB_API_BREAKER_COOLDOWN = float(os.getenv("JOB_API_BREAKER_COOLDOWN", "30"))  # open 유지(초)
+
+# 일괄 조치 실행 계획 (services/fix_service.plan_fix_runs → run.sh가 실행 그룹별로 병렬 실행)
+FIX_MAX_PARALLEL_RUNS = int(os.getenv("FIX_MAX_PARALLEL_RUNS", "4"))        # 웨이브당 동시 ansible-playbook 수
+FIX_ANSIBLE_FORKS = int(os.getenv("ANSIBLE_FORKS", "5"))                    # 실행당 동시 호스트 수 (Ansible 기본값)
+FIX_ITEM_EST_SECONDS = float(os.getenv("FIX_ITEM_EST_SECONDS", "15"))       # 항목당 예상 조치 시간(초)
+FIX_RUN_OVERHEAD_SECONDS = float(os.getenv("FIX_RUN_OVERHEAD_SECONDS", "30"))  # 실행당 준비 시간(초, 번들 복사 등)
@@ -1,7 +1,7 @@
 """
 FastAPI 의존성 주입 함수
 - DB 세션 제공
-- 인증 사용자 추출
+- 인증 사용자 추출 (검증 토큰/사용자 캐시 → core/auth_cache.py)
 - 권한 확인
 """
 
@@ -13,11 +13,15 @@ from sqlalchemy.orm import Session
 from db.session import get_db
 from db.models import User
 from core.security import decode_access_token
+from core import auth_cache
 
 
 # HTTP Bearer 토큰 인증
 security = HTTPBearer()
 
+# 사용자 캐시에 넣지 않는 컬럼 (비밀번호 해시는 프로세스 메모리에 오래 남기지 않음)
+_UNCACHED_USER_COLUMNS = ("user_passwd", "prev_user_passwd")
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -26,6 +30,10 @@ def get_current_user(
     """
     JWT 토큰에서 현재 사용자 추출
 
+    캐시 적중 시 JWT 디코딩과 users 조회를 모두 생략한다.
+    이때 반환되는 User는 세션에 연결되지 않은 객체이고 비밀번호 해시가 없으므로,
+    수정이나 비밀번호 검증이 필요하면 호출 측에서 db로 다시 조회해야 한다. (api/auth.change_password 참고)
+
     Args:
         credentials: Bearer 토큰
         db: 데이터베이스 세션
@@ -37,14 +45,17 @@ def get_current_user(
         HTTPException: 토큰이 유효하지 않거나 사용자를 찾을 수 없는 경우
     """
     token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = auth_cache.get_token_payload(token)
 
     if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="로그인 세션이 만료되었습니다. 다시 로그인해주세요.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        payload = decode_access_token(token)
+        if payload is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="로그인 세션이 만료되었습니다. 다시 로그인해주세요.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        auth_cache.cache_token_payload(token, payload)
 
     user_id_str: Optional[str] = payload.get("sub")
     if user_id_str is None:
@@ -63,6 +74,10 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cached = auth_cache.get_user(user_id)
+    if cached is not None:
+        return User(**cached)
+
     user = db.query(User).filter(User.user_id == user_id).first()
     if user is None:
         raise HTTPException(
@@ -71,6 +86,9 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    auth_cache.cache_user(user_id, {
+        c.key: getattr(user, c.key) for c in User.__table__.columns if c.key not in _UNCACHED_USER_COLUMNS
+    })
     return user
 
 
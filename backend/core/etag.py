@@ -0,0 +1,154 @@
+"""
+조회 API ETag / If-None-Match (회사별 data_versions 기준)
+
+- ETag = W/"<회사 해시>-<version>". 같은 회사의 데이터가 바뀌지 않았으면 모든 조회 URL이
+  같은 버전을 쓰므로, 클라이언트 캐시가 최신이면 304로 응답한다.
+- 버전은 프로세스 메모리에 DATA_VERSION_CACHE_TTL초 동안 캐시한다.
+  - 같은 호스트에서 파이프라인/API가 버전을 올리면 스탬프 파일
+    (db/data_version.DATA_VERSION_STAMP_FILE)의 mtime이 바뀌므로 바로 DB에서 다시 읽는다.
+  - 스탬프는 로컬 파일이라 다른 호스트의 변경은 알 수 없다. 그 경우는 TTL이 지나면
+    data_versions를 다시 읽으므로 최대 TTL초 동안만 이전 ETag(304)가 유지된다.
+  → 인증 캐시(core/auth_cache.py)와 함께 쓰면 TTL 안의 304 응답은 DB를 전혀 조회하지 않는다.
+
+- 예외 만료는 시간이 지나서 일어나므로 버전을 올리지 않는다. 현재 시각 기준으로 활성 예외를
+  반영하는 응답은 다음 예외 만료 시각을 ETag에 포함한다.
+  (서버별: server_exception_etag, 회사 전체: company_exception_etag)
+
+Usage:
+    @router.get("/data", dependencies=[Depends(data_version_etag)])
+    @router.get("/servers/{server_id}/results", dependencies=[Depends(server_exception_etag)])
+    @router.get("/servers", dependencies=[Depends(company_exception_etag)])
+"""
+
+import hashlib
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from core.config import DATA_VERSION_CACHE_TTL
+from core.deps import get_db, get_current_user
+from db.data_version import read_stamp
+from db.models import User, DataVersion, Server, Exception as ExceptionModel
+
+
+_lock = threading.Lock()
+_versions: dict[str, tuple[int, float]] = {}  # company → (version, 만료 시각 monotonic)
+_stamp_seen: Optional[int] = None
+
+
+def get_data_version(company: str, db: Session) -> int:
+    """회사 데이터 버전 (스탬프가 바뀌지 않았고 TTL 안이면 캐시 값)"""
+    global _stamp_seen
+    stamp = read_stamp()
+    now = time.monotonic()
+    with _lock:
+        if stamp != _stamp_seen:
+            _stamp_seen = stamp
+            _versions.clear()
+        cached = _versions.get(company)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    version = db.query(DataVersion.version).filter(DataVersion.company == company).scalar() or 0
+    with _lock:
+        # 조회 중 스탬프가 바뀌었으면 저장하지 않는다 (다음 요청에서 다시 조회)
+        if stamp == _stamp_seen and DATA_VERSION_CACHE_TTL > 0:
+            _versions[company] = (version, now + DATA_VERSION_CACHE_TTL)
+    return version
+
+
+def make_etag(company: str, version: int, suffix: str = "") -> str:
+    company_key = hashlib.sha256(company.encode("utf-8")).hexdigest()[:12]
+    return f'W/"{company_key}-{version}{suffix}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def _check_etag(request: Request, response: Response, etag: str) -> None:
+    """If-None-Match가 etag와 같으면 304, 아니면 응답에 ETag / Cache-Control 헤더 설정"""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+
+
+def data_version_etag(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> None:
+    """
+    조회 엔드포인트용 의존성
+
+    If-None-Match가 현재 ETag와 같으면 304를 던지고(엔드포인트 본문 미실행),
+    아니면 응답에 ETag / Cache-Control 헤더를 붙인다.
+    """
+    _check_etag(request, response, make_etag(current_user.company, get_data_version(current_user.company, db)))
+
+
+def server_exception_etag(
+    server_id: str,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> None:
+    """
+    활성 예외를 현재 시각 기준으로 반영하는 서버별 조회 엔드포인트용 의존성
+
+    data_version_etag와 같고, ETag에 서버의 다음 예외 만료 시각을 더한다. 그 시각이 지나면
+    ETag가 바뀌므로 만료된 예외가 이전 응답(304)으로 계속 보이지 않는다.
+    (요청마다 (server_id, item_code, valid_date) 인덱스 범위 조회 1회)
+    """
+    next_expiry = db.query(func.min(ExceptionModel.valid_date)).filter(
+        ExceptionModel.server_id == server_id,
+        ExceptionModel.valid_date > datetime.now()
+    ).scalar()
+    version = get_data_version(current_user.company, db)
+    _check_etag(request, response, make_etag(current_user.company, version, _expiry_suffix(next_expiry)))
+
+
+def company_exception_etag(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> None:
+    """
+    회사 전체 서버의 활성 예외를 현재 시각 기준으로 반영하는 조회 엔드포인트용 의존성
+
+    server_exception_etag와 같고, 회사 서버 중 가장 먼저 만료되는 예외 시각을 ETag에 더한다.
+    (요청마다 (valid_date, server_id, item_code) 인덱스 범위 조회 1회)
+    """
+    next_expiry = db.query(func.min(ExceptionModel.valid_date)).join(
+        Server, ExceptionModel.server_id == Server.server_id
+    ).filter(
+        Server.company == current_user.company,
+        ExceptionModel.valid_date > datetime.now()
+    ).scalar()
+    version = get_data_version(current_user.company, db)
+    _check_etag(request, response, make_etag(current_user.company, version, _expiry_suffix(next_expiry)))
+
+
+def _expiry_suffix(next_expiry: Optional[datetime]) -> str:
+    return f"-x{int(next_expiry.timestamp())}" if next_expiry else ""
@@ -0,0 +1,152 @@
+"""
+Job API(:8001) 비동기 HTTP 클라이언트
+
+- 프로세스당 httpx.AsyncClient 하나를 공유한다. (keep-alive 커넥션 풀, 요청마다 TCP 연결 생성 안 함)
+- 타임아웃: 연결 JOB_API_CONNECT_TIMEOUT초, 전체 JOB_API_TIMEOUT초
+- 재시도: 지수 백오프 + full jitter로 최대 JOB_API_RETRIES회.
+  GET은 연결/타임아웃/5xx 오류 시 재시도하고, POST(작업 생성)는 요청이 전달되지 않은
+  연결 실패일 때만 재시도한다. (중복 조치 작업 방지)
+- 서킷 브레이커: 연속 JOB_API_BREAKER_THRESHOLD회 실패하면 JOB_API_BREAKER_COOLDOWN초 동안
+  호출하지 않고 JobAPIUnavailable을 던진다. 쿨다운 후 요청 1건으로 복구 여부를 확인한다.
+
+클라이언트와 브레이커 상태는 이벤트 루프 스레드에서만 사용한다. (`async def` 엔드포인트 / ProgressHub)
+
+Usage:
+    job_id = await job_api.create_job("fix")
+    job = await job_api.get_job(job_id)          # → Job API 응답 dict
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from core.config import (
+    JOB_API_URL, JOB_API_TIMEOUT, JOB_API_CONNECT_TIMEOUT, JOB_API_MAX_CONNECTIONS,
+    JOB_API_RETRIES, JOB_API_RETRY_BACKOFF, JOB_API_BREAKER_THRESHOLD, JOB_API_BREAKER_COOLDOWN,
+)
+
+
+class JobAPIError(RuntimeError):
+    """Job API 호출 실패 (재시도 후에도 실패)"""
+
+
+class JobAPIUnavailable(JobAPIError):
+    """서킷 브레이커 open 상태 (호출 측에서 503으로 응답)"""
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커 (closed → open → half-open)"""
+
+    def __init__(self, threshold: int, cooldown: float):
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+
+    def before_call(self) -> None:
+        if self._opened_at is None:
+            return
+        now = time.monotonic()
+        remaining = self._opened_at + self._cooldown - now
+        # half-open: 쿨다운이 지나면 한 건만 통과시켜 복구 여부 확인 (확인 요청이 끝나지 않으면 쿨다운 후 다시 허용)
+        probing = self._probe_started is not None and now - self._probe_started < self._cooldown
+        if remaining > 0 or probing:
+            raise JobAPIUnavailable(
+                f"Job API 연결이 일시 중단되었습니다. {max(int(remaining), 1)}초 후 다시 시도해주세요."
+            )
+        self._probe_started = now
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_started = None
+        if self._opened_at is not None or self._failures >= self._threshold:
+            self._opened_at = time.monotonic()
+            print(f"[WARN] Job API 서킷 브레이커 open ({self._failures}회 연속 실패, {self._cooldown}초)")
+
+
+def _backoff(attempt: int) -> float:
+    """full jitter: 0 ~ base * 2^attempt"""
+    return random.uniform(0, JOB_API_RETRY_BACKOFF * (2 ** attempt))
+
+
+class JobAPIClient:
+    """커넥션 풀 / 재시도 / 서킷 브레이커를 갖는 Job API 클라이언트"""
+
+    def __init__(self, base_url: str):
+        self._base_url = base_url
+        self._client: Optional[httpx.AsyncClient] = None
+        self._breaker = CircuitBreaker(JOB_API_BREAKER_THRESHOLD, JOB_API_BREAKER_COOLDOWN)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=httpx.Timeout(JOB_API_TIMEOUT, connect=JOB_API_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=JOB_API_MAX_CONNECTIONS,
+                    max_keepalive_connections=JOB_API_MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def _request(self, method: str, path: str) -> Dict[str, Any]:
+        self._breaker.before_call()
+        client = self._get_client()
+        # POST는 요청이 서버에 전달되지 않은 경우만 재시도
+        retry_on = (httpx.ConnectError, httpx.ConnectTimeout) if method == "POST" else (httpx.TransportError,)
+
+        for attempt in range(JOB_API_RETRIES + 1):
+            last = attempt == JOB_API_RETRIES
+            try:
+                response = await client.request(method, path)
+            except retry_on as e:
+                if not last:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+                self._breaker.record_failure()
+                raise JobAPIError(f"{method} {path} 실패: {e!r}") from e
+            except httpx.HTTPError as e:
+                self._breaker.record_failure()
+                raise JobAPIError(f"{method} {path} 실패: {e!r}") from e
+
+            if response.status_code >= 500:
+                if method != "POST" and not last:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+                self._breaker.record_failure()
+                raise JobAPIError(f"{method} {path} 실패: HTTP {response.status_code}")
+
+            # Job API가 응답했으면 정상으로 본다 (4xx는 요청 오류)
+            self._breaker.record_success()
+            if response.status_code >= 400:
+                raise JobAPIError(f"{method} {path} 실패: HTTP {response.status_code}")
+            try:
+                return response.json()
+            except ValueError as e:
+                raise JobAPIError(f"{method} {path} 응답 형식 오류: {e}") from e
+
+    async def create_job(self, job_type: str) -> str:
+        """작업 실행 요청 (POST /jobs/{job_type}) → job_id"""
+        data = await self._request("POST", f"/jobs/{job_type}")
+        return data["job"]["job_id"]
+
+    async def get_job(self, job_id: str) -> Dict[str, Any]:
+        """작업 상태 조회 (GET /jobs/{job_id})"""
+        return await self._request("GET", f"/jobs/{job_id}")
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+job_api = JobAPIClient(JOB_API_URL)
@@ -1,18 +1,33 @@
 """
 FastAPI 미들웨어
 - IP 필터링
+- 응답 압축 (br / gzip)
 - CORS 설정
+
+모두 순수 ASGI 미들웨어로 구현한다. (BaseHTTPMiddleware는 요청마다 태스크/스트림을 추가로 만든다)
 """
 
-from ipaddress import ip_address, ip_network
-from typing import Callable, List, Tuple
-from fastapi import Request, Response
+import gzip
+from bisect import bisect_right
+from functools import lru_cache
+from ipaddress import ip_address, ip_network, IPv6Address
+from typing import List, Optional, Tuple
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+
+from core.concurrency import run_in_thread
+
+try:
+    import brotli
+except ImportError:  # Brotli 미설치 시 gzip만 사용
+    brotli = None
 
 
-# IP 필터링 캐시
-_ALLOWED_NETS_CACHE: Tuple[str, Tuple] = ("", tuple())
+# 최근 클라이언트 IP 판정 결과 캐시 크기 (CIDR 목록별)
+_IP_DECISION_CACHE_SIZE = 4096
+
+# IP 필터링 제외 경로 (API 문서만 제외)
+_IP_FILTER_EXCLUDED_PATHS = frozenset(["/", "/docs", "/redoc", "/openapi.json"])
 
 
 def _parse_allowed_networks(cidrs_str: str) -> Tuple:
@@ -25,12 +40,6 @@ def _parse_allowed_networks(cidrs_str: str) -> Tuple:
     Returns:
         Tuple: ip_network 객체 튜플
     """
-    global _ALLOWED_NETS_CACHE
-
-    # 캐시 확인 (CIDR 문자열이 변경되지 않았으면 재사용)
-    if _ALLOWED_NETS_CACHE[0] == cidrs_str:
-        return _ALLOWED_NETS_CACHE[1]
-
     nets = []
     for raw in (cidrs_str or "").split(","):
         raw = raw.strip()
@@ -41,10 +50,57 @@ def _parse_allowed_networks(cidrs_str: str) -> Tuple:
         except Exception:
             # 잘못된 CIDR은 무시
             continue
+    return tuple(nets)
 
-    # 캐시 업데이트
-    _ALLOWED_NETS_CACHE = (cidrs_str, tuple(nets))
-    return _ALLOWED_NETS_CACHE[1]
+
+class CIDRMatcher:
+    """
+    허용 네트워크 판정기
+
+    CIDR 목록을 IP 버전별로 정렬/병합된 정수 구간 [start, end]으로 미리 변환해 두고,
+    bisect 한 번으로 포함 여부를 판정한다. 최근 판정 결과는 LRU로 캐시한다.
+    (IPv4-mapped IPv6 주소(::ffff:a.b.c.d)는 IPv4로 판정)
+    """
+
+    def __init__(self, cidrs_str: str):
+        ranges = {4: [], 6: []}
+        for net in _parse_allowed_networks(cidrs_str):
+            ranges[net.version].append((int(net.network_address), int(net.broadcast_address)))
+
+        self._starts = {}
+        self._ends = {}
+        for version, items in ranges.items():
+            merged: List[List[int]] = []
+            for start, end in sorted(items):
+                if merged and start <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            self._starts[version] = [r[0] for r in merged]
+            self._ends[version] = [r[1] for r in merged]
+
+        self.is_allowed = lru_cache(maxsize=_IP_DECISION_CACHE_SIZE)(self._match)
+
+    def _match(self, client_ip: str) -> bool:
+        if not client_ip:
+            return False
+        try:
+            ip = ip_address(client_ip)
+        except ValueError:
+            return False
+        if isinstance(ip, IPv6Address) and ip.ipv4_mapped is not None:
+            ip = ip.ipv4_mapped
+
+        value = int(ip)
+        starts = self._starts[ip.version]
+        i = bisect_right(starts, value) - 1
+        return i >= 0 and value <= self._ends[ip.version][i]
+
+
+@lru_cache(maxsize=8)
+def _get_matcher(cidrs_str: str) -> CIDRMatcher:
+    """CIDR 문자열별 판정기 (문자열이 바뀌지 않으면 재사용)"""
+    return CIDRMatcher(cidrs_str)
 
 
 def is_allowed_ip(client_ip: str, allowed_cidrs: str) -> bool:
@@ -58,94 +114,190 @@ def is_allowed_ip(client_ip: str, allowed_cidrs: str) -> bool:
     Returns:
         bool: 허용 여부
     """
-    if not client_ip:
-        return False
+    return _get_matcher(allowed_cidrs or "").is_allowed(client_ip)
 
-    try:
-        ip = ip_address(client_ip)
-    except Exception:
-        return False
-
-    allowed_nets = _parse_allowed_networks(allowed_cidrs)
-    if not allowed_nets:
-        return False
-
-    return any(ip in network for network in allowed_nets)
 
+def _get_client_ip(scope) -> str:
+    """
+    클라이언트 IP 추출 (프록시 고려)
 
-class IPFilterMiddleware(BaseHTTPMiddleware):
+    X-Forwarded-For(첫 번째 IP) → X-Real-IP → 직접 연결된 클라이언트 IP 순
     """
-    IP 필터링 미들웨어
+    xff = None
+    xri = None
+    for name, value in scope.get("headers", ()):
+        if name == b"x-forwarded-for" and xff is None:
+            xff = value
+        elif name == b"x-real-ip" and xri is None:
+            xri = value
+
+    if xff:
+        # 여러 IP가 있는 경우 첫 번째 (원본 클라이언트)
+        return xff.decode("latin-1").split(",")[0].strip()
+    if xri:
+        return xri.decode("latin-1").strip()
+
+    client = scope.get("client")
+    if client and client[0]:
+        return client[0]
+    return ""
+
+
+class IPFilterMiddleware:
+    """
+    IP 필터링 미들웨어 (순수 ASGI)
     허용된 네트워크에서만 API 접근 가능
     """
 
     def __init__(self, app, allowed_cidrs: str):
         """
         Args:
-            app: FastAPI 앱
+            app: ASGI 앱
             allowed_cidrs: 허용된 CIDR 문자열 (쉼표 구분)
         """
-        super().__init__(app)
+        self.app = app
         self.allowed_cidrs = allowed_cidrs
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        요청 처리
-
-        Args:
-            request: HTTP 요청
-            call_next: 다음 미들웨어/핸들러
-
-        Returns:
-            Response: HTTP 응답
-        """
-        # IP 필터링 제외 경로 (API 문서만 제외)
-        excluded_paths = ["/", "/docs", "/redoc", "/openapi.json"]
-        if request.url.path in excluded_paths:
-            # 필터링 없이 바로 통과
-            response = await call_next(request)
-            return response
-
-        # 클라이언트 IP 추출
-        client_ip = self._get_client_ip(request)
-
-        # IP 필터링 확인
-        if not is_allowed_ip(client_ip, self.allowed_cidrs):
-            return JSONResponse(
+        self.matcher = _get_matcher(allowed_cidrs or "")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket") or scope["path"] in _IP_FILTER_EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = _get_client_ip(scope)
+        if not self.matcher.is_allowed(client_ip):
+            if scope["type"] == "websocket":
+                await send({"type": "websocket.close", "code": 1008})
+                return
+            response = JSONResponse(
                 status_code=403,
                 content={
                     "detail": "Access denied from external network",
                     "client_ip": client_ip
                 }
             )
+            await response(scope, receive, send)
+            return
 
-        # 다음 미들웨어/핸들러 호출
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
-    def _get_client_ip(self, request: Request) -> str:
-        """
-        클라이언트 IP 추출 (프록시 고려)
 
-        Args:
-            request: HTTP 요청
+# 압축 대상 Content-Type (text/event-stream, 엑셀 등 이미 압축된 파일은 제외)
+_COMPRESSIBLE_TYPES = (
+    "application/json", "text/html", "text/plain", "text/css", "text/csv", "application/javascript",
+)
+
+# 이 크기 이상이면 이벤트 루프 대신 스레드풀에서 압축
+_COMPRESS_OFFLOAD_SIZE = 64 * 1024
+
+
+def _negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding → 사용할 인코딩 ("br" / "gzip" / None)
 
-        Returns:
-            str: 클라이언트 IP
+    q값이 0인 인코딩은 제외하고, q값이 같으면 br을 우선한다. (Brotli 미설치 시 gzip만)
+    """
+    weights = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+
+    wildcard = weights.get("*", 0.0)
+    candidates = []
+    if brotli is not None:
+        candidates.append(("br", weights.get("br", wildcard)))
+    candidates.append(("gzip", weights.get("gzip", wildcard)))
+
+    encoding, q = max(candidates, key=lambda c: c[1])
+    return encoding if q > 0 else None
+
+
+def _is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    return content_type in _COMPRESSIBLE_TYPES
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 미들웨어 (순수 ASGI)
+
+    - Accept-Encoding 협상으로 br(Brotli 설치 시) 또는 gzip 선택
+    - 본문이 한 번에 전달되는 응답 중 minimum_size 이상인 JSON/텍스트만 압축한다.
+      스트리밍 응답(보고서 다운로드, SSE)은 버퍼링하지 않고 그대로 전달한다.
+    - 큰 본문은 스레드풀에서 압축해 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        """
+        Args:
+            app: ASGI 앱
+            minimum_size: 압축 최소 본문 크기 (bytes)
+            gzip_level: gzip 압축 레벨 (1~9)
+            brotli_quality: Brotli 품질 (0~11, 높을수록 느림)
         """
-        # X-Forwarded-For 헤더 확인 (프록시 사용 시)
-        xff = request.headers.get("X-Forwarded-For")
-        if xff:
-            # 여러 IP가 있는 경우 첫 번째 (원본 클라이언트)
-            return xff.split(",")[0].strip()
-
-        # X-Real-IP 헤더 확인
-        xri = request.headers.get("X-Real-IP")
-        if xri:
-            return xri.strip()
-
-        # 직접 연결된 클라이언트 IP
-        if request.client and request.client.host:
-            return request.client.host
-
-        return ""
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = _negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+
+        async def send_wrapper(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                # 첫 본문을 보고 압축 여부를 정하므로 헤더 전송을 미룬다
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            compressible = _is_compressible(headers)
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+
+            if not compressible or message.get("more_body", False) or len(body) < self.minimum_size:
+                await send(start)
+                await send(message)
+                return
+
+            if len(body) >= _COMPRESS_OFFLOAD_SIZE:
+                body = await run_in_thread(self._compress, encoding, body)
+            else:
+                body = self._compress(encoding, body)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
@@ -0,0 +1,89 @@
+"""
+목록 API keyset(커서) 페이지네이션 / 필터 공통 함수
+
+- 정렬 키(고유해야 함) 마지막 값을 커서로 돌려주고, 다음 페이지는
+  (k1, k2, ...) < (v1, v2, ...) 조건으로 이어서 읽는다. (OFFSET 없이 인덱스 범위 스캔)
+- 커서는 base64url(JSON) 문자열이며 클라이언트는 내용을 해석하지 않는다.
+- 응답 형식: {"items": [...], "next_cursor": str | null, "limit": int}
+
+Usage:
+    rows, next_cursor = paginate(
+        query, [ScanHistory.scan_date, ScanHistory.server_id, ScanHistory.item_code],
+        cursor, limit, parsers=[parse_cursor_datetime, str, str]
+    )
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def parse_date_param(value: Optional[str], default: Optional[datetime] = None) -> Optional[datetime]:
+    """쿼리 파라미터 날짜 파싱 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS)"""
+    if not value:
+        return default
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    raise HTTPException(status_code=400, detail="날짜 형식이 올바르지 않습니다 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS)")
+
+
+def parse_cursor_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"cursor 값으로 사용할 수 없는 타입: {type(value).__name__}")
+
+
+def encode_cursor(values: Sequence) -> str:
+    raw = json.dumps(list(values), default=_json_default, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, parsers: Sequence[Callable]) -> list:
+    """커서 → 정렬 키 값 목록 (형식이 맞지 않으면 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("length mismatch")
+        return [parse(v) for parse, v in zip(parsers, values)]
+    except Exception:
+        raise HTTPException(status_code=400, detail="cursor 값이 올바르지 않습니다")
+
+
+def paginate(query, columns: List, cursor: Optional[str], limit: int,
+             parsers: Sequence[Callable], descending: bool = True):
+    """
+    query를 columns 순서(모두 내림차순 또는 모두 오름차순)로 정렬해 한 페이지를 읽는다.
+
+    columns는 select 대상에 포함되어 있어야 한다. (행에서 같은 이름으로 다음 커서 값을 읽음)
+
+    Returns:
+        (rows, next_cursor)  다음 페이지가 없으면 next_cursor=None
+    """
+    key = tuple_(*columns)
+    if cursor:
+        last = tuple_(*decode_cursor(cursor, parsers))
+        query = query.filter(key < last if descending else key > last)
+
+    order = [c.desc() if descending else c.asc() for c in columns]
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], c.key) for c in columns])
+    return rows, next_cursor
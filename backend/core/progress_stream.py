@@ -0,0 +1,132 @@
+"""
+작업 진행률 푸시 (Server-Sent Events)
+
+- 같은 작업(job)을 구독하는 클라이언트가 여럿이어도 Job API(:8001)는 작업당 watcher 하나만
+  JOB_PROGRESS_POLL_INTERVAL 간격으로 조회하고, 상태가 바뀔 때마다 모든 구독자에게 전달한다.
+  (클라이언트 수 × 폴링 주기만큼 Job API를 호출하지 않음)
+- 구독자 큐는 최신 상태 1개만 유지한다. 느린 클라이언트는 중간 상태를 건너뛰고 최신 상태를 받는다.
+- completed / failed 상태를 보내면 스트림을 닫는다. 구독자가 모두 끊기면 watcher도 멈춘다.
+- 진행률 조회 함수(fetch)가 코루틴 함수면 이벤트 루프에서 await하고, 동기 함수(블로킹 I/O)면
+  스레드풀에서 실행한다.
+
+모든 상태는 이벤트 루프 스레드에서만 변경되므로 잠금이 필요 없다.
+
+Usage:
+    @router.get("/progress/{job_id}/stream")
+    async def stream(job_id: str, ...):
+        return progress_event_response(("fix", job_id), lambda: _progress_payload(job_id))
+"""
+
+import asyncio
+import inspect
+import json
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Optional, Set
+
+from fastapi.responses import StreamingResponse
+
+from core.concurrency import run_in_thread
+from core.config import JOB_PROGRESS_POLL_INTERVAL, SSE_KEEPALIVE_INTERVAL
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+def _offer(queue: asyncio.Queue, state: Dict[str, Any]) -> None:
+    """최신 상태로 교체 (큐 크기 1)"""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(state)
+
+
+class _Watch:
+    def __init__(self):
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.latest: Optional[Dict[str, Any]] = None
+        self.task: Optional[asyncio.Task] = None
+
+
+class ProgressHub:
+    """작업별 진행률 watcher + 구독자 fan-out"""
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._watches: Dict[Hashable, _Watch] = {}
+
+    async def subscribe(self, key: Hashable, fetch: Callable,
+                        heartbeat: Optional[float] = None) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        진행 상태를 변경될 때마다 내보낸다. (종료 상태를 내보낸 뒤 끝남)
+
+        key가 같은 구독자는 watcher를 공유한다. fetch는 watcher를 새로 만들 때만 사용된다.
+        heartbeat초 동안 변경이 없으면 None을 내보낸다.
+        """
+        watch = self._watches.get(key)
+        if watch is None:
+            watch = _Watch()
+            self._watches[key] = watch
+            watch.task = asyncio.create_task(self._run(key, watch, fetch))
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        if watch.latest is not None:
+            queue.put_nowait(watch.latest)
+        watch.subscribers.add(queue)
+        try:
+            while True:
+                try:
+                    state = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield state
+                if state.get("status") in TERMINAL_STATUSES:
+                    return
+        finally:
+            watch.subscribers.discard(queue)
+            if not watch.subscribers and not watch.task.done():
+                watch.task.cancel()
+                self._drop(key, watch)
+
+    async def _run(self, key: Hashable, watch: _Watch, fetch: Callable) -> None:
+        try:
+            while True:
+                if inspect.iscoroutinefunction(fetch):
+                    state = await fetch()
+                else:
+                    state = await run_in_thread(fetch)
+                if state != watch.latest:
+                    watch.latest = state
+                    for queue in list(watch.subscribers):
+                        _offer(queue, state)
+                if state.get("status") in TERMINAL_STATUSES:
+                    return
+                await asyncio.sleep(self._interval)
+        except Exception as e:
+            state = {"status": "failed", "progress": 0, "message": f"진행 상황 조회 실패: {e}"}
+            for queue in list(watch.subscribers):
+                _offer(queue, state)
+        finally:
+            self._drop(key, watch)
+
+    def _drop(self, key: Hashable, watch: _Watch) -> None:
+        if self._watches.get(key) is watch:
+            del self._watches[key]
+
+
+progress_hub = ProgressHub(JOB_PROGRESS_POLL_INTERVAL)
+
+
+async def _event_stream(key: Hashable, fetch: Callable) -> AsyncIterator[str]:
+    async for state in progress_hub.subscribe(key, fetch, heartbeat=SSE_KEEPALIVE_INTERVAL):
+        if state is None:
+            # 프록시/브라우저 유휴 연결 끊김 방지
+            yield ": keep-alive\n\n"
+        else:
+            yield f"event: progress\ndata: {json.dumps(state, ensure_ascii=False)}\n\n"
+
+
+def progress_event_response(key: Hashable, fetch: Callable) -> StreamingResponse:
+    """진행률 SSE 응답 (text/event-stream, 이벤트명 progress, data는 진행률 조회 응답과 같은 JSON)"""
+    return StreamingResponse(
+        _event_stream(key, fetch),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
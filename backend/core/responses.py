@@ -0,0 +1,56 @@
+"""
+JSON 응답 직렬화 (orjson)
+
+- FastJSONResponse: 앱 기본 응답 클래스 (main.py default_response_class).
+  json.dumps 대신 orjson으로 렌더링한다.
+- encode_json(): 큰 조회 응답(대시보드, 서버별 결과 등)은 엔드포인트에서 바로 직렬화해
+  FastAPI의 jsonable_encoder(값마다 타입 검사하며 dict/list를 재귀 복사)를 건너뛴다.
+  반환값이 str 하위 타입이라 jsonable_encoder는 그대로 통과시키고, FastJSONResponse가
+  다시 따옴표로 감싸지 않고 본문으로 쓴다. (의존성이 Response에 설정한 ETag 헤더도 유지됨)
+
+datetime/date는 orjson이 ISO 8601로 직접 변환한다. (jsonable_encoder와 같은 형식)
+Decimal(MySQL SUM/AVG 결과)은 jsonable_encoder와 같게 정수면 int, 아니면 float로 변환한다.
+
+Usage:
+    @router.get("/data")
+    def get_data(...):
+        return encode_json({"summary": ..., "items": [...]})
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class JSONText(str):
+    """이미 직렬화된 JSON 본문"""
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+def encode_json(content: Any) -> JSONText:
+    """응답 본문을 미리 직렬화 (jsonable_encoder 생략)"""
+    return JSONText(dumps(content).decode("utf-8"))
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, JSONText):
+            return content.encode("utf-8")
+        return dumps(content)
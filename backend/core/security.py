@@ -12,6 +12,7 @@ from typing import Optional, Dict, Any
 
 from jose import JWTError, jwt
 from .config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from .concurrency import password_pool
 
 
 # =============================================================================
@@ -78,6 +79,18 @@ def verify_password(password: str, stored: str) -> bool:
     return False
 
 
+async def hash_password_async(password: str) -> str:
+    """hash_password를 전용 프로세스 풀에서 실행 (대기열 초과 시 PoolBusyError)"""
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(password: str, stored: str) -> bool:
+    """verify_password를 전용 프로세스 풀에서 실행 (대기열 초과 시 PoolBusyError)"""
+    if not password or not stored:
+        return False
+    return await password_pool.run(verify_password, password, str(stored))
+
+
 # =============================================================================
 # JWT Token 생성/검증
 # =============================================================================
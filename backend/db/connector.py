@@ -5,11 +5,15 @@ MySQL 연결 관리 (커넥션 풀)
 
 import mysql.connector
 from mysql.connector import pooling, Error
+import re
 import sys, os
 
 # backend/ 디렉토리를 path에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from config import DB_CONFIG
+from db.evidence import EVIDENCE_FIELDS, compress_evidence, extract_evidence_fields
+from db.scores import refresh_statements, stale_servers_statement
+from db.data_version import bump_statement, touch_stamp
 
 
 class DBConnector:
@@ -47,15 +51,239 @@ class DBConnector:
     # scan_history
     # =========================================================
     def insert_scan_result(self, server_id, item_code, status, raw_evidence, scan_date):
+        # 다이제스트 없이 evidence를 덮어쓰므로 evidence_hash는 무효화한다 (다음 파이프라인 실행 때 재계산).
+        fields = extract_evidence_fields(raw_evidence)
         query = """
-            INSERT INTO scan_history (server_id, item_code, status, raw_evidence, scan_date)
-            VALUES (%s, %s, %s, %s, %s)
+            INSERT INTO scan_history
+                (server_id, item_code, status, raw_evidence, scan_date,
+                 evidence_detail, evidence_command, evidence_guide, evidence_target_file)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
             ON DUPLICATE KEY UPDATE
                 status = VALUES(status),
                 raw_evidence = VALUES(raw_evidence),
-                scan_date = VALUES(scan_date)
+                scan_date = VALUES(scan_date),
+                evidence_hash = NULL,
+                evidence_detail = VALUES(evidence_detail),
+                evidence_command = VALUES(evidence_command),
+                evidence_guide = VALUES(evidence_guide),
+                evidence_target_file = VALUES(evidence_target_file)
+        """
+        return self._execute(
+            query,
+            (server_id, item_code, status, raw_evidence, scan_date) + tuple(fields[f] for f in EVIDENCE_FIELDS),
+        )
+
+    def bulk_upsert_scan_results(self, rows, batch_size=500):
+        """
+        scan_history 일괄 UPSERT (multi-row INSERT ... ON DUPLICATE KEY UPDATE)
+
+        - rows: (server_id, item_code, status, raw_evidence, scan_date, evidence_hash,
+                 evidence_detail, evidence_command, evidence_guide, evidence_target_file) 튜플 목록
+        - 실행 전체를 하나의 트랜잭션으로 묶고 마지막에 1회만 commit 한다.
+        - 배치마다 SAVEPOINT를 걸어, 배치가 실패하면 해당 배치만 되돌린 뒤
+          행 단위로 재시도한다. (불량 행 1건 때문에 배치 전체를 잃지 않도록)
+
+        Returns:
+            (성공 행 수, 실패 행 목록)
+        """
+        if not rows:
+            return 0, []
+
+        head = ("INSERT INTO scan_history (server_id, item_code, status, raw_evidence, scan_date, evidence_hash, "
+                "evidence_detail, evidence_command, evidence_guide, evidence_target_file) VALUES ")
+        tail = """
+            ON DUPLICATE KEY UPDATE
+                status = VALUES(status),
+                raw_evidence = VALUES(raw_evidence),
+                scan_date = VALUES(scan_date),
+                evidence_hash = VALUES(evidence_hash),
+                evidence_detail = VALUES(evidence_detail),
+                evidence_command = VALUES(evidence_command),
+                evidence_guide = VALUES(evidence_guide),
+                evidence_target_file = VALUES(evidence_target_file)
+        """
+        placeholder = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+        ok_count = 0
+        failed_rows = []
+        try:
+            # 풀에서 받은 커넥션에 남아있을 수 있는 암묵적 트랜잭션(SELECT 스냅샷)을 정리
+            self.connection.commit()
+            cursor = self.connection.cursor()
+
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                params = [v for row in batch for v in row]
+                cursor.execute("SAVEPOINT sp_batch")
+                try:
+                    cursor.execute(head + ", ".join([placeholder] * len(batch)) + tail, params)
+                    ok_count += len(batch)
+                    continue
+                except Error as e:
+                    print(f"[DB WARN] 배치 UPSERT 실패 → 행 단위 재시도 (rows={len(batch)}): {e}")
+                    cursor.execute("ROLLBACK TO SAVEPOINT sp_batch")
+
+                for row in batch:
+                    cursor.execute("SAVEPOINT sp_row")
+                    try:
+                        cursor.execute(head + placeholder + tail, row)
+                        ok_count += 1
+                    except Error as e:
+                        print(f"[DB ERROR] 행 UPSERT 실패 ({row[0]}, {row[1]}): {e}")
+                        cursor.execute("ROLLBACK TO SAVEPOINT sp_row")
+                        failed_rows.append(row)
+
+            self.connection.commit()
+            return ok_count, failed_rows
+        except Error as e:
+            print(f"[DB ERROR] 일괄 UPSERT 트랜잭션 실패: {e}")
+            self.connection.rollback()
+            return 0, list(rows)
+
+    def get_evidence_digests(self, server_ids):
+        """
+        서버들의 현재 (status, evidence_hash) 매니페스트 조회
+
+        Returns:
+            {(server_id, item_code): (status, evidence_hash)} (조회 실패 시 None)
+        """
+        server_ids = list(server_ids)
+        if not server_ids:
+            return {}
+        query = (
+            "SELECT server_id, item_code, status, evidence_hash FROM scan_history "
+            "WHERE server_id IN (" + ", ".join(["%s"] * len(server_ids)) + ")"
+        )
+        rows = self._fetch(query, tuple(server_ids))
+        if rows is None:
+            return None
+        return {(r['server_id'], r['item_code']): (r['status'], r['evidence_hash']) for r in rows}
+
+    def touch_scan_results(self, keys, scan_date, batch_size=500):
+        """
+        결과가 바뀌지 않은 (server_id, item_code)들의 scan_date만 갱신한다.
+        raw_evidence(LONGTEXT)를 다시 보내거나 쓰지 않으므로 redo/binlog 양이 크게 줄어든다.
+
+        Returns:
+            (성공 행 수, 실패 키 목록)
+        """
+        keys = list(keys)
+        if not keys:
+            return 0, []
+
+        ok_count = 0
+        failed_keys = []
+        try:
+            self.connection.commit()
+            cursor = self.connection.cursor()
+            for start in range(0, len(keys), batch_size):
+                batch = keys[start:start + batch_size]
+                query = (
+                    "UPDATE scan_history SET scan_date = %s "
+                    "WHERE (server_id, item_code) IN (" + ", ".join(["(%s, %s)"] * len(batch)) + ")"
+                )
+                params = [scan_date] + [v for key in batch for v in key]
+                cursor.execute("SAVEPOINT sp_touch")
+                try:
+                    cursor.execute(query, params)
+                    ok_count += len(batch)
+                except Error as e:
+                    print(f"[DB ERROR] scan_date 갱신 실패 (rows={len(batch)}): {e}")
+                    cursor.execute("ROLLBACK TO SAVEPOINT sp_touch")
+                    failed_keys.extend(batch)
+            self.connection.commit()
+            return ok_count, failed_keys
+        except Error as e:
+            print(f"[DB ERROR] scan_date 갱신 트랜잭션 실패: {e}")
+            self.connection.rollback()
+            return 0, keys
+
+    # =========================================================
+    # scan_runs / scan_results_history (append-only 이력)
+    # =========================================================
+    def start_scan_run(self, scan_date, source='pipeline'):
+        """scan_runs에 실행 1건을 등록하고 run_id 반환 (테이블이 없으면 None)"""
+        query = """
+            INSERT INTO scan_runs (scan_date, source, status, started_at)
+            VALUES (%s, %s, 'running', NOW())
+        """
+        return self._execute(query, (scan_date, source)) or None
+
+    def finish_scan_run(self, run_id, status, server_count=0, result_count=0, changed_count=0, failed_count=0):
+        query = """
+            UPDATE scan_runs
+            SET status = %s, server_count = %s, result_count = %s,
+                changed_count = %s, failed_count = %s, finished_at = NOW()
+            WHERE run_id = %s
+        """
+        return self._execute(query, (status, server_count, result_count, changed_count, failed_count, run_id))
+
+    def ensure_history_partitions(self, until_date, months_ahead=1):
+        """
+        scan_results_history에 until_date(+months_ahead)까지의 월 파티션이 없으면
+        pmax를 REORGANIZE 해서 추가한다. (파티션 이름: pYYYYMM = 해당 월 데이터)
         """
-        return self._execute(query, (server_id, item_code, status, raw_evidence, scan_date))
+        rows = self._fetch(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'scan_results_history' "
+            "AND PARTITION_NAME IS NOT NULL",
+            (),
+        )
+        if not rows:
+            return False
+
+        # 월 인덱스(year * 12 + month - 1) 기준으로 비교한다.
+        existing = [int(r['PARTITION_NAME'][1:5]) * 12 + int(r['PARTITION_NAME'][5:7]) - 1
+                    for r in rows if re.fullmatch(r'p\d{6}', r['PARTITION_NAME'])]
+        target = until_date.year * 12 + until_date.month - 1 + months_ahead
+        first = max(existing) + 1 if existing else until_date.year * 12 + until_date.month - 1
+        if first > target:
+            return True
+
+        # 마지막 월 파티션 다음 달부터 target까지 한 번에 추가
+        parts = []
+        for idx in range(first, target + 1):
+            y, m = divmod(idx, 12)
+            ny, nm = divmod(idx + 1, 12)
+            parts.append(f"PARTITION p{y:04d}{m + 1:02d} VALUES LESS THAN ('{ny:04d}-{nm + 1:02d}-01')")
+
+        query = ("ALTER TABLE scan_results_history REORGANIZE PARTITION pmax INTO ("
+                 + ", ".join(parts) + ", PARTITION pmax VALUES LESS THAN (MAXVALUE))")
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(query)
+            print(f"[INFO] scan_results_history 파티션 추가: {', '.join(p.split()[1] for p in parts)}")
+            return True
+        except Error as e:
+            print(f"[DB WARN] scan_results_history 파티션 추가 실패: {e}")
+            return False
+
+    def append_scan_results_history(self, run_id, rows, batch_size=500):
+        """
+        scan_results_history 일괄 INSERT (append-only, 한 트랜잭션)
+
+        - rows: (server_id, item_code, status, evidence_hash, scan_date) 튜플 목록
+        - 이력은 최신 상태(scan_history)와 별개이므로 실패해도 전체를 되돌리고 0을 반환한다.
+        """
+        if not rows:
+            return 0
+
+        head = ("INSERT INTO scan_results_history (run_id, server_id, item_code, status, evidence_hash, scan_date) "
+                "VALUES ")
+        placeholder = "(%s, %s, %s, %s, %s, %s)"
+        try:
+            self.connection.commit()
+            cursor = self.connection.cursor()
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                params = [v for row in batch for v in (run_id,) + tuple(row)]
+                cursor.execute(head + ", ".join([placeholder] * len(batch)), params)
+            self.connection.commit()
+            return len(rows)
+        except Error as e:
+            print(f"[DB ERROR] scan_results_history 적재 실패: {e}")
+            self.connection.rollback()
+            return 0
 
     def get_scan_history(self, server_id=None, item_code=None):
         query = "SELECT * FROM scan_history WHERE 1=1"
@@ -69,34 +297,113 @@ class DBConnector:
         query += " ORDER BY scan_date DESC"
         return self._fetch(query, tuple(params))
 
-    def get_latest_scan(self, server_id):
+    def get_current_scan(self, server_id):
+        """
+        서버의 현재 점검 결과 ((server_id, item_code)당 1행, UPSERT)
+
+        scan-db만 실행한 뒤에도 OS 행은 이전 scan_date로 남아 있으므로 최신 scan_date로 거르지 않는다.
+        (server_scores 집계 대상과 같은 행 → db/scores.py)
+        """
         query = """
             SELECT sh.*, ki.title, ki.severity, ki.category
             FROM scan_history sh
             JOIN kisa_items ki ON sh.item_code = ki.item_code
             WHERE sh.server_id = %s
-              AND sh.scan_date = (
-                  SELECT MAX(scan_date) FROM scan_history WHERE server_id = %s
-              )
             ORDER BY sh.item_code
         """
-        return self._fetch(query, (server_id, server_id))
+        return self._fetch(query, (server_id,))
+
+    # =========================================================
+    # evidence_blobs (콘텐츠 주소 저장소)
+    # =========================================================
+    def store_evidence_blobs(self, evidence_by_hash, batch_size=200):
+        """
+        {evidence_hash: raw_evidence} 중 아직 없는 본문만 압축해서 저장한다.
+
+        Returns:
+            evidence_blobs에 존재가 확인된 hash 집합
+            (테이블이 없는 등 실패 시 빈 집합 → 호출자는 인라인 raw_evidence로 폴백)
+        """
+        hashes = list(evidence_by_hash)
+        if not hashes:
+            return set()
+
+        try:
+            self.connection.commit()
+            cursor = self.connection.cursor()
+            stored = set()
+            for start in range(0, len(hashes), batch_size):
+                batch = hashes[start:start + batch_size]
+                cursor.execute(
+                    "SELECT evidence_hash FROM evidence_blobs WHERE evidence_hash IN ("
+                    + ", ".join(["%s"] * len(batch)) + ")",
+                    batch,
+                )
+                stored.update(r[0] for r in cursor.fetchall())
+
+            missing = [h for h in hashes if h not in stored]
+            for start in range(0, len(missing), batch_size):
+                batch = missing[start:start + batch_size]
+                params = []
+                for h in batch:
+                    text = evidence_by_hash[h] or ""
+                    params.extend((h, compress_evidence(text), len(text.encode("utf-8", errors="replace"))))
+                cursor.execute(
+                    "INSERT IGNORE INTO evidence_blobs (evidence_hash, body, raw_size) VALUES "
+                    + ", ".join(["(%s, %s, %s)"] * len(batch)),
+                    params,
+                )
+                stored.update(batch)
+
+            self.connection.commit()
+            return stored
+        except Error as e:
+            print(f"[DB WARN] evidence_blobs 저장 실패 → raw_evidence 인라인 저장으로 폴백: {e}")
+            self.connection.rollback()
+            return set()
+
+    def get_evidence_blobs(self, hashes):
+        """{evidence_hash: 압축 본문} 조회 (압축 해제는 호출자가 필요할 때 수행)"""
+        hashes = list({h for h in hashes if h})
+        if not hashes:
+            return {}
+        rows = self._fetch(
+            "SELECT evidence_hash, body FROM evidence_blobs WHERE evidence_hash IN ("
+            + ", ".join(["%s"] * len(hashes)) + ")",
+            tuple(hashes),
+        )
+        return {r['evidence_hash']: r['body'] for r in (rows or [])}
 
     # =========================================================
     # remediation_logs
     # =========================================================
-    def insert_remediation_log(self, server_id, item_code, action_date, is_success, raw_evidence, failure_reason=None):
+    def insert_remediation_log(self, server_id, item_code, action_date, is_success, raw_evidence, failure_reason=None,
+                               evidence_hash=None, evidence_fields=None, run_id=None):
         """
         UNIQUE(server_id, item_code, action_date) 기반 중복 방지.
         같은 (서버, 항목, 시간)에 대해 재실행 시 UPDATE로 덮어쓴다.
+        evidence_hash가 주어지면 본문은 evidence_blobs에 있으므로 raw_evidence 컬럼은 비워 둔다.
+        evidence_fields(extract_evidence_fields 결과)가 없으면 여기서 추출한다.
+        run_id는 API가 시작한 조치 실행 ID (FIX_RUN_ID, 조치 결과 조회 기준)
         """
+        if evidence_fields is None:
+            evidence_fields = extract_evidence_fields(raw_evidence)
+
         query_with_reason = """
-            INSERT INTO remediation_logs (server_id, item_code, action_date, is_success, failure_reason, raw_evidence)
-            VALUES (%s, %s, %s, %s, %s, %s)
+            INSERT INTO remediation_logs
+                (server_id, item_code, action_date, is_success, failure_reason, raw_evidence, evidence_hash,
+                 evidence_detail, evidence_command, evidence_guide, evidence_target_file, run_id)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             ON DUPLICATE KEY UPDATE
                 is_success = VALUES(is_success),
                 failure_reason = VALUES(failure_reason),
-                raw_evidence = VALUES(raw_evidence)
+                raw_evidence = VALUES(raw_evidence),
+                evidence_hash = VALUES(evidence_hash),
+                evidence_detail = VALUES(evidence_detail),
+                evidence_command = VALUES(evidence_command),
+                evidence_guide = VALUES(evidence_guide),
+                evidence_target_file = VALUES(evidence_target_file),
+                run_id = VALUES(run_id)
         """
         query_legacy = """
             INSERT INTO remediation_logs (server_id, item_code, action_date, is_success, raw_evidence)
@@ -109,12 +416,15 @@ class DBConnector:
             cursor = self.connection.cursor()
             cursor.execute(
                 query_with_reason,
-                (server_id, item_code, action_date, is_success, failure_reason, raw_evidence),
+                (server_id, item_code, action_date, is_success, failure_reason,
+                 None if evidence_hash else raw_evidence, evidence_hash)
+                + tuple(evidence_fields.get(f) for f in EVIDENCE_FIELDS)
+                + (run_id,),
             )
             self.connection.commit()
             return cursor.lastrowid
         except Error as e:
-            # Unknown column 'failure_reason' in 'field list'
+            # Unknown column 'failure_reason' / 'evidence_hash' / 'evidence_*' / 'run_id' in 'field list'
             if getattr(e, "errno", None) == 1054:
                 try:
                     cursor = self.connection.cursor()
@@ -178,6 +488,99 @@ class DBConnector:
         query += " GROUP BY scan_date ORDER BY scan_date"
         return self._fetch(query, tuple(params))
 
+    # =========================================================
+    # server_scores / server_category_scores (materialized 점수)
+    # =========================================================
+    def refresh_server_scores(self, server_ids=None):
+        """
+        server_ids(None이면 전체)의 점수 테이블을 scan_history/exceptions 기준으로 다시 계산한다.
+        DELETE + INSERT ... SELECT를 한 트랜잭션으로 실행하므로 읽는 쪽은 중간 상태를 보지 않는다.
+        """
+        statements = refresh_statements(server_ids)
+        if not statements:
+            return True
+        try:
+            self.connection.commit()
+            cursor = self.connection.cursor()
+            for sql, params in statements:
+                cursor.execute(sql, params)
+            self.connection.commit()
+            return True
+        except Error as e:
+            print(f"[DB ERROR] server_scores 갱신 실패: {e}")
+            self.connection.rollback()
+            return False
+
+    def refresh_stale_server_scores(self, server_ids):
+        """
+        server_ids 중 점수 행이 없거나 마지막 갱신 이후 예외가 만료된 서버만 다시 계산한다.
+
+        Returns:
+            다시 계산한 server_id 목록 (실패 시 None)
+        """
+        statement = stale_servers_statement(server_ids)
+        if statement is None:
+            return []
+        rows = self._fetch(*statement)
+        if rows is None:
+            return None
+        stale = [r['server_id'] for r in rows]
+        if stale:
+            if not self.refresh_server_scores(stale):
+                return None
+            # 조회 API ETag 무효화
+            self.bump_data_version(stale)
+        return stale
+
+    def bump_data_version(self, server_ids=None):
+        """
+        server_ids(None이면 전체)가 속한 회사의 data_versions를 올리고 API에 알린다.
+        적재/점수 갱신이 커밋된 뒤에 호출해야 한다. (API ETag → db/data_version.py)
+        """
+        statement = bump_statement(server_ids)
+        if statement is None:
+            return True
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(*statement)
+            self.connection.commit()
+        except Error as e:
+            print(f"[DB ERROR] data_versions 갱신 실패: {e}")
+            self.connection.rollback()
+            return False
+        touch_stamp()
+        return True
+
+    def get_server_scores(self, server_ids=None, active_only=True):
+        """server_scores 조회 (기본: 활성 서버만)"""
+        query = """
+            SELECT ss.* FROM server_scores ss
+            JOIN servers s ON s.server_id = ss.server_id
+            WHERE 1=1
+        """
+        if active_only:
+            query += " AND s.is_active = 1"
+        params = []
+        if server_ids:
+            query += " AND ss.server_id IN (" + ", ".join(["%s"] * len(server_ids)) + ")"
+            params += list(server_ids)
+        return self._fetch(query, tuple(params))
+
+    def get_server_category_scores(self, server_ids=None, active_only=True):
+        """server_category_scores 조회 (기본: 활성 서버만)"""
+        query = """
+            SELECT scs.* FROM server_category_scores scs
+            JOIN servers s ON s.server_id = scs.server_id
+            WHERE 1=1
+        """
+        if active_only:
+            query += " AND s.is_active = 1"
+        params = []
+        if server_ids:
+            query += " AND scs.server_id IN (" + ", ".join(["%s"] * len(server_ids)) + ")"
+            params += list(server_ids)
+        return self._fetch(query, tuple(params))
+
     # =========================================================
     # 내부 헬퍼
     # =========================================================
@@ -0,0 +1,89 @@
+"""
+data_version.py
+회사별 데이터 버전 (data_versions) 갱신 SQL
+
+- 점검/조치 결과 적재, 예외 등록/삭제, 서버 등록/삭제 후 영향을 받은 서버의 회사 버전을 1 올린다.
+- API는 이 버전으로 ETag를 만들고(core/etag.py), 버전이 같으면 DB를 읽지 않고 304로 응답한다.
+- 버전을 올린 뒤 스탬프 파일(DATA_VERSION_STAMP_FILE)을 갱신해 같은 호스트의 API 프로세스가
+  캐시해 둔 버전을 바로 다시 읽도록 알린다. 다른 호스트의 API는 스탬프를 볼 수 없으므로
+  캐시 TTL(DATA_VERSION_CACHE_TTL, core/etag.py)이 지나면 data_versions를 다시 읽는다.
+
+파이프라인(run_pipeline.py) 환경에는 SQLAlchemy가 없으므로 표준 라이브러리만 사용한다.
+"""
+
+import os
+
+DATA_VERSION_STAMP_FILE = os.getenv("DATA_VERSION_STAMP_FILE", "/tmp/audit/data_version.stamp")
+
+_UPSERT_TAIL = "ON DUPLICATE KEY UPDATE version = version + 1, updated_at = NOW()"
+
+
+def bump_statement(server_ids=None, companies=None):
+    """
+    회사 버전을 올리는 (sql, params). 대상이 비어 있으면 None
+
+    - companies: 회사 목록을 직접 지정 (API: 로그인 사용자 회사, 삭제된 서버의 회사)
+    - server_ids: 서버가 속한 회사 (None이면 전체 서버)
+
+    버전은 읽기 데이터가 커밋된 뒤(또는 같은 트랜잭션에서) 올려야 한다.
+    먼저 올리면 새 ETag로 이전 데이터가 캐시될 수 있다.
+    """
+    if companies is not None:
+        companies = sorted(set(companies))
+        if not companies:
+            return None
+        values = ", ".join(["(%s, 1, NOW())"] * len(companies))
+        return f"INSERT INTO data_versions (company, version, updated_at) VALUES {values} {_UPSERT_TAIL}", companies
+
+    params = []
+    where = ""
+    if server_ids is not None:
+        server_ids = sorted(set(server_ids))
+        if not server_ids:
+            return None
+        where = "WHERE server_id IN (" + ", ".join(["%s"] * len(server_ids)) + ")"
+        params = server_ids
+    sql = f"""
+        INSERT INTO data_versions (company, version, updated_at)
+        SELECT DISTINCT company, 1, NOW() FROM servers {where}
+        {_UPSERT_TAIL}
+    """
+    return sql, params
+
+
+def read_stamp():
+    """스탬프 파일 mtime(ns). 없으면 None"""
+    try:
+        return os.stat(DATA_VERSION_STAMP_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def touch_stamp():
+    """버전 변경을 API 프로세스에 알림"""
+    try:
+        os.makedirs(os.path.dirname(DATA_VERSION_STAMP_FILE), exist_ok=True)
+        with open(DATA_VERSION_STAMP_FILE, "a"):
+            pass
+        os.utime(DATA_VERSION_STAMP_FILE, None)
+    except OSError as e:
+        print(f"[WARN] data_version 스탬프 갱신 실패: {e}")
+
+
+def bump_data_version_in_session(session, companies):
+    """
+    API(SQLAlchemy 세션)에서 예외/서버 변경 후 회사 버전 갱신
+
+    실패해도 요청 자체는 실패시키지 않는다. (다음 적재 시 다시 올라감)
+    """
+    statement = bump_statement(companies=companies)
+    if statement is None:
+        return
+    try:
+        sql, params = statement
+        session.connection().exec_driver_sql(sql, tuple(params))
+        session.commit()
+        touch_stamp()
+    except Exception as e:
+        session.rollback()
+        print(f"[WARN] data_versions 갱신 실패 (companies={companies}): {e}")
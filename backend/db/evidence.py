@@ -0,0 +1,145 @@
+"""
+evidence.py
+raw_evidence 콘텐츠 주소 저장소 (evidence_blobs) 헬퍼
+
+- 본문은 SHA-256 다이제스트를 키로 zlib 압축해 evidence_blobs에 1회만 저장한다.
+- scan_history / remediation_logs는 evidence_hash로 참조하고 raw_evidence는 비워 둔다.
+  (마이그레이션 이전 행은 raw_evidence에 본문이 그대로 남아 있으므로 둘 다 지원)
+- 읽는 쪽은 EvidenceResolver로 필요한 다이제스트만 모아서 조회하고,
+  같은 blob은 요청당 한 번만 압축 해제한다.
+- detail / command / guide / target_file은 적재 시 extract_evidence_fields()로 한 번만
+  추출해 evidence_* 컬럼에 저장한다. (조회/보고서 경로에서 raw_evidence를 다시 파싱하지 않음)
+
+파이프라인(run_pipeline.py) 환경에는 SQLAlchemy가 없으므로 모듈 수준에서는 표준 라이브러리만 사용한다.
+"""
+
+import hashlib
+import json
+import re
+import zlib
+
+# 압축 레벨 (zlib 1~9). 본문이 대부분 짧은 텍스트라 기본값으로 충분하다.
+COMPRESS_LEVEL = 6
+
+# raw_evidence에서 추출해 evidence_<field> 컬럼으로 저장하는 필드
+EVIDENCE_FIELDS = ("detail", "command", "guide", "target_file")
+
+
+def evidence_digest(raw_evidence: str) -> str:
+    """raw_evidence SHA-256 (evidence_hash)"""
+    return hashlib.sha256((raw_evidence or "").encode("utf-8", errors="replace")).hexdigest()
+
+
+def compress_evidence(raw_evidence: str) -> bytes:
+    """raw_evidence → evidence_blobs.body"""
+    return zlib.compress((raw_evidence or "").encode("utf-8", errors="replace"), COMPRESS_LEVEL)
+
+
+def decompress_evidence(body) -> str:
+    """evidence_blobs.body → raw_evidence"""
+    if not body:
+        return ""
+    return zlib.decompress(bytes(body)).decode("utf-8", errors="replace")
+
+
+def _decode_escapes(text: str) -> str:
+    # 스크립트에서 \n, \t, \" 형태로 이스케이프된 문자열 복원
+    # NOTE: unicode_escape는 UTF-8 한글을 깨뜨리므로 사용하지 않음
+    return text.replace("\\n", "\n").replace("\\t", "\t").replace('\\"', '"')
+
+
+def _load_json_layers(text: str):
+    """JSON 문자열 안에 다시 JSON이 들어간 이중 인코딩까지 풀어서 dict를 찾는다."""
+    current = text
+    for _ in range(3):
+        if not isinstance(current, str):
+            break
+        try:
+            current = json.loads(current, strict=False)
+        except Exception:
+            return None
+    return current if isinstance(current, dict) else None
+
+
+def extract_evidence_fields(raw_evidence) -> dict:
+    """
+    raw_evidence에서 detail / command / guide / target_file을 추출한다.
+
+    raw_evidence는 쉘 명령어 등으로 인해 이스케이프되지 않은 따옴표/제어문자를
+    포함할 수 있어 표준 json.loads()가 실패하는 경우가 많으므로 단계별로 폴백한다.
+    1) JSON (제어문자 허용, 이중 인코딩 포함)
+    2) 이중 이스케이프 (리터럴 \n, \") 복원 후 재시도
+    3) 필드별 정규식 ("field": "..." / \"field\": \"...\")
+    4) 아무 필드도 찾지 못하면 원문 첫 500자를 detail로 사용
+
+    Returns:
+        {field: str} (찾지 못한 필드는 빈 문자열)
+    """
+    fields = dict.fromkeys(EVIDENCE_FIELDS, "")
+    if not raw_evidence:
+        return fields
+
+    text = str(raw_evidence).strip()
+
+    data = _load_json_layers(text)
+    if data is None:
+        data = _load_json_layers(_decode_escapes(text))
+    if data is not None:
+        for field in EVIDENCE_FIELDS:
+            value = data.get(field)
+            if value:
+                fields[field] = (value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)).strip()
+        return fields
+
+    for field in EVIDENCE_FIELDS:
+        # 일반 JSON 형태 → 이중 이스케이프 형태 순으로 시도
+        m = re.search(rf'"{field}"\s*:\s*"(.*?)(?:"\s*[,}}])', text, re.DOTALL)
+        if not m:
+            m = re.search(rf'\\"{field}\\"\s*:\s*\\"(.*?)(?:\\"\s*[,}}])', text, re.DOTALL)
+        if m:
+            fields[field] = _decode_escapes(m.group(1)).strip()
+
+    if not any(fields.values()):
+        fields["detail"] = text[:500]
+    return fields
+
+
+class EvidenceResolver:
+    """
+    요청 단위 lazy evidence 로더 (SQLAlchemy 세션용)
+
+    Usage:
+        resolver = EvidenceResolver(db, [r.evidence_hash for r in rows])
+        resolver.get(r.raw_evidence, r.evidence_hash)
+    """
+
+    def __init__(self, db, hashes):
+        self._db = db
+        self._hashes = {h for h in hashes if h}
+        self._bodies = None
+        self._texts: dict[str, str] = {}
+
+    def _load(self):
+        from .models import EvidenceBlob
+
+        self._bodies = {}
+        if not self._hashes:
+            return
+        rows = self._db.query(EvidenceBlob.evidence_hash, EvidenceBlob.body).filter(
+            EvidenceBlob.evidence_hash.in_(self._hashes)
+        ).all()
+        self._bodies = {r.evidence_hash: r.body for r in rows}
+
+    def get(self, inline, evidence_hash) -> str:
+        """인라인 본문이 있으면 그대로, 없으면 evidence_blobs에서 압축 해제"""
+        if inline:
+            return inline
+        if not evidence_hash:
+            return inline or ""
+        if evidence_hash in self._texts:
+            return self._texts[evidence_hash]
+        if self._bodies is None:
+            self._load()
+        text = decompress_evidence(self._bodies.get(evidence_hash))
+        self._texts[evidence_hash] = text
+        return text
@@ -0,0 +1,6 @@
+USE kisa_security;
+
+-- (server_id, item_code)별 raw_evidence SHA-256 다이제스트.
+-- 점검 파이프라인은 다이제스트/상태가 이전과 같으면 raw_evidence를 다시 쓰지 않고 scan_date만 갱신한다.
+ALTER TABLE scan_history
+    ADD COLUMN evidence_hash CHAR(64) DEFAULT NULL AFTER raw_evidence;
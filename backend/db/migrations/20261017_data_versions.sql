@@ -0,0 +1,15 @@
+USE kisa_security;
+
+-- 회사별 데이터 버전
+-- 점검/조치 적재, 점수 재계산, 예외 등록/삭제, 서버 등록/삭제 후 해당 회사의 version을 1 올린다.
+-- 조회 API(/api/dashboard/data, /api/analysis/servers...)는 이 값으로 ETag를 만들고
+-- If-None-Match가 일치하면 DB를 읽지 않고 304로 응답한다. (backend/core/etag.py)
+CREATE TABLE IF NOT EXISTS data_versions (
+    company         VARCHAR(100)    PRIMARY KEY,
+    version         BIGINT          NOT NULL DEFAULT 0,
+    updated_at      DATETIME        NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 기존 회사 초기값
+INSERT IGNORE INTO data_versions (company, version, updated_at)
+SELECT DISTINCT company, 1, NOW() FROM servers;
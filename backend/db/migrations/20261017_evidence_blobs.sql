@@ -0,0 +1,18 @@
+USE kisa_security;
+
+-- raw_evidence 콘텐츠 주소 저장소: SHA-256 다이제스트 → zlib 압축 본문.
+-- 동일한 호스트들이 만드는 동일 evidence는 한 번만 저장된다.
+CREATE TABLE IF NOT EXISTS evidence_blobs (
+    evidence_hash   CHAR(64)        PRIMARY KEY,
+    body            LONGBLOB        NOT NULL,
+    raw_size        INT             NOT NULL,
+    created_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 새 행은 evidence_hash만 기록하고 raw_evidence는 비워 둔다 (기존 행의 인라인 본문은 그대로 유지).
+ALTER TABLE scan_history
+    MODIFY COLUMN raw_evidence LONGTEXT NULL;
+
+ALTER TABLE remediation_logs
+    MODIFY COLUMN raw_evidence LONGTEXT NULL,
+    ADD COLUMN evidence_hash CHAR(64) DEFAULT NULL AFTER raw_evidence;
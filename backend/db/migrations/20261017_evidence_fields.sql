@@ -0,0 +1,20 @@
+USE kisa_security;
+
+-- raw_evidence에서 적재 시 한 번만 추출한 필드 (조회 API / 엑셀 보고서는 이 컬럼만 읽는다).
+-- NULL이면 추출 이전 행이므로 읽는 쪽에서 raw_evidence를 파싱해 폴백한다.
+-- scan_history.evidence_hash(20261017_add_scan_history_evidence_hash.sql) 이후에 적용한다.
+ALTER TABLE scan_history
+    ADD COLUMN evidence_detail      TEXT DEFAULT NULL AFTER evidence_hash,
+    ADD COLUMN evidence_command     TEXT DEFAULT NULL AFTER evidence_detail,
+    ADD COLUMN evidence_guide       TEXT DEFAULT NULL AFTER evidence_command,
+    ADD COLUMN evidence_target_file TEXT DEFAULT NULL AFTER evidence_guide;
+
+ALTER TABLE remediation_logs
+    ADD COLUMN evidence_detail      TEXT DEFAULT NULL AFTER evidence_hash,
+    ADD COLUMN evidence_command     TEXT DEFAULT NULL AFTER evidence_detail,
+    ADD COLUMN evidence_guide       TEXT DEFAULT NULL AFTER evidence_command,
+    ADD COLUMN evidence_target_file TEXT DEFAULT NULL AFTER evidence_guide;
+
+-- evidence_hash를 비워 다음 파이프라인 실행 때 기존 점검 행도 다시 기록되도록 한다.
+-- (다이제스트가 같으면 UPSERT를 건너뛰므로, 비우지 않으면 evidence_* 컬럼이 채워지지 않는다)
+UPDATE scan_history SET evidence_hash = NULL;
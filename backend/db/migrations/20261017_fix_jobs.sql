@@ -0,0 +1,22 @@
+USE kisa_security;
+
+-- 자동조치 작업 레지스트리
+-- 조치 시작 시 job_id(Job API 대표 작업)별 대상 서버/항목과 OS/DB 하위 작업 ID를 저장한다.
+-- API 프로세스 메모리에 두지 않으므로 uvicorn 워커가 여럿이거나 재시작되어도
+-- 진행률/결과 조회(/api/fix/progress, /api/fix/result)가 같은 작업을 찾는다.
+-- status는 진행률 조회에서 completed / failed가 확인되면 갱신된다.
+-- 행은 Job API 작업 생성 전에 run_id를 job_id로 먼저 저장(queued)하고, 생성 후 대표 job_id로 바꾼다.
+-- 작업 생성에 실패하면 failed로 남는다.
+CREATE TABLE IF NOT EXISTS fix_jobs (
+    job_id          VARCHAR(64)     PRIMARY KEY,
+    status          VARCHAR(20)     NOT NULL DEFAULT 'queued',
+    os_job_id       VARCHAR(64)     DEFAULT NULL,
+    db_job_id       VARCHAR(64)     DEFAULT NULL,
+    server_ids      JSON            NOT NULL,
+    item_codes      JSON            NOT NULL,
+    per_server      JSON            NOT NULL,
+    total_items     INT             NOT NULL DEFAULT 0,
+    created_at      DATETIME        NOT NULL,
+    finished_at     DATETIME        DEFAULT NULL,
+    KEY idx_fix_jobs_status (status, created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -0,0 +1,40 @@
+USE kisa_security;
+
+-- ============================================================
+-- 목록 API keyset 페이지네이션 인덱스 (backend/core/pagination.py)
+-- 정렬 키 전체를 인덱스 순서와 맞춰 (k1, k2) < (v1, v2) 조건을 범위 스캔으로 처리한다.
+-- 쿼리 플랜 회귀 검사: python3 scripts/dev/explain_queries.py
+-- ============================================================
+
+
+-- ============================================================
+-- 1. scan_history  (GET /api/analysis/history?kind=scans)
+-- ============================================================
+
+-- 회사 전체 이력: ORDER BY scan_date DESC, server_id DESC, item_code DESC
+ALTER TABLE scan_history
+  ADD INDEX idx_sh_date_server_item (scan_date, server_id, item_code);
+
+
+-- ============================================================
+-- 2. remediation_logs  (GET /api/analysis/history?kind=remediations)
+-- ============================================================
+
+-- 회사 전체 이력: ORDER BY action_date DESC, log_id DESC
+ALTER TABLE remediation_logs
+  ADD INDEX idx_rl_date_log (action_date, log_id);
+
+-- 서버 필터: server_id = ? ORDER BY action_date DESC, log_id DESC
+ALTER TABLE remediation_logs
+  ADD INDEX idx_rl_server_date_log (server_id, action_date, log_id);
+
+
+-- ============================================================
+-- 3. exceptions  (GET /api/exceptions)
+-- ============================================================
+
+-- ORDER BY valid_date DESC, exception_id DESC (+ 활성/만료 필터)
+ALTER TABLE exceptions
+  ADD INDEX idx_ex_valid_id (valid_date, exception_id);
+
+-- servers (GET /api/assets) 는 PK(id) 순서로 페이지네이션하므로 추가 인덱스 불필요
@@ -0,0 +1,54 @@
+USE kisa_security;
+
+-- ============================================================
+-- 라우터/파이프라인 쿼리 형태에 맞춘 보조 인덱스
+-- 쿼리 플랜 회귀 검사: python3 scripts/dev/explain_queries.py
+-- ============================================================
+
+
+-- ============================================================
+-- 1. servers
+-- ============================================================
+
+-- 모든 API가 company + is_active로 서버를 거른 뒤 server_id로 조인한다 (커버링)
+ALTER TABLE servers
+  ADD INDEX idx_servers_company_active (company, is_active, server_id);
+
+
+-- ============================================================
+-- 2. scan_history
+-- ============================================================
+
+-- 서버별 상태 집계 / 취약 항목 조회 (server_id = ? AND status = ? → item_code)
+ALTER TABLE scan_history
+  ADD INDEX idx_sh_server_status_item (server_id, status, item_code);
+
+-- 서버별 최신 scan_date (MAX(scan_date) GROUP BY server_id), 점검 이력 정렬
+ALTER TABLE scan_history
+  ADD INDEX idx_sh_server_date (server_id, scan_date);
+
+
+-- ============================================================
+-- 3. remediation_logs
+-- ============================================================
+
+-- 항목별 최신 조치 (MAX(log_id) WHERE server_id = ? GROUP BY item_code)
+ALTER TABLE remediation_logs
+  ADD INDEX idx_rl_server_item_log (server_id, item_code, log_id);
+
+-- 조치 결과 조회 (server_id IN, item_code IN, action_date >= ?)
+ALTER TABLE remediation_logs
+  ADD INDEX idx_rl_server_item_date (server_id, item_code, action_date);
+
+
+-- ============================================================
+-- 4. exceptions
+-- ============================================================
+
+-- 서버별 활성 예외 (server_id = ? AND valid_date > NOW())
+ALTER TABLE exceptions
+  ADD INDEX idx_ex_server_item_valid (server_id, item_code, valid_date);
+
+-- 전체 활성 예외 (점수 재계산: valid_date > NOW() → DISTINCT server_id, item_code)
+ALTER TABLE exceptions
+  ADD INDEX idx_ex_valid_server_item (valid_date, server_id, item_code);
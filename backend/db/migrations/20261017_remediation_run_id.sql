@@ -0,0 +1,13 @@
+USE kisa_security;
+
+-- 조치 실행 단위(run_id)
+-- start_fix / start_batch_fix가 run_id를 만들어 조치 실행 파일(/tmp/audit/fix_runs/<run_id>/) → run.sh(FIX_RUN_ID)
+-- → parse_fix_result로 전달하고, remediation_logs 행에 함께 저장한다.
+-- 조치 결과 조회(/api/fix/result)는 최근 10분 범위 대신 run_id로 해당 실행의 행만 읽는다.
+-- 기존 행은 NULL로 남는다. (run_id가 없는 작업은 시간 범위 조회로 폴백)
+ALTER TABLE remediation_logs
+    ADD COLUMN run_id VARCHAR(32) DEFAULT NULL AFTER evidence_target_file,
+    ADD KEY idx_rl_run (run_id, server_id, item_code);
+
+ALTER TABLE fix_jobs
+    ADD COLUMN run_id VARCHAR(32) DEFAULT NULL AFTER job_id;
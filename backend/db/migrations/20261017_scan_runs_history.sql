@@ -0,0 +1,48 @@
+USE kisa_security;
+
+-- 파이프라인 점검 실행 단위 (scan_results_history.run_id)
+CREATE TABLE IF NOT EXISTS scan_runs (
+    run_id          INT AUTO_INCREMENT PRIMARY KEY,
+    scan_date       DATETIME        NOT NULL,
+    source          VARCHAR(20)     NOT NULL DEFAULT 'pipeline',
+    status          VARCHAR(20)     NOT NULL DEFAULT 'running',
+    server_count    INT             NOT NULL DEFAULT 0,
+    result_count    INT             NOT NULL DEFAULT 0,
+    changed_count   INT             NOT NULL DEFAULT 0,
+    failed_count    INT             NOT NULL DEFAULT 0,
+    started_at      DATETIME        NOT NULL,
+    finished_at     DATETIME        DEFAULT NULL,
+    KEY idx_scan_runs_date (scan_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 점검 결과 append-only 이력 (scan_history는 최신 상태만 유지)
+-- 월 단위 RANGE 파티션: 기간/시점 조회는 scan_date 조건으로 해당 월 파티션만 읽는다.
+-- 파티션 테이블은 FK를 가질 수 없으므로 server_id/item_code 참조 무결성은 파이프라인이 보장한다.
+-- 다음 달 파티션은 파이프라인이 실행 시 자동으로 추가한다. (DBConnector.ensure_history_partitions)
+CREATE TABLE IF NOT EXISTS scan_results_history (
+    run_id          INT             NOT NULL,
+    server_id       VARCHAR(100)    NOT NULL,
+    item_code       VARCHAR(10)     NOT NULL,
+    status          VARCHAR(10)     NOT NULL,
+    evidence_hash   CHAR(64)        DEFAULT NULL,
+    scan_date       DATETIME        NOT NULL,
+    PRIMARY KEY (server_id, scan_date, item_code, run_id),
+    KEY idx_srh_run (run_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+PARTITION BY RANGE COLUMNS (scan_date) (
+    PARTITION p_old    VALUES LESS THAN ('2026-10-01'),
+    PARTITION p202610  VALUES LESS THAN ('2026-11-01'),
+    PARTITION p202611  VALUES LESS THAN ('2026-12-01'),
+    PARTITION p202612  VALUES LESS THAN ('2027-01-01'),
+    PARTITION pmax     VALUES LESS THAN (MAXVALUE)
+);
+
+-- 현재 scan_history 상태를 첫 스냅샷으로 적재한다.
+INSERT INTO scan_runs (scan_date, source, status, server_count, result_count, started_at, finished_at)
+SELECT COALESCE(MAX(scan_date), NOW()), 'migration', 'completed',
+       COUNT(DISTINCT server_id), COUNT(*), NOW(), NOW()
+FROM scan_history;
+
+INSERT INTO scan_results_history (run_id, server_id, item_code, status, evidence_hash, scan_date)
+SELECT LAST_INSERT_ID(), server_id, item_code, status, evidence_hash, scan_date
+FROM scan_history;
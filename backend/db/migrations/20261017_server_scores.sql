@@ -0,0 +1,44 @@
+USE kisa_security;
+
+-- 서버별 / (서버, OS·DB, 카테고리)별 보안 점수를 저장한다.
+-- scan 파이프라인과 예외 등록/삭제 API가 영향을 받은 서버만 다시 계산한다. (backend/db/scores.py)
+-- 적용 후 `python3 backend/run_pipeline.py score` 를 한 번 실행해 기존 데이터를 채운다.
+-- 예외 만료(valid_date 경과)는 다음 scan/score 실행 때 반영된다.
+CREATE TABLE IF NOT EXISTS server_scores (
+    server_id       VARCHAR(100)    PRIMARY KEY,
+    total_items     INT             NOT NULL DEFAULT 0,
+    secure_count    INT             NOT NULL DEFAULT 0,
+    vulnerable_count INT            NOT NULL DEFAULT 0,
+    pass_count      INT             NOT NULL DEFAULT 0,
+    fail_count      INT             NOT NULL DEFAULT 0,
+    exception_count INT             NOT NULL DEFAULT 0,
+    vuln_high       INT             NOT NULL DEFAULT 0,
+    vuln_medium     INT             NOT NULL DEFAULT 0,
+    vuln_low        INT             NOT NULL DEFAULT 0,
+    total_weight    INT             NOT NULL DEFAULT 0,
+    pass_weight     INT             NOT NULL DEFAULT 0,
+    score           DECIMAL(5,1)    NOT NULL DEFAULT 0,
+    updated_at      DATETIME        NOT NULL,
+    FOREIGN KEY (server_id) REFERENCES servers(server_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS server_category_scores (
+    server_id       VARCHAR(100)    NOT NULL,
+    item_type       VARCHAR(2)      NOT NULL,
+    category        VARCHAR(50)     NOT NULL,
+    total_items     INT             NOT NULL DEFAULT 0,
+    secure_count    INT             NOT NULL DEFAULT 0,
+    vulnerable_count INT            NOT NULL DEFAULT 0,
+    pass_count      INT             NOT NULL DEFAULT 0,
+    fail_count      INT             NOT NULL DEFAULT 0,
+    exception_count INT             NOT NULL DEFAULT 0,
+    vuln_high       INT             NOT NULL DEFAULT 0,
+    vuln_medium     INT             NOT NULL DEFAULT 0,
+    vuln_low        INT             NOT NULL DEFAULT 0,
+    total_weight    INT             NOT NULL DEFAULT 0,
+    pass_weight     INT             NOT NULL DEFAULT 0,
+    score           DECIMAL(5,1)    NOT NULL DEFAULT 0,
+    updated_at      DATETIME        NOT NULL,
+    PRIMARY KEY (server_id, item_type, category),
+    FOREIGN KEY (server_id) REFERENCES servers(server_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
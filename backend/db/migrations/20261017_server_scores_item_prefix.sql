@@ -0,0 +1,14 @@
+USE kisa_security;
+
+-- server_category_scores를 항목 코드 접두어(U / D / PG-D / MY-D)별로 나눠 저장한다.
+-- 대시보드의 DB 카테고리/TOP 5는 기존처럼 'D-' 항목만 센다. (api/dashboard.py)
+-- 20261017_server_scores.sql 이후에 적용한다.
+ALTER TABLE server_category_scores
+    ADD COLUMN item_prefix VARCHAR(10) NOT NULL DEFAULT '' AFTER item_type,
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (server_id, item_type, item_prefix, category);
+
+-- 기존 행은 접두어 없이 합산된 값이므로 비운다. 적용 후 점수를 다시 계산한다:
+--   ./run.sh score
+DELETE FROM server_category_scores;
+DELETE FROM server_scores;
@@ -6,7 +6,7 @@ SQLAlchemy ORM 모델
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Boolean, DateTime, Text,
-    ForeignKey, VARCHAR
+    ForeignKey, VARCHAR, CHAR, LargeBinary, Numeric, BigInteger, JSON
 )
 from sqlalchemy.orm import relationship
 from .base import Base
@@ -56,6 +56,16 @@ class KisaItem(Base):
     exceptions = relationship("Exception", back_populates="kisa_item")
 
 
+class EvidenceBlob(Base):
+    """raw_evidence 콘텐츠 주소 저장소 (SHA-256 → zlib 압축 본문)"""
+    __tablename__ = "evidence_blobs"
+
+    evidence_hash = Column(CHAR(64), primary_key=True)
+    body = Column(LargeBinary(length=2**32 - 1), nullable=False)
+    raw_size = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+
 class ScanHistory(Base):
     """점검 이력 테이블"""
     __tablename__ = "scan_history"
@@ -64,7 +74,12 @@ class ScanHistory(Base):
     server_id = Column(VARCHAR(100), ForeignKey("servers.server_id"), nullable=False)
     item_code = Column(VARCHAR(10), ForeignKey("kisa_items.item_code"), nullable=False)
     status = Column(VARCHAR(10), nullable=False)
-    raw_evidence = Column(Text, nullable=False)
+    raw_evidence = Column(Text, nullable=True)
+    evidence_hash = Column(CHAR(64), nullable=True)
+    evidence_detail = Column(Text, nullable=True)
+    evidence_command = Column(Text, nullable=True)
+    evidence_guide = Column(Text, nullable=True)
+    evidence_target_file = Column(Text, nullable=True)
     scan_date = Column(DateTime, nullable=False)
 
     # Relationships
@@ -72,6 +87,34 @@ class ScanHistory(Base):
     kisa_item = relationship("KisaItem", back_populates="scan_history")
 
 
+class ScanRun(Base):
+    """파이프라인 점검 실행 단위"""
+    __tablename__ = "scan_runs"
+
+    run_id = Column(Integer, primary_key=True, autoincrement=True)
+    scan_date = Column(DateTime, nullable=False)
+    source = Column(VARCHAR(20), nullable=False, default="pipeline")
+    status = Column(VARCHAR(20), nullable=False, default="running")
+    server_count = Column(Integer, nullable=False, default=0)
+    result_count = Column(Integer, nullable=False, default=0)
+    changed_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+
+
+class ScanResultHistory(Base):
+    """점검 결과 append-only 이력 (scan_date 월 파티션, FK 없음)"""
+    __tablename__ = "scan_results_history"
+
+    run_id = Column(Integer, primary_key=True)
+    server_id = Column(VARCHAR(100), primary_key=True)
+    item_code = Column(VARCHAR(10), primary_key=True)
+    status = Column(VARCHAR(10), nullable=False)
+    evidence_hash = Column(CHAR(64), nullable=True)
+    scan_date = Column(DateTime, primary_key=True)
+
+
 class RemediationLog(Base):
     """조치 이력 테이블"""
     __tablename__ = "remediation_logs"
@@ -82,7 +125,13 @@ class RemediationLog(Base):
     action_date = Column(DateTime, nullable=False)
     is_success = Column(Boolean, nullable=False)
     failure_reason = Column(VARCHAR(500), nullable=True)
-    raw_evidence = Column(Text, nullable=False)
+    raw_evidence = Column(Text, nullable=True)
+    evidence_hash = Column(CHAR(64), nullable=True)
+    evidence_detail = Column(Text, nullable=True)
+    evidence_command = Column(Text, nullable=True)
+    evidence_guide = Column(Text, nullable=True)
+    evidence_target_file = Column(Text, nullable=True)
+    run_id = Column(VARCHAR(32), nullable=True)
 
     # Relationships
     server = relationship("Server", back_populates="remediation_logs")
@@ -104,6 +153,75 @@ class Exception(Base):
     kisa_item = relationship("KisaItem", back_populates="exceptions")
 
 
+class ServerScore(Base):
+    """서버별 보안 점수 (db/scores.py가 갱신)"""
+    __tablename__ = "server_scores"
+
+    server_id = Column(VARCHAR(100), ForeignKey("servers.server_id"), primary_key=True)
+    total_items = Column(Integer, nullable=False, default=0)
+    secure_count = Column(Integer, nullable=False, default=0)
+    vulnerable_count = Column(Integer, nullable=False, default=0)
+    pass_count = Column(Integer, nullable=False, default=0)
+    fail_count = Column(Integer, nullable=False, default=0)
+    exception_count = Column(Integer, nullable=False, default=0)
+    vuln_high = Column(Integer, nullable=False, default=0)
+    vuln_medium = Column(Integer, nullable=False, default=0)
+    vuln_low = Column(Integer, nullable=False, default=0)
+    total_weight = Column(Integer, nullable=False, default=0)
+    pass_weight = Column(Integer, nullable=False, default=0)
+    score = Column(Numeric(5, 1), nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class ServerCategoryScore(Base):
+    """서버 × OS/DB × 항목 접두어 × 카테고리별 보안 점수 (db/scores.py가 갱신)"""
+    __tablename__ = "server_category_scores"
+
+    server_id = Column(VARCHAR(100), ForeignKey("servers.server_id"), primary_key=True)
+    item_type = Column(VARCHAR(2), primary_key=True)  # 'OS' / 'DB'
+    item_prefix = Column(VARCHAR(10), primary_key=True)  # 항목 코드 번호 앞부분 'U' / 'D' / 'PG-D' / 'MY-D'
+    category = Column(VARCHAR(50), primary_key=True)
+    total_items = Column(Integer, nullable=False, default=0)
+    secure_count = Column(Integer, nullable=False, default=0)
+    vulnerable_count = Column(Integer, nullable=False, default=0)
+    pass_count = Column(Integer, nullable=False, default=0)
+    fail_count = Column(Integer, nullable=False, default=0)
+    exception_count = Column(Integer, nullable=False, default=0)
+    vuln_high = Column(Integer, nullable=False, default=0)
+    vuln_medium = Column(Integer, nullable=False, default=0)
+    vuln_low = Column(Integer, nullable=False, default=0)
+    total_weight = Column(Integer, nullable=False, default=0)
+    pass_weight = Column(Integer, nullable=False, default=0)
+    score = Column(Numeric(5, 1), nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class DataVersion(Base):
+    """회사별 데이터 버전 (db/data_version.py가 갱신, 조회 API ETag 기준)"""
+    __tablename__ = "data_versions"
+
+    company = Column(VARCHAR(100), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class FixJob(Base):
+    """자동조치 작업 레지스트리 (job_id → 대상 서버/항목, OS/DB 하위 작업)"""
+    __tablename__ = "fix_jobs"
+
+    job_id = Column(VARCHAR(64), primary_key=True)
+    run_id = Column(VARCHAR(32), nullable=True)
+    status = Column(VARCHAR(20), nullable=False, default="queued")
+    os_job_id = Column(VARCHAR(64), nullable=True)
+    db_job_id = Column(VARCHAR(64), nullable=True)
+    server_ids = Column(JSON, nullable=False)
+    item_codes = Column(JSON, nullable=False)
+    per_server = Column(JSON, nullable=False)
+    total_items = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+
+
 class User(Base):
     """사용자 테이블"""
     __tablename__ = "users"
@@ -18,7 +18,8 @@ CREATE TABLE IF NOT EXISTS servers (
     db_passwd       LONGTEXT    NOT NULL,
     is_active       BOOLEAN         NOT NULL DEFAULT 1,
     manager         VARCHAR(100)    NOT NULL,
-    department      VARCHAR(100)    NOT NULL
+    department      VARCHAR(100)    NOT NULL,
+    KEY idx_servers_company_active (company, is_active, server_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE TABLE IF NOT EXISTS kisa_items (
@@ -32,18 +33,70 @@ CREATE TABLE IF NOT EXISTS kisa_items (
     guide                   VARCHAR(1000)   NOT NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+CREATE TABLE IF NOT EXISTS evidence_blobs (
+    evidence_hash   CHAR(64)        PRIMARY KEY,
+    body            LONGBLOB        NOT NULL,
+    raw_size        INT             NOT NULL,
+    created_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 CREATE TABLE IF NOT EXISTS scan_history (
     scan_id         INT AUTO_INCREMENT PRIMARY KEY,
     server_id       VARCHAR(100)    NOT NULL,
     item_code       VARCHAR(10)     NOT NULL,
     status          VARCHAR(10)     NOT NULL,
-    raw_evidence    LONGTEXT        NOT NULL,
+    raw_evidence    LONGTEXT        DEFAULT NULL,
+    evidence_hash   CHAR(64)        DEFAULT NULL,
+    evidence_detail         TEXT    DEFAULT NULL,
+    evidence_command        TEXT    DEFAULT NULL,
+    evidence_guide          TEXT    DEFAULT NULL,
+    evidence_target_file    TEXT    DEFAULT NULL,
     scan_date       DATETIME        NOT NULL,
     UNIQUE KEY uq_server_item (server_id, item_code),
+    KEY idx_sh_server_status_item (server_id, status, item_code),
+    KEY idx_sh_server_date (server_id, scan_date),
+    KEY idx_sh_date_server_item (scan_date, server_id, item_code),
     FOREIGN KEY (server_id) REFERENCES servers(server_id),
     FOREIGN KEY (item_code) REFERENCES kisa_items(item_code)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+-- 파이프라인 점검 실행 단위 (scan_results_history.run_id)
+CREATE TABLE IF NOT EXISTS scan_runs (
+    run_id          INT AUTO_INCREMENT PRIMARY KEY,
+    scan_date       DATETIME        NOT NULL,
+    source          VARCHAR(20)     NOT NULL DEFAULT 'pipeline',
+    status          VARCHAR(20)     NOT NULL DEFAULT 'running',
+    server_count    INT             NOT NULL DEFAULT 0,
+    result_count    INT             NOT NULL DEFAULT 0,
+    changed_count   INT             NOT NULL DEFAULT 0,
+    failed_count    INT             NOT NULL DEFAULT 0,
+    started_at      DATETIME        NOT NULL,
+    finished_at     DATETIME        DEFAULT NULL,
+    KEY idx_scan_runs_date (scan_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 점검 결과 append-only 이력 (scan_history는 최신 상태만 유지)
+-- 월 단위 RANGE 파티션: 기간/시점 조회는 scan_date 조건으로 해당 월 파티션만 읽는다.
+-- 파티션 테이블은 FK를 가질 수 없으므로 server_id/item_code 참조 무결성은 파이프라인이 보장한다.
+-- 다음 달 파티션은 파이프라인이 실행 시 자동으로 추가한다. (DBConnector.ensure_history_partitions)
+CREATE TABLE IF NOT EXISTS scan_results_history (
+    run_id          INT             NOT NULL,
+    server_id       VARCHAR(100)    NOT NULL,
+    item_code       VARCHAR(10)     NOT NULL,
+    status          VARCHAR(10)     NOT NULL,
+    evidence_hash   CHAR(64)        DEFAULT NULL,
+    scan_date       DATETIME        NOT NULL,
+    PRIMARY KEY (server_id, scan_date, item_code, run_id),
+    KEY idx_srh_run (run_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+PARTITION BY RANGE COLUMNS (scan_date) (
+    PARTITION p_old    VALUES LESS THAN ('2026-10-01'),
+    PARTITION p202610  VALUES LESS THAN ('2026-11-01'),
+    PARTITION p202611  VALUES LESS THAN ('2026-12-01'),
+    PARTITION p202612  VALUES LESS THAN ('2027-01-01'),
+    PARTITION pmax     VALUES LESS THAN (MAXVALUE)
+);
+
 CREATE TABLE IF NOT EXISTS remediation_logs (
     log_id          INT AUTO_INCREMENT PRIMARY KEY,
     server_id       VARCHAR(100)    NOT NULL,
@@ -51,7 +104,18 @@ CREATE TABLE IF NOT EXISTS remediation_logs (
     action_date     DATETIME        NOT NULL,
     is_success      BOOLEAN         NOT NULL,
     failure_reason  VARCHAR(500)    DEFAULT NULL,
-    raw_evidence    LONGTEXT        NOT NULL,
+    raw_evidence    LONGTEXT        DEFAULT NULL,
+    evidence_hash   CHAR(64)        DEFAULT NULL,
+    evidence_detail         TEXT    DEFAULT NULL,
+    evidence_command        TEXT    DEFAULT NULL,
+    evidence_guide          TEXT    DEFAULT NULL,
+    evidence_target_file    TEXT    DEFAULT NULL,
+    run_id          VARCHAR(32)     DEFAULT NULL,
+    KEY idx_rl_server_item_log (server_id, item_code, log_id),
+    KEY idx_rl_server_item_date (server_id, item_code, action_date),
+    KEY idx_rl_date_log (action_date, log_id),
+    KEY idx_rl_server_date_log (server_id, action_date, log_id),
+    KEY idx_rl_run (run_id, server_id, item_code),
     FOREIGN KEY (server_id) REFERENCES servers(server_id),
     FOREIGN KEY (item_code) REFERENCES kisa_items(item_code)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -62,10 +126,77 @@ CREATE TABLE IF NOT EXISTS exceptions (
     item_code       VARCHAR(10)     NOT NULL,
     reason          VARCHAR(500)    NOT NULL,
     valid_date      DATETIME        NOT NULL,
+    KEY idx_ex_server_item_valid (server_id, item_code, valid_date),
+    KEY idx_ex_valid_server_item (valid_date, server_id, item_code),
+    KEY idx_ex_valid_id (valid_date, exception_id),
     FOREIGN KEY (server_id) REFERENCES servers(server_id),
     FOREIGN KEY (item_code) REFERENCES kisa_items(item_code)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+-- 서버별 보안 점수 (파이프라인/예외 API가 갱신, 대시보드·분석 화면은 이 테이블만 읽음)
+CREATE TABLE IF NOT EXISTS server_scores (
+    server_id       VARCHAR(100)    PRIMARY KEY,
+    total_items     INT             NOT NULL DEFAULT 0,
+    secure_count    INT             NOT NULL DEFAULT 0,
+    vulnerable_count INT            NOT NULL DEFAULT 0,
+    pass_count      INT             NOT NULL DEFAULT 0,
+    fail_count      INT             NOT NULL DEFAULT 0,
+    exception_count INT             NOT NULL DEFAULT 0,
+    vuln_high       INT             NOT NULL DEFAULT 0,
+    vuln_medium     INT             NOT NULL DEFAULT 0,
+    vuln_low        INT             NOT NULL DEFAULT 0,
+    total_weight    INT             NOT NULL DEFAULT 0,
+    pass_weight     INT             NOT NULL DEFAULT 0,
+    score           DECIMAL(5,1)    NOT NULL DEFAULT 0,
+    updated_at      DATETIME        NOT NULL,
+    FOREIGN KEY (server_id) REFERENCES servers(server_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS server_category_scores (
+    server_id       VARCHAR(100)    NOT NULL,
+    item_type       VARCHAR(2)      NOT NULL,
+    item_prefix     VARCHAR(10)     NOT NULL,
+    category        VARCHAR(50)     NOT NULL,
+    total_items     INT             NOT NULL DEFAULT 0,
+    secure_count    INT             NOT NULL DEFAULT 0,
+    vulnerable_count INT            NOT NULL DEFAULT 0,
+    pass_count      INT             NOT NULL DEFAULT 0,
+    fail_count      INT             NOT NULL DEFAULT 0,
+    exception_count INT             NOT NULL DEFAULT 0,
+    vuln_high       INT             NOT NULL DEFAULT 0,
+    vuln_medium     INT             NOT NULL DEFAULT 0,
+    vuln_low        INT             NOT NULL DEFAULT 0,
+    total_weight    INT             NOT NULL DEFAULT 0,
+    pass_weight     INT             NOT NULL DEFAULT 0,
+    score           DECIMAL(5,1)    NOT NULL DEFAULT 0,
+    updated_at      DATETIME        NOT NULL,
+    PRIMARY KEY (server_id, item_type, item_prefix, category),
+    FOREIGN KEY (server_id) REFERENCES servers(server_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 회사별 데이터 버전 (적재/예외/서버 변경 시 증가, 조회 API ETag 기준 → db/data_version.py)
+CREATE TABLE IF NOT EXISTS data_versions (
+    company         VARCHAR(100)    PRIMARY KEY,
+    version         BIGINT          NOT NULL DEFAULT 0,
+    updated_at      DATETIME        NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 자동조치 작업 레지스트리 (API 워커/재시작과 무관하게 job_id로 대상/하위 작업 조회 → services/fix_service.py)
+CREATE TABLE IF NOT EXISTS fix_jobs (
+    job_id          VARCHAR(64)     PRIMARY KEY,
+    run_id          VARCHAR(32)     DEFAULT NULL,
+    status          VARCHAR(20)     NOT NULL DEFAULT 'queued',
+    os_job_id       VARCHAR(64)     DEFAULT NULL,
+    db_job_id       VARCHAR(64)     DEFAULT NULL,
+    server_ids      JSON            NOT NULL,
+    item_codes      JSON            NOT NULL,
+    per_server      JSON            NOT NULL,
+    total_items     INT             NOT NULL DEFAULT 0,
+    created_at      DATETIME        NOT NULL,
+    finished_at     DATETIME        DEFAULT NULL,
+    KEY idx_fix_jobs_status (status, created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 CREATE TABLE IF NOT EXISTS users (
     user_id         INT AUTO_INCREMENT PRIMARY KEY,
     user_name       VARCHAR(100)    NOT NULL UNIQUE,
@@ -0,0 +1,163 @@
+"""
+scores.py
+server_scores / server_category_scores 갱신 SQL
+
+- 점수 규칙은 이 모듈 한 곳에서만 정의한다. (유효한 예외 항목은 '양호', severity 가중치 적용)
+  run_pipeline score <id>(calculate_score), 엑셀 보고서, 대시보드/분석 API는 모두 이 테이블을 읽는다.
+- 집계 대상은 scan_history의 현재 행 전체다. ((server_id, item_code)당 1행, UPSERT)
+  scan-db만 실행한 뒤에도 OS 행은 이전 scan_date로 남아 있으므로 최신 scan_date로 거르지 않는다.
+  (대시보드/분석 화면의 기존 scan_history 집계와 같은 건수)
+- (server_id, item_type, item_prefix, category) 단위로 집계해 server_category_scores에 저장하고,
+  (item_prefix: 항목 코드의 번호 앞부분 'U' / 'D' / 'PG-D' / 'MY-D' → 대시보드는 기존처럼 'D-' 항목만 DB 카테고리로 센다)
+  server_scores는 그 결과를 서버 단위로 다시 합산한다. (scan_history를 한 번만 훑음)
+- 예외 만료는 시간이 지나서 일어나므로 갱신 시점의 NOW() 기준으로만 반영된다.
+  stale_servers_statement로 마지막 갱신 이후 예외가 만료된 서버를 찾아 다시 계산한다.
+- 파이프라인(DBConnector)과 API(SQLAlchemy 세션)가 같은 SQL을 쓰도록 %s 플레이스홀더
+  문장 목록으로 돌려준다. 파이프라인 환경에는 SQLAlchemy가 없으므로 표준 라이브러리만 사용한다.
+"""
+
+# severity별 가중치
+SEVERITY_WEIGHT = {
+    '상': 3,
+    '중': 2,
+    '하': 1,
+}
+
+# server_category_scores / server_scores 공통 집계 컬럼
+SCORE_COUNTERS = (
+    "total_items", "secure_count", "vulnerable_count",
+    "pass_count", "fail_count", "exception_count",
+    "vuln_high", "vuln_medium", "vuln_low",
+    "total_weight", "pass_weight",
+)
+
+_PASSED = "(ex.item_code IS NOT NULL OR sh.status = '양호')"
+
+_BREAKDOWN_SQL = """
+    SELECT
+        sh.server_id,
+        CASE WHEN SUBSTRING(sh.item_code, 1, 2) = 'U-' THEN 'OS' ELSE 'DB' END AS item_type,
+        LEFT(sh.item_code, CHAR_LENGTH(sh.item_code) - LOCATE('-', REVERSE(sh.item_code))) AS item_prefix,
+        ki.category,
+        COUNT(*) AS total_items,
+        SUM(CASE WHEN sh.status = '양호' THEN 1 ELSE 0 END) AS secure_count,
+        SUM(CASE WHEN sh.status = '취약' THEN 1 ELSE 0 END) AS vulnerable_count,
+        SUM(CASE WHEN {passed} THEN 1 ELSE 0 END) AS pass_count,
+        SUM(CASE WHEN {passed} THEN 0 ELSE 1 END) AS fail_count,
+        SUM(CASE WHEN ex.item_code IS NOT NULL THEN 1 ELSE 0 END) AS exception_count,
+        SUM(CASE WHEN sh.status = '취약' AND ki.severity = '상' THEN 1 ELSE 0 END) AS vuln_high,
+        SUM(CASE WHEN sh.status = '취약' AND ki.severity = '중' THEN 1 ELSE 0 END) AS vuln_medium,
+        SUM(CASE WHEN sh.status = '취약' AND ki.severity = '하' THEN 1 ELSE 0 END) AS vuln_low,
+        SUM({weight}) AS total_weight,
+        SUM(CASE WHEN {passed} THEN {weight} ELSE 0 END) AS pass_weight
+    FROM scan_history sh
+    JOIN kisa_items ki ON ki.item_code = sh.item_code
+    LEFT JOIN (
+        SELECT DISTINCT server_id, item_code
+        FROM exceptions
+        WHERE valid_date > NOW()
+    ) ex ON ex.server_id = sh.server_id AND ex.item_code = sh.item_code
+    {where}
+    GROUP BY sh.server_id, item_type, item_prefix, ki.category
+"""
+
+_SCORE_EXPR = "CASE WHEN {t} > 0 THEN ROUND({p} * 100 / {t}, 1) ELSE 0 END"
+
+
+def _in_clause(column, server_ids):
+    if server_ids is None:
+        return "", []
+    return f"WHERE {column} IN (" + ", ".join(["%s"] * len(server_ids)) + ")", list(server_ids)
+
+
+def refresh_statements(server_ids=None, severity_weight=SEVERITY_WEIGHT):
+    """
+    server_ids(None이면 전체)의 점수 테이블을 다시 계산하는 (sql, params) 목록
+
+    호출자는 목록 전체를 한 트랜잭션으로 실행해야 한다. (DELETE 후 INSERT ... SELECT)
+    """
+    if server_ids is not None:
+        server_ids = sorted(set(server_ids))
+        if not server_ids:
+            return []
+
+    weight = "CASE ki.severity " + " ".join(["WHEN %s THEN %s"] * len(severity_weight)) + " ELSE 1 END"
+    weight_params = [v for pair in severity_weight.items() for v in pair]
+    breakdown_where, breakdown_params = _in_clause("sh.server_id", server_ids)
+    breakdown = _BREAKDOWN_SQL.format(passed=_PASSED, weight=weight, where=breakdown_where)
+
+    where, where_params = _in_clause("server_id", server_ids)
+    cols = ", ".join(SCORE_COUNTERS)
+    sums = ", ".join(f"SUM({c})" for c in SCORE_COUNTERS)
+
+    return [
+        (f"DELETE FROM server_category_scores {where}", where_params),
+        (
+            f"""
+            INSERT INTO server_category_scores
+                (server_id, item_type, item_prefix, category, {cols}, score, updated_at)
+            SELECT b.server_id, b.item_type, b.item_prefix, b.category, {", ".join("b." + c for c in SCORE_COUNTERS)},
+                   {_SCORE_EXPR.format(p="b.pass_weight", t="b.total_weight")}, NOW()
+            FROM ({breakdown}) b
+            """,
+            weight_params * 2 + breakdown_params,
+        ),
+        (f"DELETE FROM server_scores {where}", where_params),
+        (
+            f"""
+            INSERT INTO server_scores (server_id, {cols}, score, updated_at)
+            SELECT server_id, {sums},
+                   {_SCORE_EXPR.format(p="SUM(pass_weight)", t="SUM(total_weight)")}, NOW()
+            FROM server_category_scores
+            {where}
+            GROUP BY server_id
+            """,
+            where_params,
+        ),
+    ]
+
+
+def stale_servers_statement(server_ids):
+    """
+    server_ids 중 점수를 다시 계산해야 하는 서버를 찾는 (sql, params). 대상이 비어 있으면 None
+
+    - 점검 결과는 있는데 server_scores 행이 없는 서버
+    - 마지막 갱신(updated_at) 이후 예외가 만료된 서버
+    """
+    server_ids = sorted(set(server_ids))
+    if not server_ids:
+        return None
+    ids = ", ".join(["%s"] * len(server_ids))
+    sql = f"""
+        SELECT s.server_id
+        FROM servers s
+        LEFT JOIN server_scores ss ON ss.server_id = s.server_id
+        WHERE s.server_id IN ({ids})
+          AND (
+              (ss.server_id IS NULL
+               AND EXISTS (SELECT 1 FROM scan_history sh WHERE sh.server_id = s.server_id))
+              OR EXISTS (
+                  SELECT 1 FROM exceptions ex
+                  WHERE ex.server_id = s.server_id
+                    AND ex.valid_date > ss.updated_at AND ex.valid_date <= NOW()
+              )
+          )
+    """
+    return sql, server_ids
+
+
+def refresh_scores_in_session(session, server_ids):
+    """
+    API(SQLAlchemy 세션)에서 예외 등록/삭제 후 해당 서버 점수만 갱신
+
+    점수는 파생 데이터이므로 실패해도 요청 자체는 실패시키지 않는다.
+    (다음 파이프라인 실행 시 다시 계산됨)
+    """
+    try:
+        conn = session.connection()
+        for sql, params in refresh_statements(server_ids):
+            conn.exec_driver_sql(sql, tuple(params))
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        print(f"[WARN] server_scores 갱신 실패 (server_ids={server_ids}): {e}")
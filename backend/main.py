@@ -2,15 +2,33 @@
 FastAPI 메인 애플리케이션
 - 인증 API
 - IP 필터링 미들웨어
+- 응답 압축 (br / gzip), orjson 응답 직렬화
 - CORS 설정
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from api import auth, assets, scan, dashboard, analysis, fix, exceptions, reports
-from core.config import ALLOWED_CIDRS, CORS_ORIGINS
-from core.middleware import IPFilterMiddleware
+from core.concurrency import configure_threadpool, shutdown_process_pool
+from core.job_client import job_api
+from core.config import (
+    ALLOWED_CIDRS, CORS_ORIGINS,
+    COMPRESSION_MIN_SIZE, COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY,
+)
+from core.middleware import IPFilterMiddleware, CompressionMiddleware
+from core.responses import FastJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """블로킹 작업용 스레드풀/프로세스 풀 설정 및 정리 (core/concurrency.py), Job API 커넥션 풀 정리"""
+    configure_threadpool()
+    yield
+    await job_api.aclose()
+    shutdown_process_pool()
 
 
 # FastAPI 앱 생성
@@ -19,7 +37,9 @@ app = FastAPI(
     description="KISA 보안 점검 프로젝트 REST API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 
@@ -36,6 +56,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (CORS 바깥에서 최종 본문을 압축)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MIN_SIZE,
+    gzip_level=COMPRESSION_GZIP_LEVEL,
+    brotli_quality=COMPRESSION_BROTLI_QUALITY,
+)
+
 # IP 필터링 미들웨어
 if ALLOWED_CIDRS:
     cidrs_str = ",".join(ALLOWED_CIDRS)
@@ -17,7 +17,6 @@ generate_report.py  (v3.1 - 가독성 개선)
 import os
 import sys
 import re
-import json
 import argparse
 from datetime import datetime, timedelta
 from collections import defaultdict
@@ -29,6 +28,7 @@ import xlsxwriter
 _backend_dir = os.path.realpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 sys.path.insert(0, _backend_dir)
 from db.connector import DBConnector
+from db.evidence import decompress_evidence, extract_evidence_fields
 from config import DB_CONFIG
 
 # ──────────────────────────────────────────────
@@ -82,9 +82,6 @@ CATEGORY_KR = {
 
 SEVERITY_KR = {'상': 'H', '중': 'M', '하': 'L'}
 
-# severity별 가중치 (score_calculator.py와 동일)
-SEVERITY_WEIGHT = {'상': 3, '중': 2, '하': 1}
-
 # 항목별 배점 (샘플4 형식 점수 표시용)
 ITEM_SCORE = {'상': 10, '중': 8, '하': 6}
 
@@ -151,7 +148,17 @@ def build_sheet_name_map(servers):
 
 
 def fetch_report_data(company=None):
-    """DB에서 보고서용 데이터 조회"""
+    """
+    DB에서 보고서용 데이터 조회
+
+    점수는 server_scores / server_category_scores를 읽는다. (대시보드/분석 화면과 같은 값 → db/scores.py)
+    점수 행이 없거나 마지막 갱신 이후 예외가 만료된 서버만 먼저 다시 계산한다.
+
+    Returns:
+        (servers, kisa_items, kisa_map, results, scores)
+        scores: {server_id: {score, pass_weight, total_weight,
+                             categories: {(item_type, category): {pass_weight, total_weight}}}}
+    """
     db = DBConnector()
     if not db.connect():
         raise RuntimeError("DB 연결 실패")
@@ -184,12 +191,39 @@ def fetch_report_data(company=None):
         sid = srv['server_id']
         server_exceptions[sid] = set(db.get_exceptions(sid) or [])
 
-    # 서버별 최신 점검 결과
+    # 서버별 점수 (materialized)
+    server_ids = [srv['server_id'] for srv in servers]
+    db.refresh_stale_server_scores(server_ids)
+    scores = {
+        r['server_id']: {
+            'score': float(r['score']),
+            'pass_weight': int(r['pass_weight']),
+            'total_weight': int(r['total_weight']),
+            'categories': {},
+        }
+        for r in db.get_server_scores(server_ids) or []
+    }
+    for r in db.get_server_category_scores(server_ids) or []:
+        if r['server_id'] in scores:
+            # DB는 항목 접두어(D / PG-D / MY-D)별 행을 합산
+            weights = scores[r['server_id']]['categories'].setdefault(
+                (r['item_type'], r['category']), {'pass_weight': 0, 'total_weight': 0}
+            )
+            weights['pass_weight'] += int(r['pass_weight'])
+            weights['total_weight'] += int(r['total_weight'])
+
+    # 서버별 현재 점검 결과 (점수 집계 대상과 같은 행)
     results = []
     for srv in servers:
         sid = srv['server_id']
-        rows = db.get_latest_scan(sid)
+        rows = db.get_current_scan(sid)
         if rows:
+            # evidence_detail이 없는(추출 이전) 행만 본문이 필요하므로 그 행의 blob만 서버 단위로 모아서 조회
+            legacy = [r for r in rows if r.get('evidence_detail') is None and not r.get('raw_evidence')]
+            blobs = db.get_evidence_blobs(r.get('evidence_hash') for r in legacy)
+            for r in legacy:
+                if r.get('evidence_hash') in blobs:
+                    r['raw_evidence'] = decompress_evidence(blobs[r['evidence_hash']])
             for r in rows:
                 raw_status = r['status']
                 is_exception = r['item_code'] in server_exceptions.get(sid, set())
@@ -210,12 +244,14 @@ def fetch_report_data(company=None):
                     'status':    effective_status,
                     'scan_date': str(r.get('scan_date', '')),
                     'raw_evidence': r.get('raw_evidence', ''),
+                    'evidence_detail': r.get('evidence_detail'),
+                    'evidence_command': r.get('evidence_command'),
                     'guide':     kisa_map.get(r['item_code'], {}).get('guide', ''),
                     'description': kisa_map.get(r['item_code'], {}).get('description', ''),
                 })
 
     db.disconnect()
-    return servers, kisa_items, kisa_map, results
+    return servers, kisa_items, kisa_map, results, scores
 
 
 def item_type(item_code):
@@ -232,70 +268,20 @@ def parse_evidence(raw_evidence):
     - detail: 사용자가 읽을 수 있는 한글 설명 (셀에 표시)
     - command: 점검에 사용된 명령어 (메모로 첨부)
 
-    NOTE: raw_evidence는 쉘 명령어 등으로 인해 이스케이프되지 않은
-    따옴표/제어문자를 포함할 수 있어 표준 json.loads()가 실패하는 경우가 많음.
-    단계별 fallback으로 최대한 detail을 추출한다.
+    NOTE: 적재 시 evidence_detail / evidence_command 컬럼에 미리 추출해 두므로
+    이 함수는 추출 이전에 적재된 행에만 사용된다.
+    """
+    fields = extract_evidence_fields(raw_evidence)
+    return fields['detail'], fields['command']
+
+
+def generate_report(servers, kisa_items, kisa_map, results, scores, output_path, company_name=''):
+    """
+    엑셀 보고서 생성 (v3.1 - 가독성 개선)
+
+    점수/양호율 가중치는 scores(server_scores 기준, fetch_report_data 참고)를 쓰고,
+    양호/취약/N/A 건수는 results 행에서 센다.
     """
-    if not raw_evidence:
-        return '', ''
-
-    text = str(raw_evidence).strip()
-
-    # 1차: 표준 JSON 파싱
-    try:
-        data = json.loads(text)
-        return (data.get('detail') or '').strip(), (data.get('command') or '').strip()
-    except Exception:
-        pass
-
-    # 2차: strict=False (제어문자 허용)
-    try:
-        data = json.loads(text, strict=False)
-        return (data.get('detail') or '').strip(), (data.get('command') or '').strip()
-    except Exception:
-        pass
-
-    # 3차: 이중 이스케이프 (리터럴 \n → 실제 줄바꿈, \" → ") 복원 후 재시도
-    try:
-        unescaped = text.replace(r'\n', '\n').replace(r'\t', '\t').replace(r'\"', '"')
-        data = json.loads(unescaped, strict=False)
-        return (data.get('detail') or '').strip(), (data.get('command') or '').strip()
-    except Exception:
-        pass
-
-    # 4차: 정규식으로 "detail": "..." 추출
-    detail = ''
-    command = ''
-
-    # 패턴 A: 일반 JSON 형태  "detail": "..."
-    m = re.search(r'"detail"\s*:\s*"(.*?)(?:"\s*[,}])', text, re.DOTALL)
-    if m:
-        detail = m.group(1).replace(r'\n', '\n').replace(r'\"', '"').strip()
-
-    # 패턴 B: 이중 이스케이프 형태  \\"detail\\": \\"...\\"
-    if not detail:
-        m = re.search(r'\\"detail\\"\s*:\s*\\"(.*?)(?:\\"\s*[,}])', text, re.DOTALL)
-        if m:
-            detail = m.group(1).replace(r'\n', '\n').replace(r'\"', '"').strip()
-
-    # command 추출 (동일하게 두 패턴)
-    m = re.search(r'"command"\s*:\s*"(.*?)(?:"\s*,)', text, re.DOTALL)
-    if m:
-        command = m.group(1).replace(r'\n', '\n').replace(r'\"', '"').strip()
-    if not command:
-        m = re.search(r'\\"command\\"\s*:\s*\\"(.*?)(?:\\"\s*,)', text, re.DOTALL)
-        if m:
-            command = m.group(1).replace(r'\n', '\n').replace(r'\"', '"').strip()
-
-    if detail:
-        return detail, command
-
-    # 최종 fallback: 원문 첫 500자
-    return text[:500], ''
-
-
-def generate_report(servers, kisa_items, kisa_map, results, output_path, company_name=''):
-    """엑셀 보고서 생성 (v3.1 - 가독성 개선)"""
     wb = xlsxwriter.Workbook(output_path, {'strings_to_urls': False})
 
     # ── 시트명 매핑 ──
@@ -554,22 +540,22 @@ def generate_report(servers, kisa_items, kisa_map, results, output_path, company
     except_cnt = sum(1 for r in results if r['status'] == '양호(예외)')
     na_cnt = total - pass_cnt - fail_cnt
 
-    # 가중치 기반 보안 점수
-    total_weight = sum(SEVERITY_WEIGHT.get(r['severity'], 1) for r in results)
-    pass_weight = sum(SEVERITY_WEIGHT.get(r['severity'], 1) for r in results if is_pass(r['status']))
+    # 가중치 기반 보안 점수 (server_scores 합산)
+    report_scores = [scores[srv['server_id']] for srv in servers if srv['server_id'] in scores]
+    total_weight = sum(sc['total_weight'] for sc in report_scores)
+    pass_weight = sum(sc['pass_weight'] for sc in report_scores)
     score = round(pass_weight / total_weight * 100, 1) if total_weight > 0 else 0
 
+    def server_score(sid):
+        return scores.get(sid, {}).get('score', 0)
+
     # 서버별 통계
-    per_server = defaultdict(lambda: {'pass': 0, 'fail': 0, 'na': 0, 'total': 0,
-                                       'pass_weight': 0, 'total_weight': 0})
+    per_server = defaultdict(lambda: {'pass': 0, 'fail': 0, 'na': 0, 'total': 0})
     for r in results:
         sid = r['server_id']
-        w = SEVERITY_WEIGHT.get(r['severity'], 1)
         per_server[sid]['total'] += 1
-        per_server[sid]['total_weight'] += w
         if is_pass(r['status']):
             per_server[sid]['pass'] += 1
-            per_server[sid]['pass_weight'] += w
         elif r['status'] == '취약':
             per_server[sid]['fail'] += 1
         else:
@@ -580,7 +566,7 @@ def generate_report(servers, kisa_items, kisa_map, results, output_path, company
     for srv in servers:
         sid = srv['server_id']
         st = per_server[sid]
-        s_score = round(st['pass_weight'] / st['total_weight'] * 100, 1) if st['total_weight'] > 0 else 0
+        s_score = server_score(sid)
         server_scores.append({
             'server_id': sid,
             'hostname': srv['hostname'],
@@ -600,16 +586,21 @@ def generate_report(servers, kisa_items, kisa_map, results, output_path, company
         cat = CATEGORY_KR.get(r['category'], r['category'])
         itype = 'OS' if r['item_code'].startswith('U-') else 'DB'
         typed_cat = f"{cat}({itype})"
-        w = SEVERITY_WEIGHT.get(r['severity'], 1)
-        per_cat[typed_cat]['total_weight'] += w
         if is_pass(r['status']):
             per_cat[typed_cat]['pass'] += 1
-            per_cat[typed_cat]['pass_weight'] += w
         elif r['status'] == '취약':
             per_cat[typed_cat]['fail'] += 1
         else:
             per_cat[typed_cat]['na'] += 1
 
+    # 양호율 가중치는 server_category_scores 합산
+    for sc in report_scores:
+        for (itype, category), cw in sc['categories'].items():
+            typed_cat = f"{CATEGORY_KR.get(category, category)}({itype})"
+            if typed_cat in per_cat:
+                per_cat[typed_cat]['pass_weight'] += cw['pass_weight']
+                per_cat[typed_cat]['total_weight'] += cw['total_weight']
+
     # 중요도별 통계
     per_sev = defaultdict(lambda: {'pass': 0, 'fail': 0, 'na': 0})
     for r in results:
@@ -711,7 +702,7 @@ def generate_report(servers, kisa_items, kisa_map, results, output_path, company
         sid = srv['server_id']
         sname = server_sheet_map[sid]
         st = per_server[sid]
-        s_score = round(st['pass_weight'] / st['total_weight'] * 100, 1) if st['total_weight'] > 0 else 0
+        s_score = server_score(sid)
         label = f"{sid}  ({srv['ip_address']})  {s_score}점"
         ws_cover.merge_range(toc_row, 2, toc_row, 5, '')
         ws_cover.write_url(toc_row, 2, f"internal:'{sname}'!A1", toc_link_fmt, label)
@@ -1063,7 +1054,7 @@ def generate_report(servers, kisa_items, kisa_map, results, output_path, company
         r = idx + header_row + 1
         sid = srv['server_id']
         st = per_server[sid]
-        s_score = round(st['pass_weight'] / st['total_weight'] * 100, 1) if st['total_weight'] > 0 else 0
+        s_score = server_score(sid)
         sheet_name = server_sheet_map[sid]
 
         ws_asset.write(r, 0, idx + 1, fmt['cell'])
@@ -1124,7 +1115,7 @@ def generate_report(servers, kisa_items, kisa_map, results, output_path, company
         ws.write_url('A1', f"internal:'{SHEET_ASSET}'!A1", fmt['link'], '<< 자산 목록')
 
         st = per_server[sid]
-        s_score = round(st['pass_weight'] / st['total_weight'] * 100, 1) if st['total_weight'] > 0 else 0
+        s_score = server_score(sid)
 
         # ── 서버 정보 헤더 (Row 1~2) ──
         info_row = 1
@@ -1245,7 +1236,10 @@ def generate_report(servers, kisa_items, kisa_map, results, output_path, company
             ws.write(row, 5, '', base)
 
             # 현황 요약 (JSON 정제)
-            detail_text, cmd_text = parse_evidence(r.get('raw_evidence', ''))
+            if r.get('evidence_detail') is not None:
+                detail_text, cmd_text = r['evidence_detail'], r.get('evidence_command') or ''
+            else:
+                detail_text, cmd_text = parse_evidence(r.get('raw_evidence', ''))
 
             # 취약(현재설정) / 양호(조치 내용) 분리
             if status == '취약':
@@ -1305,7 +1299,7 @@ def main():
     parser.add_argument('--output', type=str, default=None, help='출력 파일 경로')
     args = parser.parse_args()
 
-    servers, kisa_items, kisa_map, results = fetch_report_data(args.company)
+    servers, kisa_items, kisa_map, results, scores = fetch_report_data(args.company)
 
     if not results:
         print("[ERROR] 점검 결과가 없습니다. 먼저 전수 점검을 실행해주세요.")
@@ -1321,7 +1315,7 @@ def main():
         os.makedirs(report_dir, exist_ok=True)
         output_path = os.path.join(report_dir, f'{company_name}_취약점진단결과_{timestamp}.xlsx')
 
-    generate_report(servers, kisa_items, kisa_map, results, output_path, company_name)
+    generate_report(servers, kisa_items, kisa_map, results, scores, output_path, company_name)
 
 
 if __name__ == '__main__':
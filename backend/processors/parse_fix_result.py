@@ -1,6 +1,6 @@
 """
 parse_fix_result.py
-조치 결과 JSON 파일을 읽어서 remediation_logs 테이블에 INSERT
+조치 결과 JSON 파일(또는 fetch된 결과 번들 tar.gz)을 읽어서 remediation_logs 테이블에 INSERT
 """
 
 import os
@@ -8,11 +8,15 @@ import json
 import glob
 import sys
 import re
+import tarfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 
 # backend/ 디렉토리를 path에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from db.connector import DBConnector
+from db.evidence import evidence_digest, extract_evidence_fields
 from config import FIX_OUTPUT_DIR
 
 
@@ -40,9 +44,10 @@ def parse_filename(filename):
     return company, server_id, item_code
 
 
-def extract_failure_reason(data):
+def extract_failure_reason(data, detail=None):
     """
     조치 실패(is_success=0) 시 raw_evidence.detail의 첫 줄을 실패 사유로 사용한다.
+    detail은 적재 시 extract_evidence_fields()로 한 번만 추출한 값을 받는다.
     """
     is_success = data.get("is_success")
     if is_success in (1, True, "1", "true", "True"):
@@ -57,54 +62,12 @@ def extract_failure_reason(data):
     if not raw_evidence:
         return "조치 실패 (사유 미제공)"
 
-    detail = _extract_detail_from_raw_evidence(raw_evidence)
     if detail:
         return detail.splitlines()[0][:500]
 
     return "조치 실패 (raw_evidence 파싱 실패)"
 
 
-def _extract_detail_from_raw_evidence(raw_evidence):
-    """
-    raw_evidence 형식이 스크립트마다 조금 달라도 detail을 최대한 복구한다.
-    1) JSON 객체 문자열
-    2) JSON 문자열 안에 다시 JSON이 들어간 이중 인코딩
-    3) 형식이 깨진 경우 정규식으로 detail 추출
-    """
-    if not raw_evidence:
-        return None
-
-    # 1) 정상 JSON 혹은 이중 JSON
-    parsed = _try_parse_json_layers(raw_evidence)
-    if isinstance(parsed, dict):
-        detail = str(parsed.get("detail", "")).strip()
-        if detail:
-            return _decode_escapes(detail)
-
-    # 2) 부분적으로 깨진 문자열에서 "detail":"..." 패턴 복구
-    match = re.search(r'"detail"\s*:\s*"(?P<detail>.*?)"\s*(,|\})', raw_evidence, re.DOTALL)
-    if match:
-        return _decode_escapes(match.group("detail").strip())
-
-    return None
-
-
-def _try_parse_json_layers(text):
-    current = text
-    for _ in range(3):
-        try:
-            current = json.loads(current)
-        except Exception:
-            return current
-    return current
-
-
-def _decode_escapes(text):
-    # 스크립트에서 \n, \" 형태로 이스케이프된 문자열 복원
-    # NOTE: unicode_escape는 UTF-8 한글을 깨뜨리므로 사용하지 않음
-    return text.replace("\\n", "\n").replace('\\"', '"').replace("\\\\", "\\")
-
-
 def _lenient_extract(text: str, fallback_item_code: str, fallback_path: str) -> dict:
     """
     Invalid \\escape 등으로 JSON 파싱이 실패한 경우 복구한다.
@@ -149,7 +112,107 @@ def normalize_action_date(raw_action_date: str, *, now: datetime, max_skew: time
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def parse_and_insert():
+def parse_result_text(json_file, raw_text, controller_now):
+    """
+    조치 결과 JSON 본문 1개를 remediation_logs 행 튜플로 정규화한다.
+    DB에 접근하지 않으므로 워커 프로세스에서 병렬로 실행할 수 있다.
+
+    Returns:
+        (server_id, item_code, action_date, is_success, failure_reason, raw_evidence, evidence_hash, evidence_fields)
+    """
+    _, server_id, item_code = parse_filename(json_file)
+
+    try:
+        data = json.loads(raw_text)
+    except Exception:
+        data = _lenient_extract(raw_text, item_code, json_file)
+
+    raw_evidence = data.get('raw_evidence', json_file)
+    if not isinstance(raw_evidence, str):
+        raw_evidence = json.dumps(raw_evidence, ensure_ascii=False)
+    # detail/command/guide/target_file은 여기서 한 번만 추출해 컬럼으로 저장 (조회 경로에서 재파싱하지 않음)
+    fields = extract_evidence_fields(raw_evidence)
+
+    return (
+        server_id,
+        data.get('item_code', item_code),
+        normalize_action_date(
+            data.get('action_date') or data.get('scan_date') or "",
+            now=controller_now,
+        ),
+        data.get('is_success', 0),
+        extract_failure_reason(data, fields["detail"]),
+        raw_evidence,
+        evidence_digest(raw_evidence),
+        fields,
+    )
+
+
+def parse_result_file(json_file, controller_now):
+    """디스크의 조치 결과 JSON 파일 1개를 remediation_logs 행 튜플로 변환"""
+    with open(json_file, 'r', encoding='utf-8', errors='ignore') as f:
+        raw_text = f.read()
+    return parse_result_text(json_file, raw_text, controller_now)
+
+
+def iter_bundle_members(bundle_path, skip_names=frozenset()):
+    """
+    조치 결과 번들(tar.gz)을 디스크에 풀지 않고 *.json 멤버를 (파일명, 본문)으로 스트리밍한다.
+    skip_names에 있는 멤버(이미 풀려 있는 파일)는 건너뛴다.
+    """
+    with tarfile.open(bundle_path, 'r|gz') as tf:
+        for member in tf:
+            name = os.path.basename(member.name)
+            if not member.isfile() or not name.endswith('.json') or name in skip_names:
+                continue
+            f = tf.extractfile(member)
+            if f is None:
+                continue
+            yield name, f.read().decode('utf-8', errors='ignore')
+
+
+def _parse_worker(source, controller_now, skip_names=frozenset()):
+    """
+    source 1개(('file', 경로) 또는 ('bundle', 경로))를 파싱한다.
+    워커 예외를 부모로 전달하기 위해 [(파일명, 행 | None, 오류 메시지 | None), ...]를 반환한다.
+    """
+    kind, path = source
+    if kind == 'file':
+        try:
+            return [(path, parse_result_file(path, controller_now), None)]
+        except Exception as e:
+            return [(path, None, str(e))]
+
+    out = []
+    try:
+        for name, raw_text in iter_bundle_members(path, skip_names):
+            try:
+                out.append((name, parse_result_text(name, raw_text, controller_now), None))
+            except Exception as e:
+                out.append((name, None, str(e)))
+    except (tarfile.TarError, OSError, EOFError) as e:
+        out.append((path, None, f"결과 번들 읽기 실패: {e}"))
+    return out
+
+
+def iter_parsed_files(sources, controller_now, jobs=1, skip_names=frozenset()):
+    """
+    조치 결과 소스(파일/번들)들을 파싱해 (파일명, 행, 오류)를 순회한다.
+    jobs > 1이면 프로세스 풀에서 병렬로 디코딩/복구하고, 결과는 입력 순서대로 돌려준다.
+    """
+    worker = partial(_parse_worker, controller_now=controller_now, skip_names=skip_names)
+    if jobs <= 1 or len(sources) < 2:
+        for parsed in map(worker, sources):
+            yield from parsed
+        return
+
+    chunksize = max(1, len(sources) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for parsed in pool.map(worker, sources, chunksize=chunksize):
+            yield from parsed
+
+
+def parse_and_insert(jobs=1):
     db = DBConnector()
     if not db.connect():
         print("[ERROR] DB 연결 실패")
@@ -158,9 +221,15 @@ def parse_and_insert():
     allowed_ids_env = (os.getenv("PIPELINE_ALLOWED_SERVER_IDS") or "").strip()
     allowed_server_ids = {s.strip() for s in allowed_ids_env.split(",") if s.strip()} if allowed_ids_env else set()
 
+    # API(start_fix)가 만든 조치 실행 ID. run.sh가 대기열에서 가져온 실행의 target.json에서 읽어 전달한다.
+    # 수동 실행(./run.sh fix 단독)이면 없음 → run_id NULL로 저장
+    run_id = (os.getenv("FIX_RUN_ID") or "").strip() or None
+
     json_files = glob.glob(os.path.join(FIX_OUTPUT_DIR, '*.json'))
+    # fix_os.yml이 fetch한 호스트별 결과 번들은 풀지 않고 그대로 스트리밍해서 읽는다.
+    bundles = glob.glob(os.path.join(FIX_OUTPUT_DIR, '*.tar.gz'))
 
-    if not json_files:
+    if not json_files and not bundles:
         print(f"[INFO] {FIX_OUTPUT_DIR}에 JSON 파일이 없습니다.")
         db.disconnect()
         return False
@@ -172,70 +241,101 @@ def parse_and_insert():
     except Exception:
         known_server_ids = set()
 
+    # kisa_items 키 집합은 실행당 1회만 조회한다.
+    rows = db._fetch("SELECT item_code FROM kisa_items", ())
+    known_item_codes = {r["item_code"] for r in rows} if rows is not None else None
+
     success_count = 0
     fail_count = 0
     skip_count = 0
     controller_now = datetime.now()
 
+    def _skip_reason(server_id):
+        if allowed_server_ids and server_id not in allowed_server_ids:
+            return f"이번 실행 대상 아님(server_id={server_id})"
+        if known_server_ids and server_id not in known_server_ids:
+            return f"미등록 서버(server_id={server_id})"
+        return None
+
+    # 파일명만으로 걸러낼 수 있는 대상은 워커에 보내기 전에 제외한다.
+    sources = []
     for json_file in json_files:
         try:
             company, server_id, item_code = parse_filename(json_file)
+        except Exception as e:
+            print(f"[ERROR] {os.path.basename(json_file)} → {e}")
+            fail_count += 1
+            continue
 
-            if allowed_server_ids and server_id not in allowed_server_ids:
-                print(f"[SKIP] {os.path.basename(json_file)} → 이번 실행 대상 아님(server_id={server_id})")
-                skip_count += 1
-                continue
-
-            if known_server_ids and server_id not in known_server_ids:
-                print(f"[SKIP] {os.path.basename(json_file)} → 미등록 서버(server_id={server_id})")
-                skip_count += 1
-                continue
-
-            raw_text = ""
-            with open(json_file, 'r', encoding='utf-8', errors='ignore') as f:
-                raw_text = f.read()
+        reason = _skip_reason(server_id)
+        if reason:
+            print(f"[SKIP] {os.path.basename(json_file)} → {reason}")
+            skip_count += 1
+            continue
 
-            try:
-                data = json.loads(raw_text)
-            except Exception:
-                data = _lenient_extract(raw_text, item_code, json_file)
+        sources.append(('file', json_file))
+    sources.extend(('bundle', b) for b in sorted(bundles))
 
-            failure_reason = extract_failure_reason(data)
+    # 이전 방식(로컬 unarchive)으로 이미 풀린 파일은 번들에서 다시 읽지 않는다.
+    loose_names = frozenset(os.path.basename(f) for f in json_files)
 
-            # kisa_items에 없는 item_code이면 건너뛴다 (자동 생성하지 않음).
-            fix_item_code = data.get('item_code', item_code)
-            try:
-                exists = db._fetch("SELECT item_code FROM kisa_items WHERE item_code=%s", (fix_item_code,))
-                if not exists:
-                    print(f"[SKIP] {fix_item_code}: kisa_items에 등록되지 않은 항목이므로 건너뜁니다.")
-                    skip_count += 1
-                    continue
-            except Exception:
-                pass
-
-            result = db.insert_remediation_log(
-                server_id=server_id,
-                item_code=data.get('item_code', item_code),
-                action_date=normalize_action_date(
-                    data.get('action_date') or data.get('scan_date') or "",
-                    now=controller_now,
-                ),
-                is_success=data.get('is_success', 0),
-                failure_reason=failure_reason,
-                raw_evidence=data.get('raw_evidence', json_file)
-            )
-
-            if result:
-                print(f"[OK] {os.path.basename(json_file)} → remediation_logs INSERT 성공 (id: {result})")
-                success_count += 1
-            else:
-                print(f"[FAIL] {os.path.basename(json_file)} → INSERT 실패")
-                fail_count += 1
+    if jobs > 1:
+        print(f"[INFO] 병렬 파싱: jobs={jobs} sources={len(sources)}")
 
-        except Exception as e:
-            print(f"[ERROR] {os.path.basename(json_file)} → {e}")
+    pending = []
+    for json_file, row, error in iter_parsed_files(sources, controller_now, jobs=jobs, skip_names=loose_names):
+        if error is not None:
+            print(f"[ERROR] {os.path.basename(json_file)} → {error}")
+            fail_count += 1
+            continue
+
+        server_id, fix_item_code = row[0], row[1]
+
+        # 번들 멤버는 파싱 후에야 server_id를 알 수 있으므로 여기서 한 번 더 거른다.
+        reason = _skip_reason(server_id)
+        if reason:
+            print(f"[SKIP] {os.path.basename(json_file)} → {reason}")
+            skip_count += 1
+            continue
+
+        # kisa_items에 없는 item_code이면 건너뛴다 (자동 생성하지 않음).
+        if known_item_codes is not None and fix_item_code not in known_item_codes:
+            print(f"[SKIP] {fix_item_code}: kisa_items에 등록되지 않은 항목이므로 건너뜁니다.")
+            skip_count += 1
+            continue
+
+        pending.append((json_file, row))
+
+    # evidence 본문은 evidence_blobs에 다이제스트당 1회만 압축 저장하고, 행에는 hash만 남긴다.
+    stored_hashes = db.store_evidence_blobs({row[6]: row[5] for _, row in pending})
+
+    fixed_servers: set[str] = set()
+    for json_file, row in pending:
+        server_id, fix_item_code, action_date, is_success, failure_reason, raw_evidence, evidence_hash, fields = row
+        result = db.insert_remediation_log(
+            server_id=server_id,
+            item_code=fix_item_code,
+            action_date=action_date,
+            is_success=is_success,
+            failure_reason=failure_reason,
+            raw_evidence=raw_evidence,
+            evidence_hash=evidence_hash if evidence_hash in stored_hashes else None,
+            evidence_fields=fields,
+            run_id=run_id,
+        )
+
+        if result:
+            print(f"[OK] {os.path.basename(json_file)} → remediation_logs INSERT 성공 (id: {result})")
+            success_count += 1
+            fixed_servers.add(server_id)
+        else:
+            print(f"[FAIL] {os.path.basename(json_file)} → INSERT 실패")
             fail_count += 1
 
+    # 조치 이력 조회 API ETag 무효화
+    if fixed_servers:
+        db.bump_data_version(fixed_servers)
+
     print(f"\n[조치 파싱 완료] 성공: {success_count}, 실패: {fail_count}")
     if skip_count:
         print(f"[조치 파싱] 스킵: {skip_count} (servers 미등록 결과 파일)")
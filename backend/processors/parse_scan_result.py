@@ -1,6 +1,6 @@
 """
 parse_scan_result.py
-점검 결과 JSON 파일을 읽어서 scan_history 테이블에 INSERT
+점검 결과 JSON 파일(또는 fetch된 결과 번들 tar.gz)을 읽어서 scan_history 테이블에 INSERT
 """
 
 import os
@@ -8,12 +8,16 @@ import json
 import glob
 import sys
 import re
+import tarfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 
 # backend/ 디렉토리를 path에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from db.connector import DBConnector
-from config import SCAN_OUTPUT_DIR
+from db.evidence import EVIDENCE_FIELDS, evidence_digest, extract_evidence_fields
+from config import SCAN_OUTPUT_DIR, SCAN_INSERT_BATCH_SIZE
 
 # DB 스크립트: PASS/FAIL, OS 스크립트: 양호/취약 → 통일
 STATUS_MAP = {
@@ -127,7 +131,118 @@ def _lenient_extract(text: str, fallback_item_code: str, fallback_path: str) ->
     }
 
 
-def parse_and_insert():
+def parse_result_text(json_file, raw_text, controller_now):
+    """
+    결과 JSON 본문 1개를 scan_history 행 튜플로 정규화한다.
+    DB에 접근하지 않으므로 워커 프로세스에서 병렬로 실행할 수 있다.
+
+    Args:
+        json_file: 결과 파일명 (번들 멤버이면 멤버 파일명)
+        raw_text: 파일 본문
+
+    Returns:
+        (server_id, item_code, status, raw_evidence, scan_date, evidence_hash,
+         evidence_detail, evidence_command, evidence_guide, evidence_target_file)
+    """
+    _, server_id, item_code = parse_filename(json_file)
+    server_id = str(server_id).strip()
+    item_code = str(item_code).strip()
+
+    try:
+        data = json.loads(raw_text)
+    except Exception:
+        # Invalid \\escape 등으로 JSON 파싱이 실패하면 복구 모드로 진행
+        data = _lenient_extract(raw_text, item_code, json_file)
+
+    # D-25 등 is_success 형식 호환: is_success → status 변환
+    if 'status' not in data and 'is_success' in data:
+        data['status'] = 'PASS' if data['is_success'] else 'FAIL'
+
+    # status 통일 (PASS→양호, FAIL→취약)
+    status = normalize_status(data.get('status', 'FAIL'))
+    raw_evidence = extract_raw_evidence(data, json_file)
+    # detail/command/guide/target_file은 여기서 한 번만 추출해 컬럼으로 저장 (조회 경로에서 재파싱하지 않음)
+    fields = extract_evidence_fields(raw_evidence)
+
+    return (
+        server_id,
+        str(data.get('item_code', item_code)).strip(),
+        status,
+        raw_evidence,
+        normalize_scan_date(
+            data.get('scan_date') or data.get('action_date') or "",
+            now=controller_now,
+        ),
+        evidence_digest(raw_evidence),
+    ) + tuple(fields[f] for f in EVIDENCE_FIELDS)
+
+
+def parse_result_file(json_file, controller_now):
+    """디스크의 결과 JSON 파일 1개를 scan_history 행 튜플로 변환"""
+    with open(json_file, 'r', encoding='utf-8', errors='ignore') as f:
+        raw_text = f.read()
+    return parse_result_text(json_file, raw_text, controller_now)
+
+
+def iter_bundle_members(bundle_path, skip_names=frozenset()):
+    """
+    결과 번들(tar.gz)을 디스크에 풀지 않고 *.json 멤버를 (파일명, 본문)으로 스트리밍한다.
+    skip_names에 있는 멤버(이미 풀려 있는 파일)는 건너뛴다.
+    """
+    with tarfile.open(bundle_path, 'r|gz') as tf:
+        for member in tf:
+            name = os.path.basename(member.name)
+            if not member.isfile() or not name.endswith('.json') or name in skip_names:
+                continue
+            f = tf.extractfile(member)
+            if f is None:
+                continue
+            yield name, f.read().decode('utf-8', errors='ignore')
+
+
+def _parse_worker(source, controller_now, skip_names=frozenset()):
+    """
+    source 1개(('file', 경로) 또는 ('bundle', 경로))를 파싱한다.
+    워커 예외를 부모로 전달하기 위해 [(파일명, 행 | None, 오류 메시지 | None), ...]를 반환한다.
+    """
+    kind, path = source
+    if kind == 'file':
+        try:
+            return [(path, parse_result_file(path, controller_now), None)]
+        except Exception as e:
+            return [(path, None, str(e))]
+
+    out = []
+    try:
+        for name, raw_text in iter_bundle_members(path, skip_names):
+            try:
+                out.append((name, parse_result_text(name, raw_text, controller_now), None))
+            except Exception as e:
+                out.append((name, None, str(e)))
+    except (tarfile.TarError, OSError, EOFError) as e:
+        out.append((path, None, f"결과 번들 읽기 실패: {e}"))
+    return out
+
+
+def iter_parsed_files(sources, controller_now, jobs=1, skip_names=frozenset()):
+    """
+    결과 소스(파일/번들)들을 파싱해 (파일명, 행, 오류)를 순회한다.
+    jobs > 1이면 프로세스 풀에서 병렬로 디코딩/복구하고, 결과는 입력 순서대로 돌려준다.
+    번들은 호스트 1대 분량이므로 그대로 워커 1개의 작업 단위가 된다.
+    """
+    worker = partial(_parse_worker, controller_now=controller_now, skip_names=skip_names)
+    if jobs <= 1 or len(sources) < 2:
+        for parsed in map(worker, sources):
+            yield from parsed
+        return
+
+    chunksize = max(1, len(sources) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for parsed in pool.map(worker, sources, chunksize=chunksize):
+            yield from parsed
+
+
+def parse_and_insert(jobs=1):
     db = DBConnector()
     if not db.connect():
         print("[ERROR] DB 연결 실패")
@@ -141,9 +256,11 @@ def parse_and_insert():
         print(f"[INFO] PIPELINE_ALLOWED_SERVER_IDS 적용: {','.join(sorted(allowed_server_ids))}")
 
     json_files = glob.glob(os.path.join(SCAN_OUTPUT_DIR, '*.json'))
-    print(f"[INFO] json_files={len(json_files)}")
+    # scan_os.yml이 fetch한 호스트별 결과 번들은 풀지 않고 그대로 스트리밍해서 읽는다.
+    bundles = glob.glob(os.path.join(SCAN_OUTPUT_DIR, '*.tar.gz'))
+    print(f"[INFO] json_files={len(json_files)} bundles={len(bundles)}")
 
-    if not json_files:
+    if not json_files and not bundles:
         print(f"[INFO] {SCAN_OUTPUT_DIR}에 JSON 파일이 없습니다.")
         db.disconnect()
         return False
@@ -155,88 +272,143 @@ def parse_and_insert():
     except Exception:
         known_server_ids = set()
 
+    # kisa_items 키 집합도 실행당 1회만 조회한다. (파일마다 SELECT 하지 않음)
+    rows = db._fetch("SELECT item_code FROM kisa_items", ())
+    known_item_codes = {r["item_code"] for r in rows} if rows is not None else None
+
     success_count = 0
     fail_count = 0
     skip_count = 0
     controller_now = datetime.now()
-    inserted_item_codes: set[str] = set()
-    u64_scan_ids: list[int] = []
+    # (server_id, item_code) → (row, 파일명). 같은 키가 여러 번 나오면 마지막 파일이 이긴다.
+    staged: dict[tuple[str, str], tuple[tuple, str]] = {}
+
+    def _skip_reason(server_id):
+        if allowed_server_ids and server_id not in allowed_server_ids:
+            return f"이번 실행 대상 아님(server_id={server_id})"
+        if known_server_ids and server_id not in known_server_ids:
+            return f"미등록 서버(server_id={server_id})"
+        return None
 
+    # 파일명만으로 걸러낼 수 있는 대상은 워커에 보내기 전에 제외한다.
+    sources = []
     for json_file in json_files:
         try:
-            company, server_id, item_code = parse_filename(json_file)
+            _, server_id, _ = parse_filename(json_file)
             server_id = str(server_id).strip()
-            item_code = str(item_code).strip()
-
-            if allowed_server_ids and server_id not in allowed_server_ids:
-                print(f"[SKIP] {os.path.basename(json_file)} → 이번 실행 대상 아님(server_id={server_id})")
-                skip_count += 1
-                continue
-
-            if known_server_ids and server_id not in known_server_ids:
-                print(f"[SKIP] {os.path.basename(json_file)} → 미등록 서버(server_id={server_id})")
-                skip_count += 1
-                continue
-
-            raw_text = ""
-            with open(json_file, 'r', encoding='utf-8', errors='ignore') as f:
-                raw_text = f.read()
+        except Exception as e:
+            print(f"[ERROR] {os.path.basename(json_file)} → {e}")
+            fail_count += 1
+            continue
 
-            try:
-                data = json.loads(raw_text)
-            except Exception:
-                # Invalid \\escape 등으로 JSON 파싱이 실패하면 복구 모드로 진행
-                data = _lenient_extract(raw_text, item_code, json_file)
+        reason = _skip_reason(server_id)
+        if reason:
+            print(f"[SKIP] {os.path.basename(json_file)} → {reason}")
+            skip_count += 1
+            continue
 
-            # D-25 등 is_success 형식 호환: is_success → status 변환
-            if 'status' not in data and 'is_success' in data:
-                data['status'] = 'PASS' if data['is_success'] else 'FAIL'
+        sources.append(('file', json_file))
+    sources.extend(('bundle', b) for b in sorted(bundles))
 
-            # status 통일 (PASS→양호, FAIL→취약)
-            status = normalize_status(data.get('status', 'FAIL'))
+    # 이전 방식(로컬 unarchive)으로 이미 풀린 파일은 번들에서 다시 읽지 않는다.
+    loose_names = frozenset(os.path.basename(f) for f in json_files)
 
-            data_item_code = str(data.get('item_code', item_code)).strip()
-            # kisa_items에 없는 item_code이면 건너뛴다 (자동 생성하지 않음).
-            try:
-                exists = db._fetch("SELECT item_code FROM kisa_items WHERE item_code=%s", (data_item_code,))
-                if not exists:
-                    print(f"[SKIP] {data_item_code}: kisa_items에 등록되지 않은 항목이므로 건너뜁니다.")
-                    skip_count += 1
-                    continue
-            except Exception:
-                pass
-
-            result = db.insert_scan_result(
-                server_id=server_id,
-                item_code=data_item_code,
-                status=status,
-                raw_evidence=extract_raw_evidence(data, json_file),
-                scan_date=normalize_scan_date(
-                    data.get('scan_date') or data.get('action_date') or "",
-                    now=controller_now,
-                ),
-            )
-
-            if result:
-                inserted_item_codes.add(data_item_code)
-                if data_item_code == "U-64":
-                    u64_scan_ids.append(int(result))
-                print(f"[OK] {os.path.basename(json_file)} → scan_history INSERT 성공 (scan_id: {result})")
-                success_count += 1
-            else:
-                print(f"[FAIL] {os.path.basename(json_file)} → INSERT 실패")
-                fail_count += 1
+    if jobs > 1:
+        print(f"[INFO] 병렬 파싱: jobs={jobs} sources={len(sources)}")
 
-        except Exception as e:
-            print(f"[ERROR] {os.path.basename(json_file)} → {e}")
+    for json_file, row, error in iter_parsed_files(sources, controller_now, jobs=jobs, skip_names=loose_names):
+        if error is not None:
+            print(f"[ERROR] {os.path.basename(json_file)} → {error}")
             fail_count += 1
+            continue
+
+        server_id, data_item_code = row[0], row[1]
+        # 번들 멤버는 파싱 후에야 server_id를 알 수 있으므로 여기서 한 번 더 거른다.
+        reason = _skip_reason(server_id)
+        if reason:
+            print(f"[SKIP] {os.path.basename(json_file)} → {reason}")
+            skip_count += 1
+            continue
+
+        # kisa_items에 없는 item_code이면 건너뛴다 (자동 생성하지 않음).
+        if known_item_codes is not None and data_item_code not in known_item_codes:
+            print(f"[SKIP] {data_item_code}: kisa_items에 등록되지 않은 항목이므로 건너뜁니다.")
+            skip_count += 1
+            continue
+
+        staged[(server_id, data_item_code)] = (row, os.path.basename(json_file))
+
+    # 이번 실행을 scan_runs에 등록 (scan_results_history.run_id)
+    scan_date = normalize_scan_date("", now=controller_now)
+    run_id = db.start_scan_run(scan_date) if staged else None
+
+    # 다이제스트 매니페스트와 비교: 상태/evidence가 그대로인 결과는 scan_date만 갱신한다.
+    manifest = db.get_evidence_digests({k[0] for k in staged}) or {}
+    changed_rows = []
+    unchanged_keys = []
+    for key, (row, _) in staged.items():
+        if manifest.get(key) == (row[2], row[5]):
+            unchanged_keys.append(key)
+        else:
+            changed_rows.append(row)
+    print(f"[INFO] staged_rows={len(staged)} changed={len(changed_rows)} unchanged={len(unchanged_keys)} "
+          f"batch_size={SCAN_INSERT_BATCH_SIZE}")
+
+    # 바뀐 evidence 본문은 evidence_blobs에 다이제스트당 1회만 압축 저장하고, 행에는 hash만 남긴다.
+    stored_hashes = db.store_evidence_blobs({row[5]: row[3] for row in changed_rows})
+    changed_rows = [
+        row[:3] + (None if row[5] in stored_hashes else row[3],) + row[4:]
+        for row in changed_rows
+    ]
+    print(f"[INFO] evidence_blobs: distinct={len({row[5] for row in changed_rows})} stored={len(stored_hashes)}")
+
+    # 바뀐 행은 배치 단위 multi-row UPSERT로 한 트랜잭션에 기록
+    ok_rows, failed_rows = db.bulk_upsert_scan_results(changed_rows, batch_size=SCAN_INSERT_BATCH_SIZE)
+    success_count += ok_rows
+    fail_count += len(failed_rows)
+
+    ok_touched, failed_touch_keys = db.touch_scan_results(unchanged_keys, scan_date, batch_size=SCAN_INSERT_BATCH_SIZE)
+    success_count += ok_touched
+    fail_count += len(failed_touch_keys)
+
+    failed_keys = {(r[0], r[1]) for r in failed_rows} | set(failed_touch_keys)
+    for key in failed_keys:
+        print(f"[FAIL] {staged[key][1]} → INSERT 실패")
+    inserted_item_codes: set[str] = {k[1] for k in staged if k not in failed_keys}
+
+    # 이번 실행에서 결과가 들어온 서버만 server_scores / server_category_scores 재계산
+    touched_servers = {k[0] for k in staged}
+    if touched_servers and db.refresh_server_scores(touched_servers):
+        print(f"[INFO] server_scores 갱신: {len(touched_servers)}개 서버")
+
+    # 실행 스냅샷 전체(변경 여부 무관)를 월 파티션 이력 테이블에 append
+    if run_id:
+        history_rows = [
+            (key[0], key[1], row[2], row[5], scan_date)
+            for key, (row, _) in staged.items() if key not in failed_keys
+        ]
+        db.ensure_history_partitions(controller_now)
+        appended = db.append_scan_results_history(run_id, history_rows, batch_size=SCAN_INSERT_BATCH_SIZE)
+        db.finish_scan_run(
+            run_id,
+            'completed' if not failed_keys and appended == len(history_rows) else 'partial',
+            server_count=len(touched_servers),
+            result_count=appended,
+            changed_count=len(changed_rows),
+            failed_count=len(failed_keys),
+        )
+        print(f"[INFO] scan_runs run_id={run_id} history_rows={appended}")
+
+    # 조회 API ETag 무효화 (적재/점수 갱신이 모두 커밋된 뒤)
+    if touched_servers:
+        db.bump_data_version(touched_servers)
 
     print(f"\n[점검 파싱 완료] 성공: {success_count}, 실패: {fail_count}")
     if inserted_item_codes:
         # Helpful when a specific item (e.g., U-64) appears missing in the dashboard.
         sample = ", ".join(sorted(inserted_item_codes)[:12])
         print(f"[INFO] inserted_item_codes_sample={sample} (total_unique={len(inserted_item_codes)})")
-        print(f"[INFO] inserted_contains_U-64={'U-64' in inserted_item_codes} u64_scan_ids_tail={u64_scan_ids[-3:]}")
+        print(f"[INFO] inserted_contains_U-64={'U-64' in inserted_item_codes}")
     if skip_count:
         print(f"[점검 파싱] 스킵: {skip_count} (servers 미등록 결과 파일)")
     db.disconnect()
@@ -8,13 +8,7 @@ import sys, os
 # backend/ 디렉토리를 path에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from db.connector import DBConnector
-
-# severity별 가중치
-SEVERITY_WEIGHT = {
-    '상': 3,
-    '중': 2,
-    '하': 1,
-}
+from db.scores import SEVERITY_WEIGHT
 
 
 def calculate_score(server_id):
@@ -25,6 +19,9 @@ def calculate_score(server_id):
 
     - exceptions 테이블에 있는 항목은 '양호'로 처리
     - severity(상/중/하)에 따라 가중치 적용
+
+    점수/건수는 server_scores를 이 서버만 다시 계산해 읽는다. (calculate_scores, 대시보드, 보고서와 같은 규칙
+    → db/scores.py) details는 같은 현재 점검 행에 활성 예외를 표시한 항목별 목록이다.
     """
     db = DBConnector()
     if not db.connect():
@@ -32,27 +29,28 @@ def calculate_score(server_id):
         return None
 
     try:
-        scan_results = db.get_latest_scan(server_id)
+        scan_results = db.get_current_scan(server_id)
         if not scan_results:
             print(f"[INFO] {server_id}의 점검 결과가 없습니다.")
             return None
 
+        if not db.refresh_server_scores([server_id]):
+            return None
+        db.bump_data_version([server_id])
+        score_rows = db.get_server_scores([server_id], active_only=False)
+        if not score_rows:
+            print(f"[ERROR] {server_id}의 server_scores 행이 없습니다.")
+            return None
+        row = score_rows[0]
+
         exceptions = db.get_exceptions(server_id)
 
-        total_weight = 0
-        pass_weight = 0
         details = []
-
         for item in scan_results:
-            weight = SEVERITY_WEIGHT.get(item['severity'], 1)
-            total_weight += weight
-
             if item['item_code'] in exceptions:
                 status = '양호 (예외)'
-                pass_weight += weight
             elif item['status'] == '양호':
                 status = '양호'
-                pass_weight += weight
             else:
                 status = '취약'
 
@@ -60,23 +58,21 @@ def calculate_score(server_id):
                 'item_code': item['item_code'],
                 'title': item['title'],
                 'severity': item['severity'],
-                'weight': weight,
+                'weight': SEVERITY_WEIGHT.get(item['severity'], 1),
                 'status': status,
             })
 
-        score = round((pass_weight / total_weight) * 100, 1) if total_weight > 0 else 0
-
         result = {
             'server_id': server_id,
-            'score': score,
-            'total_items': len(scan_results),
-            'pass_count': sum(1 for d in details if '양호' in d['status']),
-            'fail_count': sum(1 for d in details if d['status'] == '취약'),
-            'exception_count': sum(1 for d in details if '예외' in d['status']),
+            'score': float(row['score']),
+            'total_items': int(row['total_items']),
+            'pass_count': int(row['pass_count']),
+            'fail_count': int(row['fail_count']),
+            'exception_count': int(row['exception_count']),
             'details': details,
         }
 
-        print(f"[{server_id}] 보안 점수: {score}점 "
+        print(f"[{server_id}] 보안 점수: {result['score']}점 "
               f"(양호: {result['pass_count']}, 취약: {result['fail_count']}, "
               f"예외: {result['exception_count']})")
 
@@ -90,5 +86,67 @@ def calculate_score(server_id):
         db.disconnect()
 
 
+def calculate_scores(server_ids=None):
+    """
+    활성 서버 전체(또는 server_ids)의 보안 점수를 다시 계산해 server_scores에 저장하고 반환
+
+    점수 규칙(예외=양호, severity 가중치)을 DB 안에서 set 기반으로 집계하므로
+    서버별로 커넥션/쿼리를 반복하지 않는다. (db/scores.py 참고)
+
+    Returns:
+        {server_id: {score, total_items, pass_count, fail_count, exception_count,
+                     categories: {'OS:account' 형식: {score, total_items, pass_count, fail_count, exception_count}}}}
+        (DB 오류 시 None)
+    """
+    db = DBConnector()
+    if not db.connect():
+        print("[ERROR] DB 연결 실패")
+        return None
+
+    try:
+        if not db.refresh_server_scores(server_ids):
+            return None
+        # 예외 만료 등으로 점수가 바뀌었을 수 있으므로 조회 API ETag 무효화
+        db.bump_data_version(server_ids)
+        server_rows = db.get_server_scores(server_ids)
+        category_rows = db.get_server_category_scores(server_ids)
+    finally:
+        db.disconnect()
+
+    if server_rows is None or category_rows is None:
+        return None
+
+    counters = ('total_items', 'pass_count', 'fail_count', 'exception_count')
+    results = {
+        r['server_id']: {
+            'server_id': r['server_id'],
+            'score': float(r['score']),
+            **{k: int(r[k]) for k in counters},
+            'categories': {},
+        }
+        for r in server_rows
+    }
+    for r in category_rows:
+        server = results.get(r['server_id'])
+        if server is None:
+            continue
+        # OS/DB 카테고리명이 겹치므로(account, patch) item_type을 함께 키로 쓴다
+        # (DB는 항목 접두어(D / PG-D / MY-D)별 행을 합산)
+        category = server['categories'].setdefault(
+            f"{r['item_type']}:{r['category']}",
+            {k: 0 for k in counters + ('pass_weight', 'total_weight')},
+        )
+        for k in counters + ('pass_weight', 'total_weight'):
+            category[k] += int(r[k])
+
+    for server in results.values():
+        for category in server['categories'].values():
+            pass_weight = category.pop('pass_weight')
+            total_weight = category.pop('total_weight')
+            category['score'] = round(pass_weight * 100 / total_weight, 1) if total_weight > 0 else 0
+
+    return results
+
+
 if __name__ == '__main__':
     calculate_score('rocky9_1')
\ No newline at end of file
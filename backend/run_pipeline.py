@@ -8,10 +8,14 @@ backend/run_pipeline.py
     python3 run_pipeline.py score [ID]    # 3. 보안 점수 계산 (ID 생략시 전체)
     python3 run_pipeline.py mock          # 0. 가짜 데이터 생성 (테스트용)
     python3 run_pipeline.py all           # [추천] mock -> scan -> score 한방에 실행
+
+    --jobs N 옵션(scan/fix/all): 결과 파일 JSON 디코딩/복구를 N개 프로세스로 병렬 처리
+    (생략 시 PIPELINE_JOBS 환경변수, 그것도 없으면 1 = 순차 처리)
 """
 
 import sys
 import os
+import time
 import importlib.util
 
 # ---------------------------------------------------------
@@ -32,8 +36,7 @@ sys.path.append(project_root)
 try:
     from processors.parse_scan_result import parse_and_insert as parse_scan
     from processors.parse_fix_result import parse_and_insert as parse_fix
-    from processors.score_calculator import calculate_score
-    from db.connector import DBConnector
+    from processors.score_calculator import calculate_score, calculate_scores
     print("[INFO] 모듈 로드 성공")
 except ImportError as e:
     print(f"[ERROR] 모듈을 찾을 수 없습니다: {e}")
@@ -63,10 +66,11 @@ def run_mock_generator():
         print("          진짜 서버 데이터만 처리합니다.")
 
 
-def run_scan_pipeline():
+def run_scan_pipeline(jobs=1):
     """
     점검 결과(JSON)를 파싱하여 DB에 저장합니다.
     (진짜 서버 결과 + 시뮬레이션 결과 모두 처리)
+    jobs > 1이면 파일 파싱은 워커 프로세스에서, DB 기록은 단일 writer에서 수행합니다.
     """
     print("\n" + "=" * 50)
     print(" 🔍 [Step 1] 점검 결과 파싱 및 DB 저장")
@@ -74,14 +78,14 @@ def run_scan_pipeline():
     
     # 1. JSON 파일들이 있는 디렉토리 설정 (parse_scan_result.py 내부에서 처리하겠지만, 여기서 넘겨줄 수도 있음)
     # 현재는 parse_scan() 내부 로직에 맡김
-    return parse_scan()
+    return parse_scan(jobs=jobs)
 
 
-def run_fix_pipeline():
+def run_fix_pipeline(jobs=1):
     print("\n" + "=" * 50)
     print(" 🔧 [Step 2] 조치 결과 파싱 및 DB 저장")
     print("=" * 50)
-    return parse_fix()
+    return parse_fix(jobs=jobs)
 
 
 def run_score_pipeline(server_id=None):
@@ -93,30 +97,26 @@ def run_score_pipeline(server_id=None):
         print(f" -> 대상 서버: {server_id}")
         return calculate_score(server_id)
     else:
-        # 전체 서버 계산
-        db = DBConnector()
-        if not db.connect():
+        # 전체 서버 계산 (집계 쿼리 1회)
+        started = time.perf_counter()
+        scores = calculate_scores()
+        if scores is None:
             return None
 
-        servers = db.get_active_servers()
-        db.disconnect()
-
-        if not servers:
-            print("[INFO] 활성화된 서버가 없습니다.")
+        if not scores:
+            print("[INFO] 점검 결과가 있는 활성 서버가 없습니다.")
             return None
 
-        print(f" -> 전체 {len(servers)}개 서버 점수 재계산 중...")
-        results = []
-        for server in servers:
-            # 진행상황 표시 (선택)
-            # print(f"Processing {server['server_id']}...", end='\r')
-            calculate_score(server['server_id'])
-            
-        print(f"\n[SUCCESS] 전체 서버 점수 계산 완료")
-        return results
+        for server_id, result in sorted(scores.items()):
+            print(f"[{server_id}] 보안 점수: {result['score']}점 "
+                  f"(양호: {result['pass_count']}, 취약: {result['fail_count']}, "
+                  f"예외: {result['exception_count']})")
+
+        print(f"\n[SUCCESS] 전체 {len(scores)}개 서버 점수 계산 완료 ({time.perf_counter() - started:.2f}s)")
+        return scores
 
 
-def run_all():
+def run_all(jobs=1):
     """
     전체 파이프라인 순차 실행
     Mock 생성 -> Scan 파싱 -> Score 계산
@@ -127,7 +127,7 @@ def run_all():
     run_mock_generator()
     
     # 2. 점검 결과 파싱 (진짜+가짜)
-    run_scan_pipeline()
+    run_scan_pipeline(jobs=jobs)
     
     # 3. 점수 계산
     run_score_pipeline()
@@ -138,7 +138,34 @@ def run_all():
 # ---------------------------------------------------------
 # 4. 메인 실행
 # ---------------------------------------------------------
+def _pop_jobs_option(argv):
+    """
+    argv에서 --jobs N / --jobs=N 을 꺼내고 (나머지 인자, jobs)를 반환합니다.
+    """
+    jobs = os.getenv("PIPELINE_JOBS", "1")
+    rest = []
+    it = iter(argv)
+    for arg in it:
+        if arg == "--jobs":
+            jobs = next(it, jobs)
+        elif arg.startswith("--jobs="):
+            jobs = arg.split("=", 1)[1]
+        else:
+            rest.append(arg)
+
+    try:
+        jobs = int(jobs)
+    except (TypeError, ValueError):
+        print(f"[ERROR] --jobs 값이 올바르지 않습니다: {jobs}")
+        sys.exit(1)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    return rest, max(jobs, 1)
+
+
 def main():
+    sys.argv[1:], jobs = _pop_jobs_option(sys.argv[1:])
+
     if len(sys.argv) < 2:
         print("\n[사용법]")
         print(" python3 run_pipeline.py mock    # 가짜 데이터 생성")
@@ -146,6 +173,7 @@ def main():
         print(" python3 run_pipeline.py fix     # 조치 결과 파싱")
         print(" python3 run_pipeline.py score   # 점수 계산")
         print(" python3 run_pipeline.py all     # 전체 실행 (추천)")
+        print(" (옵션) --jobs N                  # 결과 파일 병렬 파싱 (0 = CPU 수)")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -153,19 +181,19 @@ def main():
     if command == 'mock':
         run_mock_generator()
     elif command == 'scan':
-        ok = bool(run_scan_pipeline())
+        ok = bool(run_scan_pipeline(jobs=jobs))
         if not ok:
             # Make failures visible to callers (run.sh / dashboard) by returning non-zero.
             sys.exit(2)
     elif command == 'fix':
-        ok = bool(run_fix_pipeline())
+        ok = bool(run_fix_pipeline(jobs=jobs))
         if not ok:
             sys.exit(2)
     elif command == 'score':
         server_id = sys.argv[2] if len(sys.argv) > 2 else None
         run_score_pipeline(server_id)
     elif command == 'all':
-        run_all()
+        run_all(jobs=jobs)
     else:
         print(f"[ERROR] 알 수 없는 명령어: {command}")
         sys.exit(1)
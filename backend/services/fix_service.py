@@ -1,28 +1,191 @@
 """
 자동조치 서비스
+
+Job API(:8001) 호출은 core/job_client.job_api(공유 비동기 클라이언트)로 하고,
+동기 SQLAlchemy 조회는 run_in_thread()로 넘긴다. (시작/진행률/결과 함수는 async)
+
+조치 작업 정보(job_id → 대상 서버/항목, OS/DB 하위 작업)는 fix_jobs 테이블에 저장한다.
+워커가 여럿이거나 API가 재시작되어도 어느 프로세스에서든 진행률/결과를 조회할 수 있다.
 """
 
+import asyncio
+import fcntl
 import json
+import math
 import os
-import requests
+import shutil
 import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case
 
-from db.models import Server, ScanHistory, KisaItem, RemediationLog
+from core.concurrency import run_in_thread
+from core.config import (
+    FIX_MAX_PARALLEL_RUNS, FIX_ANSIBLE_FORKS, FIX_ITEM_EST_SECONDS, FIX_RUN_OVERHEAD_SECONDS,
+)
+from core.job_client import job_api, JobAPIError
+from db.models import Server, ScanHistory, KisaItem, RemediationLog, FixJob
+from db.evidence import EvidenceResolver
+from db.session import SessionLocal
+
+# 조치 실행별 파일 디렉터리 (/tmp/audit/fix_runs/<run_id>/)
+# - target.json: 대상 server_id(s) + run_id
+# - item_codes.json: 조치 항목 전체 목록
+# - host_items.json: 서버별 조치 항목 ({"fix_host_items": {server_id: [item_code, ...]}}, extra vars)
+# - plan.json: 일괄 조치 실행 계획 (plan_fix_runs 결과 + run_id)
+# 실행마다 분리되어 있으므로 다음 조치 요청이 실행 전의 대상 파일을 덮어쓰지 않는다.
+FIX_RUNS_DIR = "/tmp/audit/fix_runs"
+# 조치 실행 대기열 (/tmp/audit/fix_queue/{os,db}/<순번>-<run_id>)
+# Job API는 작업별 인자를 받지 않으므로 run.sh fix / fix-db가 등록 순서대로 하나씩 가져간다.
+# 항목은 <순번>-<run_id>.pending으로 만들고 Job API 작업이 생성된 뒤에 이름을 바꿔 준비 상태로 만든다.
+# (run.sh는 .pending 항목을 가져가지 않고, 최근 .pending 항목이 있으면 준비될 때까지 잠시 기다린다)
+FIX_QUEUE_DIR = "/tmp/audit/fix_queue"
+FIX_QUEUE_LOCK_FILE = "/tmp/audit/fix_queue/.lock"
+# 대기열 종류 → Job API 작업 종류
+_FIX_JOB_TYPES = {"os": "fix", "db": "fix-db"}
+_FIX_QUEUE_PENDING_SUFFIX = ".pending"
+# 이 시간이 지난 실행 파일/대기열 항목은 새 조치 요청 시 정리
+_FIX_RUN_RETENTION_SECONDS = 7 * 24 * 3600
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+# fix_jobs 조회 캐시 (job_id → 조치 정보). 진행률 폴링마다 DB를 읽지 않기 위함.
+# 대상/하위 작업 정보는 등록 후 바뀌지 않으므로 프로세스별로 캐시해도 워커 간 불일치가 없다.
+# (status는 이 프로세스가 마지막으로 기록/확인한 값) 이벤트 루프 스레드에서만 변경한다.
+_FIX_INFO_CACHE_SIZE = 256
+_fix_info_cache: "OrderedDict[str, dict]" = OrderedDict()
+
+
+def _cache_fix_info(job_id: str, info: dict) -> None:
+    _fix_info_cache[job_id] = info
+    _fix_info_cache.move_to_end(job_id)
+    while len(_fix_info_cache) > _FIX_INFO_CACHE_SIZE:
+        _fix_info_cache.popitem(last=False)
+
+
+def _fix_info_from_row(row: FixJob) -> dict:
+    return {
+        "server_ids": row.server_ids,
+        "server_id": row.server_ids[0] if row.server_ids else None,  # 하위 호환
+        "run_id": row.run_id,
+        "item_codes": row.item_codes,
+        "per_server": row.per_server,
+        "os_job_id": row.os_job_id,
+        "db_job_id": row.db_job_id,
+        "status": row.status,
+    }
+
+
+def _register_fix_job(run_id: str, per_server: dict, item_codes: List[str], db: Session) -> None:
+    """
+    조치 작업을 fix_jobs에 먼저 저장 (status=queued)
 
-# 조치 대상 item_codes / server_id를 Ansible에 전달하기 위한 파일 경로
-FIX_ITEM_CODES_FILE = "/tmp/audit/fix_item_codes.json"
-FIX_TARGET_SERVER_FILE = "/tmp/audit/fix_target_server.json"
+    Job API 작업을 만들기 전이므로 job_id 자리에 run_id를 넣어 두고, 작업 생성 후
+    _attach_fix_jobs()가 대표 job_id로 바꾼다. (작업 생성에 실패한 요청도 failed 행으로 남음)
+    """
+    server_ids = list(per_server)
+    row = FixJob(
+        job_id=run_id,
+        run_id=run_id,
+        status="queued",
+        server_ids=server_ids,
+        item_codes=item_codes,
+        per_server=per_server,
+        total_items=sum(len(codes) for codes in per_server.values()),
+        created_at=datetime.now(),
+    )
+    db.add(row)
+    try:
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise RuntimeError(f"조치 작업 정보 저장 실패: {str(e)}") from e
 
 
-# Job API 엔드포인트
-JOB_API_URL = "http://localhost:8001"
+def _attach_fix_jobs(run_id: str, job_id: str, os_job_id: Optional[str], db_job_id: Optional[str],
+                     db: Session) -> dict:
+    """생성된 Job API 작업 ID를 fix_jobs 행에 기록 → 조치 정보 dict"""
+    try:
+        db.query(FixJob).filter(FixJob.job_id == run_id).update(
+            {"job_id": job_id, "os_job_id": os_job_id, "db_job_id": db_job_id},
+            synchronize_session=False,
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise RuntimeError(f"조치 작업 정보 저장 실패: {str(e)}") from e
+    db.expire_all()
+    return _fix_info_from_row(db.get(FixJob, job_id))
+
+
+def _fail_fix_job(run_id: str, db: Session) -> None:
+    """Job API 작업 생성 실패 → fix_jobs 행을 failed로 기록"""
+    try:
+        db.query(FixJob).filter(FixJob.job_id == run_id).update(
+            {"status": "failed", "finished_at": datetime.now()},
+            synchronize_session=False,
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"[WARN] fix_jobs 실패 상태 기록 실패 ({run_id}): {e}")
+
+
+def _read_fix_job(job_id: str) -> Optional[dict]:
+    """fix_jobs에서 조치 정보 조회 (진행률 스트림은 요청 세션이 없으므로 별도 세션 사용)"""
+    db = SessionLocal()
+    try:
+        row = db.get(FixJob, job_id)
+        return _fix_info_from_row(row) if row is not None else None
+    finally:
+        db.close()
 
-# Job별 조치 정보 저장 (job_id → {server_id(s), item_codes, os_job_id, db_job_id})
-_job_fix_info: dict[str, dict] = {}
+
+def _write_fix_job_status(job_id: str, status: str) -> None:
+    """진행률 조회에서 확인된 상태를 fix_jobs에 기록 (종료된 작업은 그대로 둠)"""
+    values = {"status": status}
+    if status in TERMINAL_STATUSES:
+        values["finished_at"] = datetime.now()
+
+    db = SessionLocal()
+    try:
+        db.query(FixJob).filter(
+            FixJob.job_id == job_id,
+            FixJob.status.notin_(TERMINAL_STATUSES),
+        ).update(values, synchronize_session=False)
+        db.commit()
+    except Exception as e:
+        # 상태 기록 실패는 진행률 응답에 영향을 주지 않음 (다음 조회에서 다시 기록)
+        db.rollback()
+        print(f"[WARN] fix_jobs 상태 기록 실패 ({job_id}): {e}")
+        raise
+    finally:
+        db.close()
+
+
+async def _get_fix_info(job_id: str) -> dict:
+    """job_id의 조치 정보 (캐시 → fix_jobs). 없으면 빈 dict"""
+    info = _fix_info_cache.get(job_id)
+    if info is None:
+        info = await run_in_thread(_read_fix_job, job_id)
+        if info is None:
+            return {}
+        _cache_fix_info(job_id, info)
+    return info
+
+
+async def _record_fix_status(job_id: str, fix_info: dict, status: str) -> None:
+    """상태가 바뀌었을 때만 fix_jobs에 기록 (작업당 queued → running → 종료 최대 몇 번)"""
+    if not fix_info or fix_info.get("status") == status or fix_info.get("status") in TERMINAL_STATUSES:
+        return
+    try:
+        await run_in_thread(_write_fix_job_status, job_id, status)
+    except Exception:
+        return
+    _cache_fix_info(job_id, {**fix_info, "status": status})
 
 
 def get_affected_servers(item_codes: List[str], company: str, db: Session) -> dict:
@@ -89,17 +252,98 @@ def get_affected_servers(item_codes: List[str], company: str, db: Session) -> di
     }
 
 
-def start_batch_fix(server_ids: List[str], item_codes: List[str], db: Session) -> Tuple[str, int]:
+def _split_items(item_codes: List[str]) -> Tuple[List[str], List[str]]:
+    """항목 코드를 OS(U-*) / DB(D-*, PG-D-*, MY-D-*) 조치 항목으로 분리"""
+    os_items = [c for c in item_codes if c.startswith("U-")]
+    db_items = [c for c in item_codes if c.startswith("D-") or c.startswith("PG-D-") or c.startswith("MY-D-")]
+    return os_items, db_items
+
+
+def _estimate_run_seconds(host_count: int, item_count: int) -> int:
+    """ansible-playbook 1회 예상 시간: 준비 + (호스트를 forks개씩 처리) × 항목 수"""
+    batches = math.ceil(host_count / max(FIX_ANSIBLE_FORKS, 1))
+    return int(FIX_RUN_OVERHEAD_SECONDS + batches * item_count * FIX_ITEM_EST_SECONDS)
+
+
+def _plan_section(kind: str, per_server: dict, server_groups: dict) -> dict:
+    """OS 또는 DB 조치 실행 그룹 + 웨이브"""
+    groups: dict[tuple, List[str]] = {}
+    for sid, codes in per_server.items():
+        os_items, db_items = _split_items(codes)
+        items = os_items if kind == "os" else db_items
+        if not items:
+            continue
+        key = (server_groups.get(sid, {}).get(kind) or "", tuple(sorted(items)))
+        groups.setdefault(key, []).append(sid)
+
+    runs = [
+        {
+            "group": group,
+            "server_ids": sids,
+            "item_codes": list(items),
+            "estimated_seconds": _estimate_run_seconds(len(sids), len(items)),
+        }
+        for (group, items), sids in groups.items()
+    ]
+    # 오래 걸리는 실행부터 웨이브에 배치 (웨이브 시간 = 가장 긴 실행)
+    runs.sort(key=lambda r: (-r["estimated_seconds"], r["group"], r["server_ids"][0]))
+    for index, run in enumerate(runs):
+        run["index"] = index
+
+    parallel = max(FIX_MAX_PARALLEL_RUNS, 1)
+    waves = [list(range(start, min(start + parallel, len(runs)))) for start in range(0, len(runs), parallel)]
+    return {
+        "runs": runs,
+        "waves": waves,
+        "estimated_seconds": sum(runs[w[0]]["estimated_seconds"] for w in waves),
+    }
+
+
+def plan_fix_runs(per_server: dict, server_groups: dict) -> dict:
     """
-    다중 서버 일괄 자동조치 시작
+    일괄 조치 실행 계획
+
+    OS / DB 조치 각각에 대해 같은 그룹(OS: os_type, DB: db_type)이면서 취약 항목 집합이 같은
+    서버끼리 하나의 ansible-playbook 실행(--limit)으로 묶는다. 실행 그룹끼리는 대상 호스트가
+    겹치지 않으므로 run.sh가 웨이브당 FIX_MAX_PARALLEL_RUNS개씩 병렬로 실행한다.
+    (항목이 많은 호스트 때문에 전체 플레이가 길어지지 않음)
 
     Args:
-        server_ids: 서버 ID 목록
-        item_codes: 조치할 항목 코드 목록
-        db: DB 세션
+        per_server: {server_id: [조치 항목 코드]}
+        server_groups: {server_id: {"os": os_type, "db": db_type}}
 
     Returns:
-        (job_id, total_items)
+        {"os": {runs, waves, estimated_seconds}, "db": {...}, "total_runs",
+         "estimated_seconds", "single_run_estimated_seconds"}
+        single_run_estimated_seconds는 전체 서버를 한 번에 실행할 때의 예상 시간 (비교용)
+    """
+    os_section = _plan_section("os", per_server, server_groups)
+    db_section = _plan_section("db", per_server, server_groups)
+
+    # 기존 방식: OS / DB 각각 전체 대상 서버에 항목 합집합을 한 번에 실행
+    single = 0
+    for kind in ("os", "db"):
+        targets = {sid: _split_items(codes)[0 if kind == "os" else 1] for sid, codes in per_server.items()}
+        targets = {sid: items for sid, items in targets.items() if items}
+        if targets:
+            union = {c for items in targets.values() for c in items}
+            single += _estimate_run_seconds(len(targets), len(union))
+
+    return {
+        "os": os_section,
+        "db": db_section,
+        "total_runs": len(os_section["runs"]) + len(db_section["runs"]),
+        "estimated_seconds": os_section["estimated_seconds"] + db_section["estimated_seconds"],
+        "single_run_estimated_seconds": single,
+    }
+
+
+def _plan_batch_fix(server_ids: List[str], item_codes: List[str], db: Session) -> Tuple[List[str], dict, List[str], dict]:
+    """
+    일괄 조치 대상 확정 (서버 검증 + 서버별 실제 취약 항목)
+
+    Returns:
+        (effective_server_ids, per_server, all_codes, server_groups)
     """
     if not server_ids:
         raise ValueError("조치할 서버가 없습니다")
@@ -143,76 +387,24 @@ def start_batch_fix(server_ids: List[str], item_codes: List[str], db: Session) -
     if not effective_server_ids:
         raise ValueError("조치할 취약 항목이 있는 서버가 없습니다")
 
-    all_codes = list(all_codes_set)
+    # 서버 순서는 요청 순서 유지
+    per_server = {sid: per_server[sid] for sid in effective_server_ids}
+    server_groups = {s.server_id: {"os": s.os_type, "db": s.db_type} for s in active_servers}
 
-    # OS(U-*) / DB(D-*) 분리
-    os_items = [c for c in all_codes if c.startswith("U-")]
-    db_items = [c for c in all_codes if c.startswith("D-") or c.startswith("PG-D-") or c.startswith("MY-D-")]
+    return effective_server_ids, per_server, list(all_codes_set), server_groups
 
-    os_job_id = None
-    db_job_id = None
-    primary_job_id = None
-
-    try:
-        # 조치 대상 파일 저장
-        os.makedirs("/tmp/audit", exist_ok=True)
-        with open(FIX_TARGET_SERVER_FILE, "w") as f:
-            json.dump({"server_ids": effective_server_ids}, f)
-        with open(FIX_ITEM_CODES_FILE, "w") as f:
-            json.dump(all_codes, f)
-
-        # OS 조치 항목이 있으면 fix 작업 실행
-        if os_items:
-            response = requests.post(f"{JOB_API_URL}/jobs/fix", timeout=5)
-            response.raise_for_status()
-            job_data = response.json()
-            os_job_id = job_data["job"]["job_id"]
-            primary_job_id = os_job_id
-
-        # DB 조치 항목이 있으면 fix-db 작업 실행
-        if db_items:
-            response = requests.post(f"{JOB_API_URL}/jobs/fix-db", timeout=5)
-            response.raise_for_status()
-            job_data = response.json()
-            db_job_id = job_data["job"]["job_id"]
-            if not primary_job_id:
-                primary_job_id = db_job_id
-
-        if not primary_job_id:
-            raise ValueError("조치할 항목이 없습니다")
-
-        # 총 조치 건수 = 서버별 취약 항목 수 합계
-        total_items = sum(len(codes) for codes in per_server.values()
-                         if any(c in all_codes_set for c in codes))
-
-        # 조치 정보 저장
-        _job_fix_info[primary_job_id] = {
-            "server_ids": effective_server_ids,
-            "server_id": effective_server_ids[0],  # 하위 호환
-            "item_codes": all_codes,
-            "per_server": per_server,
-            "os_job_id": os_job_id,
-            "db_job_id": db_job_id,
-        }
 
-        return primary_job_id, total_items
+def preview_batch_fix(server_ids: List[str], item_codes: List[str], db: Session) -> dict:
+    """일괄 조치 실행 계획 미리보기 (작업을 시작하지 않음)"""
+    effective_server_ids, per_server, all_codes, server_groups = _plan_batch_fix(server_ids, item_codes, db)
+    plan = plan_fix_runs(per_server, server_groups)
+    plan["server_ids"] = effective_server_ids
+    plan["total_items"] = sum(len(codes) for codes in per_server.values())
+    return plan
 
-    except requests.RequestException as e:
-        raise RuntimeError(f"조치 작업 실행 실패: {str(e)}")
 
-
-def start_fix(server_id: str, item_codes: List[str], db: Session) -> Tuple[str, int]:
-    """
-    자동조치 시작 (단일 서버)
-
-    Args:
-        server_id: 서버 ID
-        item_codes: 조치할 항목 코드 목록
-        db: 데이터베이스 세션
-
-    Returns:
-        (job_id, total_items)
-    """
+def _plan_fix(server_id: str, item_codes: List[str], db: Session) -> List[str]:
+    """단일 서버 조치 대상 확정 (요청 항목 중 실제 '취약' 상태인 항목)"""
     # 서버 존재 확인
     server = db.query(Server).filter(
         Server.server_id == server_id,
@@ -237,62 +429,193 @@ def start_fix(server_id: str, item_codes: List[str], db: Session) -> Tuple[str,
     filtered_codes = [c for c in item_codes if c in vulnerable_codes]
     if not filtered_codes:
         raise ValueError("조치할 취약 항목이 없습니다 (모든 항목이 이미 양호 상태)")
+    return filtered_codes
+
+
+def _prune_fix_runs() -> None:
+    """보관 기간이 지난 조치 실행 디렉터리/대기열 항목 삭제"""
+    cutoff = time.time() - _FIX_RUN_RETENTION_SECONDS
+    for base in [FIX_RUNS_DIR] + [os.path.join(FIX_QUEUE_DIR, kind) for kind in _FIX_JOB_TYPES]:
+        try:
+            names = os.listdir(base)
+        except FileNotFoundError:
+            continue
+        for name in names:
+            path = os.path.join(base, name)
+            try:
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    os.remove(path)
+            except OSError:
+                pass
 
-    item_codes = filtered_codes
 
-    # OS(U-*) / DB(D-*) 분리
-    os_items = [c for c in item_codes if c.startswith("U-")]
-    db_items = [c for c in item_codes if c.startswith("D-") or c.startswith("PG-D-") or c.startswith("MY-D-")]
+def _write_fix_run(run_id: str, target: dict, item_codes: List[str], per_server: dict,
+                   plan: Optional[dict] = None) -> None:
+    """
+    조치 대상 server_id(s), item_codes, 서버별 item_codes, 실행 계획을 실행 디렉터리에 저장 (run.sh / Ansible에서 사용)
+
+    run_id는 run.sh가 FIX_RUN_ID로 parse_fix_result에 넘겨 remediation_logs.run_id에 저장된다.
+    fix_os.yml / fix_db.yml은 서버별 목록이 있으면 해당 호스트의 취약 항목만 실행한다.
+    (item_codes 전체 목록은 서버별 목록이 없는 호스트용)
+    """
+    _prune_fix_runs()
+    run_dir = os.path.join(FIX_RUNS_DIR, run_id)
+    os.makedirs(run_dir, exist_ok=True)
+    files = {
+        "target.json": {**target, "run_id": run_id},
+        "item_codes.json": item_codes,
+        "host_items.json": {"fix_host_items": per_server},
+    }
+    if plan is not None:
+        files["plan.json"] = {"run_id": run_id, **plan}
+    for name, data in files.items():
+        with open(os.path.join(run_dir, name), "w") as f:
+            json.dump(data, f)
+
 
-    os_job_id = None
-    db_job_id = None
-    primary_job_id = None
+def _enqueue_fix_run(run_id: str, kinds: List[str]) -> dict:
+    """
+    조치 실행을 kind(os/db)별 대기열에 준비 중(.pending) 항목으로 등록 → {kind: 항목 경로}
 
+    순번을 매기고 파일을 만드는 동안만 대기열 잠금(워커 프로세스 간 공유)을 잡는다.
+    잠금 획득부터 해제까지 한 스레드 호출 안에서 끝나므로 요청이 취소되어도 잠금이 남지 않는다.
+    """
+    os.makedirs(FIX_QUEUE_DIR, exist_ok=True)
+    fd = os.open(FIX_QUEUE_LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o600)
     try:
-        # 조치 대상 server_id + item_codes를 파일에 저장 (run.sh / Ansible에서 사용)
-        os.makedirs("/tmp/audit", exist_ok=True)
-        with open(FIX_TARGET_SERVER_FILE, "w") as f:
-            json.dump({"server_id": server_id}, f)
-        with open(FIX_ITEM_CODES_FILE, "w") as f:
-            json.dump(item_codes, f)
-
-        # OS 조치 항목이 있으면 fix 작업 실행
-        if os_items:
-            response = requests.post(f"{JOB_API_URL}/jobs/fix", timeout=5)
-            response.raise_for_status()
-            job_data = response.json()
-            os_job_id = job_data["job"]["job_id"]
-            primary_job_id = os_job_id
-
-        # DB 조치 항목이 있으면 fix-db 작업 실행
-        if db_items:
-            response = requests.post(f"{JOB_API_URL}/jobs/fix-db", timeout=5)
-            response.raise_for_status()
-            job_data = response.json()
-            db_job_id = job_data["job"]["job_id"]
-            if not primary_job_id:
-                primary_job_id = db_job_id
-
-        if not primary_job_id:
-            raise ValueError("조치할 항목이 없습니다")
-
-        # 조치 정보 저장
-        _job_fix_info[primary_job_id] = {
-            "server_id": server_id,
-            "server_ids": [server_id],
-            "item_codes": item_codes,
-            "per_server": {server_id: item_codes},
-            "os_job_id": os_job_id,
-            "db_job_id": db_job_id,
-        }
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        entries = {}
+        seq = time.time_ns()
+        for kind in kinds:
+            queue_dir = os.path.join(FIX_QUEUE_DIR, kind)
+            os.makedirs(queue_dir, exist_ok=True)
+            path = os.path.join(queue_dir, f"{seq:020d}-{run_id}{_FIX_QUEUE_PENDING_SUFFIX}")
+            open(path, "x").close()
+            entries[kind] = path
+        return entries
+    finally:
+        os.close(fd)
+
+
+def _activate_fix_run(path: str) -> None:
+    """작업이 생성된 대기열 항목을 준비 상태로 전환 (run.sh가 가져갈 수 있음)"""
+    os.rename(path, path[:-len(_FIX_QUEUE_PENDING_SUFFIX)])
+
+
+def _dequeue_fix_run(paths: List[str]) -> None:
+    """작업을 만들지 못한 준비 중 대기열 항목 제거 (어떤 작업도 이 실행을 가져가지 않도록)"""
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+async def _launch_fix_jobs(run_id: str, item_codes: List[str]) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    OS(U-*) / DB(D-*) 조치 작업 실행
+
+    run_id를 준비 중 항목으로 대기열에 넣고(잠금은 등록 동안만), 잠금 밖에서 작업을 만든 뒤
+    항목을 준비 상태로 바꾼다. 작업을 만들지 못한 항목은 지우므로 실패한 실행은 어떤 작업도 가져가지 않는다.
+    (동시에 시작한 조치끼리는 먼저 생성된 작업이 먼저 준비된 실행을 가져가므로,
+    작업 ID와 실행이 서로 바뀔 수 있다. 결과는 run_id로 조회하므로 영향이 없다)
+
+    Returns:
+        (primary_job_id, os_job_id, db_job_id)
+    """
+    os_items, db_items = _split_items(item_codes)
+    kinds = [kind for kind, items in (("os", os_items), ("db", db_items)) if items]
+    if not kinds:
+        raise ValueError("조치할 항목이 없습니다")
+
+    job_ids: dict = {}
+    entries = await run_in_thread(_enqueue_fix_run, run_id, kinds)
+    try:
+        for kind in kinds:
+            job_ids[kind] = await job_api.create_job(_FIX_JOB_TYPES[kind])
+            await run_in_thread(_activate_fix_run, entries[kind])
+            entries.pop(kind)
+    except BaseException as e:
+        # 취소(CancelledError) 중에도 정리되도록 await 없이 바로 지운다 (파일 삭제뿐)
+        _dequeue_fix_run(list(entries.values()))
+        if isinstance(e, JobAPIError):
+            raise type(e)(f"조치 작업 실행 실패: {str(e)}") from e
+        raise
+
+    os_job_id = job_ids.get("os")
+    db_job_id = job_ids.get("db")
+    return os_job_id or db_job_id, os_job_id, db_job_id
+
+
+async def _start_fix_run(run_id: str, per_server: dict, item_codes: List[str], db: Session) -> str:
+    """fix_jobs 등록(queued) → Job API 작업 생성 → 작업 ID 기록. 생성 실패 시 행을 failed로 남기고 예외 전달"""
+    await run_in_thread(_register_fix_job, run_id, per_server, item_codes, db)
+    try:
+        primary_job_id, os_job_id, db_job_id = await _launch_fix_jobs(run_id, item_codes)
+    except Exception:
+        await run_in_thread(_fail_fix_job, run_id, db)
+        raise
+
+    fix_info = await run_in_thread(_attach_fix_jobs, run_id, primary_job_id, os_job_id, db_job_id, db)
+    _cache_fix_info(primary_job_id, fix_info)
+    return primary_job_id
+
+
+async def start_batch_fix(server_ids: List[str], item_codes: List[str], db: Session) -> Tuple[str, int]:
+    """
+    다중 서버 일괄 자동조치 시작
+
+    Args:
+        server_ids: 서버 ID 목록
+        item_codes: 조치할 항목 코드 목록
+        db: DB 세션
 
-        return primary_job_id, len(item_codes)
+    Returns:
+        (job_id, total_items)
+    """
+    effective_server_ids, per_server, all_codes, server_groups = await run_in_thread(
+        _plan_batch_fix, server_ids, item_codes, db
+    )
+    run_id = uuid.uuid4().hex
+    plan = plan_fix_runs(per_server, server_groups)
+
+    # 조치 실행 파일 저장 (서버별 취약 항목 + 실행 계획 포함)
+    await run_in_thread(_write_fix_run, run_id, {"server_ids": effective_server_ids},
+                        all_codes, per_server, plan)
+    primary_job_id = await _start_fix_run(run_id, per_server, all_codes, db)
 
-    except requests.RequestException as e:
-        raise RuntimeError(f"조치 작업 실행 실패: {str(e)}")
+    # 총 조치 건수 = 서버별 취약 항목 수 합계
+    total_items = sum(len(codes) for codes in per_server.values())
+    return primary_job_id, total_items
 
 
-def get_fix_progress(job_id: str) -> dict:
+async def start_fix(server_id: str, item_codes: List[str], db: Session) -> Tuple[str, int]:
+    """
+    자동조치 시작 (단일 서버)
+
+    Args:
+        server_id: 서버 ID
+        item_codes: 조치할 항목 코드 목록
+        db: 데이터베이스 세션
+
+    Returns:
+        (job_id, total_items)
+    """
+    item_codes = await run_in_thread(_plan_fix, server_id, item_codes, db)
+    run_id = uuid.uuid4().hex
+
+    await run_in_thread(_write_fix_run, run_id, {"server_id": server_id},
+                        item_codes, {server_id: item_codes})
+    primary_job_id = await _start_fix_run(run_id, {server_id: item_codes}, item_codes, db)
+
+    return primary_job_id, len(item_codes)
+
+
+async def get_fix_progress(job_id: str) -> dict:
     """
     조치 진행률 조회
 
@@ -302,7 +625,7 @@ def get_fix_progress(job_id: str) -> dict:
     Returns:
         진행 상황 정보
     """
-    fix_info = _job_fix_info.get(job_id, {})
+    fix_info = await _get_fix_info(job_id)
     os_job_id = fix_info.get("os_job_id")
     db_job_id = fix_info.get("db_job_id")
 
@@ -317,15 +640,14 @@ def get_fix_progress(job_id: str) -> dict:
         jobs_to_check = [job_id]
 
     try:
+        # OS / DB 작업 상태를 동시에 조회
+        jobs = await asyncio.gather(*(job_api.get_job(jid) for jid in jobs_to_check))
+
         combined_progress = 0
         all_completed = True
         any_failed = False
 
-        for jid in jobs_to_check:
-            response = requests.get(f"{JOB_API_URL}/jobs/{jid}", timeout=5)
-            response.raise_for_status()
-            job = response.json()
-
+        for job in jobs:
             status = job.get("status", "queued")
             if status == "success":
                 status = "completed"
@@ -362,6 +684,8 @@ def get_fix_progress(job_id: str) -> dict:
         else:
             final_status = "queued"
 
+        await _record_fix_status(job_id, fix_info, final_status)
+
         return {
             "job_id": job_id,
             "status": final_status,
@@ -370,7 +694,7 @@ def get_fix_progress(job_id: str) -> dict:
             "total_items": len(fix_info.get("item_codes", []))
         }
 
-    except requests.RequestException as e:
+    except JobAPIError as e:
         return {
             "job_id": job_id,
             "status": "failed",
@@ -380,7 +704,7 @@ def get_fix_progress(job_id: str) -> dict:
         }
 
 
-def get_fix_result(job_id: str, db: Session) -> Optional[dict]:
+async def get_fix_result(job_id: str, db: Session) -> Optional[dict]:
     """
     조치 결과 조회 (단일/다중 서버 모두 지원)
 
@@ -391,7 +715,7 @@ def get_fix_result(job_id: str, db: Session) -> Optional[dict]:
     Returns:
         조치 결과 요약 (servers 필드 포함)
     """
-    fix_info = _job_fix_info.get(job_id, {})
+    fix_info = await _get_fix_info(job_id)
     server_ids = fix_info.get("server_ids", [])
     item_codes = fix_info.get("item_codes", [])
 
@@ -405,12 +729,22 @@ def get_fix_result(job_id: str, db: Session) -> Optional[dict]:
         return None
 
     # 진행 상태 확인
-    progress = get_fix_progress(job_id)
+    progress = await get_fix_progress(job_id)
     if progress["status"] != "completed":
         return None
 
-    # 최근 10분 이내 조치 결과 조회 (모든 서버)
-    time_threshold = datetime.now() - timedelta(minutes=10)
+    return await run_in_thread(_load_fix_result, job_id, fix_info, server_ids, item_codes, db)
+
+
+def _load_fix_result(job_id: str, fix_info: dict, server_ids: List[str], item_codes: List[str], db: Session) -> dict:
+    """remediation_logs에서 조치 결과 집계"""
+    run_id = fix_info.get("run_id")
+    if run_id:
+        # 이 조치 실행이 적재한 행만 조회 (idx_rl_run)
+        scope = RemediationLog.run_id == run_id
+    else:
+        # run_id 이전에 등록된 작업: 최근 10분 이내 조치 결과 조회 (모든 서버)
+        scope = RemediationLog.action_date >= datetime.now() - timedelta(minutes=10)
 
     results = db.query(
         RemediationLog.server_id,
@@ -418,6 +752,7 @@ def get_fix_result(job_id: str, db: Session) -> Optional[dict]:
         RemediationLog.is_success,
         RemediationLog.failure_reason,
         RemediationLog.raw_evidence,
+        RemediationLog.evidence_hash,
         RemediationLog.action_date,
         KisaItem.title,
         Server.hostname,
@@ -428,7 +763,7 @@ def get_fix_result(job_id: str, db: Session) -> Optional[dict]:
     ).filter(
         RemediationLog.server_id.in_(server_ids),
         RemediationLog.item_code.in_(item_codes),
-        RemediationLog.action_date >= time_threshold
+        scope,
     ).order_by(
         RemediationLog.server_id,
         RemediationLog.item_code
@@ -439,6 +774,7 @@ def get_fix_result(job_id: str, db: Session) -> Optional[dict]:
     per_server_results: dict[str, dict] = {}
     total_success = 0
     total_fail = 0
+    evidence = EvidenceResolver(db, [r.evidence_hash for r in results if not r.raw_evidence])
 
     for r in results:
         item_dict = {
@@ -446,7 +782,7 @@ def get_fix_result(job_id: str, db: Session) -> Optional[dict]:
             "title": r.title,
             "is_success": r.is_success,
             "failure_reason": r.failure_reason,
-            "raw_evidence": r.raw_evidence or "",
+            "raw_evidence": evidence.get(r.raw_evidence, r.evidence_hash),
             "action_date": r.action_date.strftime("%Y-%m-%d %H:%M") if r.action_date else ""
         }
         all_items.append(item_dict)
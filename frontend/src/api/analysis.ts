@@ -25,7 +25,7 @@ export interface CheckItem {
   has_exception: boolean;
   auto_fix: boolean;
   severity: string;
-  raw_evidence: string;
+  raw_evidence?: string;  // include_evidence=false로 조회하면 없음 → getServerEvidence로 지연 조회
   scan_date: string;
   guide: string;
   auto_fix_description: string;
@@ -36,7 +36,7 @@ export interface RemediationItem {
   title: string;
   is_success: boolean;
   failure_reason: string;
-  raw_evidence: string;
+  raw_evidence?: string;
   action_date: string;
   severity: string;
   auto_fix: boolean;
@@ -86,11 +86,13 @@ export async function getAnalysisServers(): Promise<AnalysisServer[]> {
 
 /**
  * 서버별 점검 결과 조회
+ * - includeEvidence=false면 raw_evidence 제외 (펼친 카테고리만 getServerEvidence로 조회)
  */
-export async function getServerResults(serverId: string): Promise<ServerResults> {
+export async function getServerResults(serverId: string, includeEvidence = true): Promise<ServerResults> {
   const token = localStorage.getItem('access_token');
   const response = await axios.get(`${API_URL}/api/analysis/servers/${serverId}/results`, {
     headers: { Authorization: `Bearer ${token}` },
+    params: { include_evidence: includeEvidence },
   });
   return response.data;
 }
@@ -98,14 +100,32 @@ export async function getServerResults(serverId: string): Promise<ServerResults>
 /**
  * 서버별 조치 이력 조회
  */
-export async function getRemediationHistory(serverId: string): Promise<RemediationResults> {
+export async function getRemediationHistory(serverId: string, includeEvidence = true): Promise<RemediationResults> {
   const token = localStorage.getItem('access_token');
   const response = await axios.get(`${API_URL}/api/analysis/servers/${serverId}/remediation`, {
     headers: { Authorization: `Bearer ${token}` },
+    params: { include_evidence: includeEvidence },
   });
   return response.data;
 }
 
+/**
+ * 항목별 raw_evidence 조회 (단건/다건)
+ * - source=scan: 점검 결과, source=remediation: 최신 조치 이력
+ */
+export async function getServerEvidence(
+  serverId: string,
+  itemCodes: string[],
+  source: 'scan' | 'remediation' = 'scan'
+): Promise<{ [itemCode: string]: string }> {
+  const token = localStorage.getItem('access_token');
+  const response = await axios.get(`${API_URL}/api/analysis/servers/${serverId}/evidence`, {
+    headers: { Authorization: `Bearer ${token}` },
+    params: { item_codes: itemCodes.join(','), source },
+  });
+  return response.data.items;
+}
+
 export interface ScanHistoryItem {
   scan_date: string;
   server_id: string;
@@ -133,6 +153,7 @@ export interface HistoryData {
 export async function getHistory(): Promise<HistoryData> {
   const token = localStorage.getItem('access_token');
   const response = await axios.get(`${API_URL}/api/analysis/history`, {
+    params: { legacy: true },
     headers: { Authorization: `Bearer ${token}` },
   });
   return response.data;
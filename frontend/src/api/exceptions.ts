@@ -43,6 +43,7 @@ export interface ExceptionBulkCreateRequest {
 export async function getExceptions(): Promise<ExceptionListResponse> {
   const token = localStorage.getItem('access_token');
   const response = await axios.get(`${API_URL}/api/exceptions`, {
+    params: { legacy: true },
     headers: { Authorization: `Bearer ${token}` },
   });
   return response.data;
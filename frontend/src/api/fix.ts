@@ -3,6 +3,7 @@
  */
 
 import axios from 'axios';
+import { subscribeProgress } from './progressStream';
 
 const API_URL = `http://${window.location.hostname}:8000`;
 
@@ -71,6 +72,30 @@ export interface AffectedServersResponse {
   total_fixable: number;
 }
 
+export interface FixPlanRun {
+  index: number;
+  group: string;
+  server_ids: string[];
+  item_codes: string[];
+  estimated_seconds: number;
+}
+
+export interface FixPlanSection {
+  runs: FixPlanRun[];
+  waves: number[][];
+  estimated_seconds: number;
+}
+
+export interface FixPlan {
+  server_ids: string[];
+  total_items: number;
+  os: FixPlanSection;
+  db: FixPlanSection;
+  total_runs: number;
+  estimated_seconds: number;
+  single_run_estimated_seconds: number;
+}
+
 /**
  * 자동조치 실행 (단일 서버)
  */
@@ -97,6 +122,19 @@ export async function startBatchFix(serverIds: string[], itemCodes: string[]): P
   return response.data;
 }
 
+/**
+ * 일괄 자동조치 실행 계획 조회 (실행하지 않음)
+ */
+export async function planBatchFix(serverIds: string[], itemCodes: string[]): Promise<FixPlan> {
+  const token = localStorage.getItem('access_token');
+  const response = await axios.post<FixPlan>(
+    `${API_URL}/api/fix/plan`,
+    { server_ids: serverIds, item_codes: itemCodes },
+    { headers: { Authorization: `Bearer ${token}` } }
+  );
+  return response.data;
+}
+
 /**
  * 영향받는 서버 목록 조회
  */
@@ -122,6 +160,17 @@ export async function getFixProgress(jobId: string): Promise<FixProgress> {
   return response.data;
 }
 
+/**
+ * 조치 진행률 구독 (SSE) — 구독 해제 함수 반환
+ */
+export function streamFixProgress(
+  jobId: string,
+  onProgress: (progress: FixProgress) => void,
+  onError: (error: unknown) => void
+): () => void {
+  return subscribeProgress<FixProgress>(`/api/fix/progress/${jobId}/stream`, onProgress, onError);
+}
+
 /**
  * 조치 결과 조회
  */
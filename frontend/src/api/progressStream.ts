@@ -0,0 +1,68 @@
+/**
+ * 작업 진행률 SSE 구독 (GET /api/{scan|fix}/progress/{job_id}/stream)
+ *
+ * EventSource는 Authorization 헤더를 보낼 수 없으므로 fetch 스트림으로 읽고
+ * `event: progress` 블록의 data(JSON)를 onProgress로 전달한다.
+ * 서버는 completed / failed 이벤트 후 스트림을 닫는다.
+ */
+
+const API_URL = `http://${window.location.hostname}:8000`;
+
+/**
+ * @returns 구독 해제 함수
+ * @param onError 스트림을 열 수 없거나 종료 이벤트 전에 끊긴 경우 (호출 측에서 폴링으로 대체)
+ */
+export function subscribeProgress<T extends { status: string }>(
+  path: string,
+  onProgress: (progress: T) => void,
+  onError: (error: unknown) => void
+): () => void {
+  const controller = new AbortController();
+  const token = localStorage.getItem('access_token');
+
+  const run = async () => {
+    const response = await fetch(`${API_URL}${path}`, {
+      headers: { Authorization: `Bearer ${token}`, Accept: 'text/event-stream' },
+      signal: controller.signal,
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`progress stream failed: ${response.status}`);
+    }
+
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    let finished = false;
+
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += value;
+
+      let sep: number;
+      while ((sep = buffer.indexOf('\n\n')) >= 0) {
+        const block = buffer.slice(0, sep);
+        buffer = buffer.slice(sep + 2);
+
+        let event = 'message';
+        const data: string[] = [];
+        for (const line of block.split('\n')) {
+          if (line.startsWith('event:')) event = line.slice(6).trim();
+          else if (line.startsWith('data:')) data.push(line.slice(5).trimStart());
+        }
+        if (event !== 'progress' || data.length === 0) continue;  // keep-alive 주석 등
+
+        const progress = JSON.parse(data.join('\n')) as T;
+        onProgress(progress);
+        if (progress.status === 'completed' || progress.status === 'failed') finished = true;
+      }
+    }
+
+    if (!finished) throw new Error('progress stream closed before completion');
+  };
+
+  run().catch(error => {
+    if (!controller.signal.aborted) onError(error);
+  });
+
+  return () => controller.abort();
+}
@@ -3,6 +3,7 @@
  */
 
 import axios from 'axios';
+import { subscribeProgress } from './progressStream';
 
 const API_URL = `http://${window.location.hostname}:8000`;
 
@@ -93,6 +94,17 @@ export async function getScanProgress(jobId: string): Promise<ScanProgress> {
   return response.data;
 }
 
+/**
+ * 점검 진행률 구독 (SSE) — 구독 해제 함수 반환
+ */
+export function streamScanProgress(
+  jobId: string,
+  onProgress: (progress: ScanProgress) => void,
+  onError: (error: unknown) => void
+): () => void {
+  return subscribeProgress<ScanProgress>(`/api/scan/progress/${jobId}/stream`, onProgress, onError);
+}
+
 /**
  * 점검 결과 조회
  */
@@ -120,6 +132,7 @@ export async function getAllServerIds(): Promise<string[]> {
   const response = await axios.get<any[]>(
     `${API_URL}/api/assets`,
     {
+      params: { legacy: true },
       headers: {
         Authorization: `Bearer ${token}`,
       },
@@ -8,10 +8,10 @@
 import { useEffect, useState, useCallback, useMemo } from 'react';
 import { useNavigate } from 'react-router-dom';
 import {
-  startFix, startBatchFix,
-  getFixProgress, getFixResult, getAffectedServers
+  startFix, startBatchFix, planBatchFix,
+  getFixProgress, streamFixProgress, getFixResult, getAffectedServers
 } from '../api/fix';
-import type { FixResult, AffectedServerInfo } from '../api/fix';
+import type { FixProgress, FixResult, AffectedServerInfo, FixPlan } from '../api/fix';
 import type { CheckItem, AnalysisServer } from '../api/analysis';
 import './RemediationModal.css';
 
@@ -27,7 +27,7 @@ const CATEGORY_MAP: { [key: string]: string } = {
 };
 
 // raw_evidence에서 reason_line(첫 줄)만 추출
-function extractReasonLine(raw: string): string {
+function extractReasonLine(raw?: string): string {
   if (!raw) return '';
   let detailFull = '';
   try {
@@ -55,6 +55,12 @@ function extractReasonLine(raw: string): string {
   return nlIdx > 0 ? detailFull.slice(0, nlIdx) : detailFull;
 }
 
+// 예상 소요 시간 표시 (초 → "약 N분")
+function formatEstimate(seconds: number): string {
+  if (seconds < 60) return `약 ${seconds}초`;
+  return `약 ${Math.round(seconds / 60)}분`;
+}
+
 export interface FixableItemWithCategory extends CheckItem {
   category: string;
 }
@@ -81,6 +87,7 @@ export function RemediationModal({ serverId, servers, items, onClose, onComplete
   const [loadingAffected, setLoadingAffected] = useState(false);
   const [selectedServerIds, setSelectedServerIds] = useState<Set<string>>(new Set([serverId]));
   const [serverSearch, setServerSearch] = useState('');
+  const [fixPlan, setFixPlan] = useState<FixPlan | null>(null);
 
   // 서버별 확장/축소
   const [expandedServers, setExpandedServers] = useState<Set<string>>(new Set([serverId]));
@@ -204,45 +211,84 @@ export function RemediationModal({ serverId, servers, items, onClose, onComplete
     }
   };
 
-  // 진행 상황 폴링
+  // 진행 상황 구독 (SSE, 스트림을 쓸 수 없으면 1초 폴링으로 대체)
   useEffect(() => {
     if (phase !== 'progress' || !jobId) return;
 
-    const interval = setInterval(async () => {
-      try {
-        const progressData = await getFixProgress(jobId);
-        setProgress(progressData.progress);
-        setProgressMessage(progressData.message);
-
-        if (progressData.status === 'completed') {
-          clearInterval(interval);
-          setTimeout(async () => {
-            try {
-              const result = await getFixResult(jobId);
-              setFixResult(result);
-              if (result.servers && result.servers.length > 0) {
-                setExpandedResultServers(new Set([result.servers[0].server_id]));
-              }
-              setPhase('result');
-            } catch (error) {
-              console.error('Failed to fetch fix result:', error);
-              setPhase('result');
+    let interval: ReturnType<typeof setInterval> | undefined;
+    let finished = false;
+
+    const handleProgress = (progressData: FixProgress) => {
+      if (finished) return;
+      setProgress(progressData.progress);
+      setProgressMessage(progressData.message);
+
+      if (progressData.status === 'completed') {
+        finished = true;
+        clearInterval(interval);
+        setTimeout(async () => {
+          try {
+            const result = await getFixResult(jobId);
+            setFixResult(result);
+            if (result.servers && result.servers.length > 0) {
+              setExpandedResultServers(new Set([result.servers[0].server_id]));
             }
-          }, 1000);
-        }
+            setPhase('result');
+          } catch (error) {
+            console.error('Failed to fetch fix result:', error);
+            setPhase('result');
+          }
+        }, 1000);
+      }
 
-        if (progressData.status === 'failed') {
-          clearInterval(interval);
-          alert('조치 중 오류가 발생했습니다');
-          onClose();
+      if (progressData.status === 'failed') {
+        finished = true;
+        clearInterval(interval);
+        alert('조치 중 오류가 발생했습니다');
+        onClose();
+      }
+    };
+
+    const unsubscribe = streamFixProgress(jobId, handleProgress, (error) => {
+      console.error('Fix progress stream unavailable, falling back to polling:', error);
+      if (finished) return;
+      interval = setInterval(async () => {
+        try {
+          handleProgress(await getFixProgress(jobId));
+        } catch (error) {
+          console.error('Failed to fetch fix progress:', error);
         }
+      }, 1000);
+    });
+
+    return () => {
+      unsubscribe();
+      clearInterval(interval);
+    };
+  }, [phase, jobId, onClose]);
+
+  // 일괄 조치 실행 계획 (실행 그룹 수 / 예상 시간) — 선택이 바뀌면 잠시 후 다시 조회
+  const planServerKey = Array.from(selectedServerIds).sort().join(',');
+  const planItemKey = activeItems.map(i => i.item_code).join(',');
+  useEffect(() => {
+    setFixPlan(null);
+    if (phase !== 'confirm' || selectedServerIds.size < 2 || activeItems.length === 0) return;
+
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const plan = await planBatchFix(Array.from(selectedServerIds), activeItems.map(i => i.item_code));
+        if (!cancelled) setFixPlan(plan);
       } catch (error) {
-        console.error('Failed to fetch fix progress:', error);
+        console.error('Failed to load fix plan:', error);
       }
-    }, 1000);
+    }, 300);
 
-    return () => clearInterval(interval);
-  }, [phase, jobId, onClose]);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [phase, planServerKey, planItemKey]);
 
   // 멀티 서버 여부
   const isMultiServer = servers.length > 1;
@@ -413,6 +459,12 @@ export function RemediationModal({ serverId, servers, items, onClose, onComplete
               <span className="fix-summary-text">
                 총 <strong>{summary.serverCount}</strong>대 서버 &middot;{' '}
                 <strong>{summary.totalCount}</strong>건 조치
+                {fixPlan && (
+                  <>
+                    {' '}&middot; 실행 그룹 <strong>{fixPlan.total_runs}</strong>개 &middot;{' '}
+                    예상 {formatEstimate(fixPlan.estimated_seconds)}
+                  </>
+                )}
               </span>
             ) : (
               <span className="fix-summary-text">
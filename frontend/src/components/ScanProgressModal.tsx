@@ -4,7 +4,7 @@
 
 import { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { getScanProgress, getScanResult } from '../api/scan';
+import { getScanProgress, streamScanProgress, getScanResult } from '../api/scan';
 import type { ScanProgress, ScanResult } from '../api/scan';
 import './ScanProgressModal.css';
 
@@ -22,44 +22,59 @@ export function ScanProgressModal({ jobId, totalServers, onComplete, onClose }:
   const [currentPage, setCurrentPage] = useState<1 | 2 | 3 | 4>(1); // 4단계 페이지
   const [isCompleted, setIsCompleted] = useState(false);
 
-  // 점검 진행 상황 폴링
+  // 점검 진행 상황 구독 (SSE, 스트림을 쓸 수 없으면 1초 폴링으로 대체)
   useEffect(() => {
-    const interval = setInterval(async () => {
-      try {
-        const progressData = await getScanProgress(jobId);
-        setProgress(progressData);
-
-        // 점검 완료 시
-        if (progressData.status === 'completed' && !isCompleted) {
-          clearInterval(interval);
-          setIsCompleted(true);
-
-          // 결과 조회
-          setTimeout(async () => {
-            try {
-              const resultData = await getScanResult(jobId);
-              setResult(resultData);
-              setCurrentPage(2); // 첫 번째 결과 페이지로 이동
-            } catch (error) {
-              console.error('Failed to fetch scan result:', error);
-            }
-          }, 1000);
-        }
-
-        // 점검 실패 시
-        if (progressData.status === 'failed') {
-          clearInterval(interval);
-          alert('점검 중 오류가 발생했습니다. 다시 시도해주세요.');
-          onClose();
-        }
-
-      } catch (error) {
-        console.error('Failed to fetch scan progress:', error);
+    let interval: ReturnType<typeof setInterval> | undefined;
+    let finished = false;
+
+    const handleProgress = (progressData: ScanProgress) => {
+      if (finished) return;
+      setProgress(progressData);
+
+      // 점검 완료 시
+      if (progressData.status === 'completed') {
+        finished = true;
+        clearInterval(interval);
+        setIsCompleted(true);
+
+        // 결과 조회
+        setTimeout(async () => {
+          try {
+            const resultData = await getScanResult(jobId);
+            setResult(resultData);
+            setCurrentPage(2); // 첫 번째 결과 페이지로 이동
+          } catch (error) {
+            console.error('Failed to fetch scan result:', error);
+          }
+        }, 1000);
       }
-    }, 1000);
 
-    return () => clearInterval(interval);
-  }, [jobId, isCompleted, onClose]);
+      // 점검 실패 시
+      if (progressData.status === 'failed') {
+        finished = true;
+        clearInterval(interval);
+        alert('점검 중 오류가 발생했습니다. 다시 시도해주세요.');
+        onClose();
+      }
+    };
+
+    const unsubscribe = streamScanProgress(jobId, handleProgress, (error) => {
+      console.error('Scan progress stream unavailable, falling back to polling:', error);
+      if (finished) return;
+      interval = setInterval(async () => {
+        try {
+          handleProgress(await getScanProgress(jobId));
+        } catch (error) {
+          console.error('Failed to fetch scan progress:', error);
+        }
+      }, 1000);
+    });
+
+    return () => {
+      unsubscribe();
+      clearInterval(interval);
+    };
+  }, [jobId, onClose]);
 
   // 다음 단계로
   const handleNext = () => {
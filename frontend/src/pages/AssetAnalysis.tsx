@@ -5,9 +5,9 @@
  */
 
 import { useNavigate, useSearchParams } from 'react-router-dom';
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import {
-  getAnalysisServers, getServerResults, getRemediationHistory,
+  getAnalysisServers, getServerResults, getRemediationHistory, getServerEvidence,
   type AnalysisServer, type ServerResults, type CategoryResult,
   type RemediationResults, type RemediationCategoryResult
 } from '../api/analysis';
@@ -80,8 +80,28 @@ function parseEvidence(raw: string): ParsedEvidence {
   return { reasonLine, detail };
 }
 
+// 카테고리별 결과에 지연 조회한 raw_evidence 병합 (조회 결과에 없는 항목은 빈 문자열)
+function mergeEvidence<T extends { items: { item_code: string; raw_evidence?: string }[] }>(
+  categories: { [key: string]: T },
+  codes: Set<string>,
+  evidence: { [itemCode: string]: string }
+): { [key: string]: T } {
+  const merged: { [key: string]: T } = {};
+  for (const [catKey, catData] of Object.entries(categories)) {
+    merged[catKey] = {
+      ...catData,
+      items: catData.items.map(item =>
+        codes.has(item.item_code) && item.raw_evidence === undefined
+          ? { ...item, raw_evidence: evidence[item.item_code] ?? '' }
+          : item
+      ),
+    };
+  }
+  return merged;
+}
+
 function EvidenceCell({ raw, overrideText, mode = 'scan', guide, autoFix }: {
-  raw: string;
+  raw?: string;
   overrideText?: string;
   mode?: 'scan' | 'remediation';
   guide?: string;
@@ -103,6 +123,8 @@ function EvidenceCell({ raw, overrideText, mode = 'scan', guide, autoFix }: {
     );
   }
 
+  if (raw === undefined) return <td className="col-evidence">불러오는 중...</td>;
+
   const { reasonLine, detail } = parseEvidence(raw);
 
   if (!reasonLine && !detail) return <td className="col-evidence">-</td>;
@@ -149,6 +171,8 @@ export function AssetAnalysis() {
     serverId: string; itemCode: string; itemTitle: string;
   } | null>(null);
   const [selectedFixItems, setSelectedFixItems] = useState<Set<string>>(new Set());
+  // 조회 중인 증적 (source:item_code) — 같은 항목을 중복 요청하지 않도록
+  const evidencePending = useRef<Set<string>>(new Set());
 
   let user: any = {};
   try {
@@ -188,7 +212,8 @@ export function AssetAnalysis() {
   const loadServerResults = async (serverId: string) => {
     try {
       setResultsLoading(true);
-      const data = await getServerResults(serverId);
+      const data = await getServerResults(serverId, false);
+      evidencePending.current.clear();
       setServerResults(data);
       setExpandedCategories(new Set());
     } catch (error: any) {
@@ -204,13 +229,61 @@ export function AssetAnalysis() {
 
   const loadRemediationHistory = async (serverId: string) => {
     try {
-      const data = await getRemediationHistory(serverId);
+      const data = await getRemediationHistory(serverId, false);
       setRemediationResults(data);
     } catch (error: any) {
       console.error('Failed to load remediation history:', error);
     }
   };
 
+  // raw_evidence는 목록에서 제외하고, 필요한 항목(펼친 카테고리, 자동조치 대상)만 모아서 조회
+  const loadEvidence = async (
+    source: 'scan' | 'remediation',
+    items: { item_code: string; raw_evidence?: string }[]
+  ) => {
+    if (!selectedServerId) return;
+    const codes = items
+      .filter(i => i.raw_evidence === undefined && !evidencePending.current.has(`${source}:${i.item_code}`))
+      .map(i => i.item_code);
+    if (codes.length === 0) return;
+
+    codes.forEach(c => evidencePending.current.add(`${source}:${c}`));
+    try {
+      const evidence = await getServerEvidence(selectedServerId, codes, source);
+      const codeSet = new Set(codes);
+      if (source === 'scan') {
+        setServerResults(prev => prev && {
+          ...prev,
+          os_results: mergeEvidence(prev.os_results, codeSet, evidence),
+          db_results: mergeEvidence(prev.db_results, codeSet, evidence),
+        });
+      } else {
+        setRemediationResults(prev => prev && {
+          ...prev,
+          os_results: mergeEvidence(prev.os_results, codeSet, evidence),
+          db_results: mergeEvidence(prev.db_results, codeSet, evidence),
+        });
+      }
+    } catch (error: any) {
+      console.error('Failed to load evidence:', error);
+    } finally {
+      codes.forEach(c => evidencePending.current.delete(`${source}:${c}`));
+    }
+  };
+
+  // 카테고리를 펼치면 해당 항목의 증적 조회
+  useEffect(() => {
+    if (expandedCategories.size === 0) return;
+    const showScan = subTab === 'scan' || activeTab === 'database';
+    const categories = showScan
+      ? (activeTab === 'linux' ? serverResults?.os_results : serverResults?.db_results)
+      : (activeTab === 'linux' ? remediationResults?.os_results : remediationResults?.db_results);
+    if (!categories) return;
+
+    const items = [...expandedCategories].flatMap(catKey => categories[catKey]?.items ?? []);
+    loadEvidence(showScan ? 'scan' : 'remediation', items);
+  }, [expandedCategories, subTab, activeTab, serverResults, remediationResults]);
+
   // URL 파라미터로 서버+탭 자동 선택 (?server=xxx&tab=linux|database)
   useEffect(() => {
     if (initialApplied || servers.length === 0) return;
@@ -298,7 +371,7 @@ export function AssetAnalysis() {
   };
 
   // 자동조치 버튼 클릭
-  const handleAutoFix = () => {
+  const handleAutoFix = async () => {
     if (!serverResults) return;
 
     // 선택된 항목이 있으면 그것만, 없으면 전체 자동조치 가능 항목
@@ -312,6 +385,8 @@ export function AssetAnalysis() {
       return;
     }
 
+    // 조치 확인 카드에 점검 근거를 표시하므로 아직 받지 않은 증적을 먼저 조회
+    await loadEvidence('scan', itemsToFix);
     setShowRemediation(true);
   };
 
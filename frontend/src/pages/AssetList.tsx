@@ -45,7 +45,7 @@ export function AssetList() {
     try {
       setLoading(true);
       const token = localStorage.getItem('access_token');
-      const response = await fetch(`${API_BASE}/api/assets`, {
+      const response = await fetch(`${API_BASE}/api/assets?legacy=true`, {
         headers: { 'Authorization': `Bearer ${token}` }
       });
       if (response.ok) {
@@ -45,7 +45,7 @@ export function AssetRegister() {
     // 초기 서버 목록 로드
     const initServers = async () => {
       try {
-        const response = await fetch(`${API_BASE}/api/assets`, {
+        const response = await fetch(`${API_BASE}/api/assets?legacy=true`, {
           headers: {
             'Authorization': `Bearer ${token}`
           }
@@ -105,7 +105,7 @@ export function AssetRegister() {
   const fetchServers = async () => {
     try {
       const token = localStorage.getItem('access_token');
-      const response = await fetch(`${API_BASE}/api/assets`, {
+      const response = await fetch(`${API_BASE}/api/assets?legacy=true`, {
         headers: {
           'Authorization': `Bearer ${token}`
         }
@@ -291,6 +291,20 @@ prune_scan_dir_for_limit() {
             rm -f "$f" 2>/dev/null || true
         fi
     done
+    # Result bundles are parsed in place (no unarchive): os_check_results_<company>_<server_id>.tar.gz
+    for f in "$dir"/*.tar.gz; do
+        base="$(basename "$f")"
+        keep=0
+        for p in "${prefixes[@]}"; do
+            if [[ "$base" == *"_results_${p%_}.tar.gz" ]]; then
+                keep=1
+                break
+            fi
+        done
+        if [[ "$keep" -eq 0 ]]; then
+            rm -f "$f" 2>/dev/null || true
+        fi
+    done
     shopt -u nullglob
 }
 
@@ -338,11 +352,79 @@ run_scan() {
     echo "✅ 점검 완료! 대시보드: ./run.sh dashboard"
 }
 
+claim_fix_run() {
+    # fix_service.py가 대기열(/tmp/audit/fix_queue/<kind>/<순번>-<run_id>)에 넣은 조치 실행 중
+    # 가장 오래된 것을 가져와 FIX_RUN_DIR(/tmp/audit/fix_runs/<run_id>) 설정
+    # mv는 원자적이므로 같은 실행을 두 job이 가져가지 않는다. 대기열이 비어 있으면 1을 반환
+    # <...>.pending 항목은 Job API 작업 생성 전이므로 가져가지 않는다. 준비된 항목이 없고 최근(1분 내)
+    # .pending 항목이 있으면 API가 준비 상태로 바꿀 때까지 최대 FIX_QUEUE_WAIT_SECONDS초 기다린다
+    local kind="$1"
+    local queue="/tmp/audit/fix_queue/$kind"
+    local wait_seconds="${FIX_QUEUE_WAIT_SECONDS:-60}"
+    local waited=0
+    local entry run_dir
+    FIX_RUN_DIR=""
+    [[ -d "$queue" ]] || return 1
+    while true; do
+        while read -r entry; do
+            [[ -n "$entry" ]] || continue
+            run_dir="/tmp/audit/fix_runs/${entry#*-}"
+            if [[ ! -d "$run_dir" ]]; then
+                # 실행 파일이 정리된 오래된 항목
+                rm -f "$queue/$entry"
+                continue
+            fi
+            if mv "$queue/$entry" "$run_dir/claimed_${kind}" 2>/dev/null; then
+                FIX_RUN_DIR="$run_dir"
+                return 0
+            fi
+        done < <(ls -1 "$queue" 2>/dev/null | grep -v '^\.' | grep -v '\.pending$' | sort)
+
+        if (( waited < wait_seconds )) \
+            && find "$queue" -maxdepth 1 -name '*.pending' -mmin -1 2>/dev/null | grep -q .; then
+            sleep 1
+            waited=$((waited + 1))
+            continue
+        fi
+        return 1
+    done
+}
+
 load_fix_target_server() {
-    # fix_service.py가 저장한 대상 서버 ID를 읽어 ANSIBLE_LIMIT 설정
-    # 신규 포맷: {"server_ids": ["s1","s2"]}  /  기존 포맷: {"server_id": "s1"}
+    # 조치 대상 서버 ID를 읽어 ANSIBLE_LIMIT 설정
+    # 사용: load_fix_target_server os  /  load_fix_target_server db
+    # API가 등록한 조치 실행이 대기열에 있으면 그 실행 디렉터리의 파일을, 없으면(수동 실행)
+    # /tmp/audit/fix_target_server.json 등 기존 경로의 파일을 사용
+    # 대상 포맷: {"server_ids": ["s1","s2"], "run_id": "..."}  /  기존 포맷: {"server_id": "s1"}
+    # run_id는 FIX_RUN_ID로 export → parse_fix_result가 remediation_logs.run_id에 저장
+    # 호스트별 조치 항목 / 전체 항목 파일 경로는 FIX_HOST_VARS_ARGS(-e)로 플레이북에 전달
+    local kind="$1"
     local target_file="/tmp/audit/fix_target_server.json"
+    local item_codes_file="/tmp/audit/fix_item_codes.json"
+    local host_items_file="/tmp/audit/fix_host_items.json"
+    FIX_RUN_PLAN_FILE=""
+    if claim_fix_run "$kind"; then
+        target_file="$FIX_RUN_DIR/target.json"
+        item_codes_file="$FIX_RUN_DIR/item_codes.json"
+        host_items_file="$FIX_RUN_DIR/host_items.json"
+        FIX_RUN_PLAN_FILE="$FIX_RUN_DIR/plan.json"
+    fi
+    unset FIX_RUN_ID
+    FIX_HOST_VARS_ARGS=(-e "fix_item_codes_file=${item_codes_file}")
+    if [[ -f "$host_items_file" ]]; then
+        FIX_HOST_VARS_ARGS+=(-e "@${host_items_file}")
+    fi
     if [[ -f "$target_file" ]]; then
+        local run_id
+        run_id="$(python3 -c "
+import json
+print(json.load(open('$target_file')).get('run_id') or '')
+" 2>/dev/null || true)"
+        if [[ -n "$run_id" ]]; then
+            export FIX_RUN_ID="$run_id"
+            echo "[INFO] 조치 실행 ID: $run_id"
+        fi
+
         local limit
         limit="$(python3 -c "
 import json
@@ -359,6 +441,79 @@ elif 'server_id' in data:
     fi
 }
 
+run_fix_plan() {
+    # fix_service.py가 저장한 일괄 조치 실행 계획(실행 디렉터리의 plan.json)의 실행 그룹을 웨이브 단위로 병렬 실행
+    # 실행 그룹마다 --limit(대상 서버)이 달라 서로 겹치지 않는다. 웨이브 안의 그룹은 동시에 실행하고
+    # 모두 끝나면 다음 웨이브로 넘어간다.
+    # 사용: run_fix_plan os playbooks/fix_os.yml  /  run_fix_plan db playbooks/fix_db.yml
+    # 반환값: 0 = 모든 실행 그룹 성공 / 1 = 이번 실행(FIX_RUN_ID)의 계획 없음 → 호출 측에서 단일 실행
+    #         2 = 실패한 실행 그룹 있음 (나머지 그룹과 다음 웨이브는 계속 실행)
+    local kind="$1"
+    local playbook="$2"
+    local plan_file="${FIX_RUN_PLAN_FILE:-}"
+    if [[ -z "${FIX_RUN_ID:-}" || -z "$plan_file" || ! -f "$plan_file" ]]; then
+        return 1
+    fi
+
+    # 웨이브당 한 줄: "index=server1,server2 index=server3 ..."
+    local waves
+    waves="$(python3 -c "
+import json, sys
+plan = json.load(open('$plan_file'))
+if plan.get('run_id') != '$FIX_RUN_ID':
+    sys.exit(1)
+section = plan.get('$kind') or {}
+runs = section.get('runs', [])
+print('[INFO] $kind 조치 계획: 실행 그룹 %d개, 웨이브 %d개, 예상 %d초' % (len(runs), len(section.get('waves', [])), section.get('estimated_seconds', 0)), file=sys.stderr)
+for wave in section.get('waves', []):
+    print(' '.join('%d=%s' % (i, ','.join(runs[i]['server_ids'])) for i in wave))
+")" || return 1
+
+    if [[ -z "$waves" ]]; then
+        echo "[INFO] $kind 조치 대상 서버 없음"
+        return 0
+    fi
+
+    local wave_no=0 failed=0
+    local wave_runs run idx limit log i
+    while read -r -a wave_runs; do
+        wave_no=$((wave_no + 1))
+        echo "[INFO] $kind 조치 웨이브 ${wave_no}: 실행 그룹 ${#wave_runs[@]}개"
+        local pids=() logs=()
+        for run in "${wave_runs[@]}"; do
+            idx="${run%%=*}"
+            limit="${run#*=}"
+            log="/tmp/audit/fix_${kind}_run_${idx}.log"
+            echo "[INFO]   실행 그룹 #${idx}: ${limit}"
+            (
+                export ANSIBLE_LIMIT="$limit"
+                normalize_ansible_limit_server_ids
+                cd "$PROJECT_DIR/ansible"
+                # 동시 실행 시 로컬 스크립트 번들 경로가 겹치지 않게 그룹별로 분리
+                ansible_playbook "$playbook" "${FIX_HOST_VARS_ARGS[@]}" \
+                    -e "local_bundle_path=/tmp/audit/${kind}_fix_bundle_${idx}.tar.gz"
+            ) > "$log" 2>&1 &
+            pids+=("$!")
+            logs+=("$log")
+        done
+        for i in "${!pids[@]}"; do
+            local rc=0
+            wait "${pids[$i]}" || rc=$?
+            cat "${logs[$i]}"
+            rm -f "${logs[$i]}"
+            if [[ $rc -ne 0 ]]; then
+                echo "[ERROR] $kind 실행 그룹 #${wave_runs[$i]%%=*} 실패 (exit $rc)"
+                failed=$((failed + 1))
+            fi
+        done
+    done <<< "$waves"
+    if [[ $failed -gt 0 ]]; then
+        echo "[ERROR] $kind 조치 실행 그룹 ${failed}개 실패"
+        return 2
+    fi
+    return 0
+}
+
 run_fix() {
     echo "=============================================="
     echo "  [1/3] OS 취약점 조치 실행"
@@ -367,10 +522,16 @@ run_fix() {
     # 이전 실행 결과 파일 정리 (중복 파싱 방지)
     rm -f /tmp/audit/fix/*.json /tmp/audit/fix/*.tar.gz 2>/dev/null || true
     sync_inventory
-    load_fix_target_server
+    load_fix_target_server os
     normalize_ansible_limit_server_ids
     cd "$PROJECT_DIR/ansible"
-    ansible_playbook playbooks/fix_os.yml
+    # 조치 플레이북이 실패해도 성공한 호스트의 결과는 저장하고, 마지막에 실패 코드로 종료
+    local fix_rc=0
+    run_fix_plan os playbooks/fix_os.yml || fix_rc=$?
+    if [[ $fix_rc -eq 1 ]]; then
+        fix_rc=0
+        ansible_playbook playbooks/fix_os.yml "${FIX_HOST_VARS_ARGS[@]}" || fix_rc=$?
+    fi
 
     echo ""
     echo "=============================================="
@@ -386,8 +547,14 @@ run_fix() {
     echo "  [3/3] 임시 파일 정리"
     echo "=============================================="
     maybe_cleanup_tmp_dir /tmp/audit/fix
-    # fix_target_server.json / fix_item_codes.json은 fix-db job이 공유하므로 삭제하지 않음
-    # start_fix()가 매번 덮어쓰므로 stale 위험 없음
+    # 조치 실행 디렉터리(/tmp/audit/fix_runs/<run_id>)는 fix-db job이 공유하므로 삭제하지 않음
+    # (fix_service.py가 보관 기간이 지난 실행을 정리)
+
+    if [[ $fix_rc -ne 0 ]]; then
+        echo ""
+        echo "❌ OS 조치 플레이북 실패 (exit $fix_rc)"
+        return "$fix_rc"
+    fi
 
     echo ""
     echo "✅ 조치 완료! 대시보드: ./run.sh dashboard"
@@ -511,10 +678,16 @@ run_fix_db() {
     # 이전 실행 결과 파일 정리 (중복 파싱 방지)
     rm -f /tmp/audit/fix/*.json /tmp/audit/fix/*.tar.gz 2>/dev/null || true
     sync_inventory
-    load_fix_target_server
+    load_fix_target_server db
     normalize_ansible_limit_server_ids
     cd "$PROJECT_DIR/ansible"
-    ansible_playbook playbooks/fix_db.yml
+    # 조치 플레이북이 실패해도 성공한 호스트의 결과는 저장하고, 마지막에 실패 코드로 종료
+    local fix_rc=0
+    run_fix_plan db playbooks/fix_db.yml || fix_rc=$?
+    if [[ $fix_rc -eq 1 ]]; then
+        fix_rc=0
+        ansible_playbook playbooks/fix_db.yml "${FIX_HOST_VARS_ARGS[@]}" || fix_rc=$?
+    fi
 
     echo ""
     echo "=============================================="
@@ -530,7 +703,13 @@ run_fix_db() {
     echo "  [3/3] 임시 파일 정리"
     echo "=============================================="
     maybe_cleanup_tmp_dir /tmp/audit/fix
-    # fix_target_server.json / fix_item_codes.json은 start_fix()가 매번 덮어쓰므로 삭제 불필요
+    # 조치 실행 디렉터리(/tmp/audit/fix_runs/<run_id>)는 fix_service.py가 보관 기간이 지나면 정리
+
+    if [[ $fix_rc -ne 0 ]]; then
+        echo ""
+        echo "❌ DB 조치 플레이북 실패 (exit $fix_rc)"
+        return "$fix_rc"
+    fi
 
     echo ""
     echo "✅ DB 조치 완료! 대시보드: ./run.sh dashboard"
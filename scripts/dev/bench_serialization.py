@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for JSON response encoding and compression.
+
+Compares, for the dashboard and per-server result payloads:
+  - default FastAPI path: jsonable_encoder() + stdlib json.dumps (JSONResponse.render)
+  - app path: core.responses.encode_json() + FastJSONResponse.render (orjson)
+and reports bytes on the wire uncompressed, gzip and brotli (if installed)
+at the levels configured for CompressionMiddleware.
+
+Payloads are synthetic by default (shape of /api/dashboard/data and
+/api/analysis/servers/{id}/results with and without raw_evidence). Pass API
+credentials to benchmark the real responses instead.
+
+Usage examples (run inside venv):
+  python3 scripts/dev/bench_serialization.py
+  python3 scripts/dev/bench_serialization.py --items 400 --evidence-bytes 4000 --repeat 200
+  python3 scripts/dev/bench_serialization.py --base-url http://127.0.0.1:8000 \\
+      --user admin --password '...' --server-id web-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import random
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+try:
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+except ModuleNotFoundError as e:
+    raise SystemExit(
+        "Missing dependency: fastapi / orjson.\n"
+        "Run inside the project venv:\n"
+        "  source venv/bin/activate\n"
+        "  pip install -r backend/requirements.txt\n"
+    ) from e
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "backend"))
+from core.config import COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY  # noqa: E402
+from core.responses import FastJSONResponse, encode_json  # noqa: E402
+
+OS_CATEGORIES = ["account", "directory", "service", "patch", "log"]
+DB_CATEGORIES = ["account", "access", "option", "patch"]
+
+
+def default_path(content) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def fast_path(content) -> bytes:
+    return FastJSONResponse(jsonable_encoder(encode_json(content))).body
+
+
+# ---------------------------------------------------------------------------
+# synthetic payloads
+# ---------------------------------------------------------------------------
+
+def fake_evidence(rng: random.Random, size: int) -> str:
+    lines = [f"[{i:03d}] /etc/security/limits.conf: 점검 결과 deny=5 unlock_time=120 {rng.random():.6f}" for i in range(size // 80 + 1)]
+    detail = "\\n".join(lines)[:size]
+    return json.dumps({
+        "detail": detail,
+        "command": "grep -E '^auth' /etc/pam.d/system-auth",
+        "guide": "계정 잠금 임계값을 10회 이하로 설정",
+        "target_file": "/etc/pam.d/system-auth",
+    }, ensure_ascii=False)
+
+
+def synthetic_results(items: int, evidence_bytes: int, include_evidence: bool, seed: int = 1) -> dict:
+    rng = random.Random(seed)
+    os_results = {c: {"secure_count": 0, "vulnerable_count": 0, "exception_count": 0, "items": []} for c in OS_CATEGORIES}
+    db_results = {c: {"secure_count": 0, "vulnerable_count": 0, "exception_count": 0, "items": []} for c in DB_CATEGORIES}
+    for i in range(items):
+        is_os = i % 4 != 3
+        category = rng.choice(OS_CATEGORIES if is_os else DB_CATEGORIES)
+        status = rng.choice(["양호", "취약"])
+        item = {
+            "item_code": f"U-{i:02d}" if is_os else f"D-{i:02d}",
+            "title": f"점검 항목 {i} 설정 확인",
+            "status": status,
+            "has_exception": False,
+            "auto_fix": rng.random() < 0.6,
+            "severity": rng.choice(["상", "중", "하"]),
+            "scan_date": "2026-10-17 09:00",
+            "guide": "설정 파일에서 해당 옵션을 권고 값으로 변경",
+            "auto_fix_description": "서비스 재시작 필요",
+        }
+        if include_evidence:
+            item["raw_evidence"] = fake_evidence(rng, evidence_bytes)
+        target = (os_results if is_os else db_results)[category]
+        target["items"].append(item)
+        target["secure_count" if status == "양호" else "vulnerable_count"] += 1
+    return {
+        "server_info": {"server_id": "web-01", "hostname": "web-01", "ip_address": "10.0.0.1",
+                        "os_type": "Rocky Linux 9", "db_type": "MySQL 8.0", "is_active": True},
+        "os_results": os_results,
+        "db_results": db_results,
+    }
+
+
+def synthetic_dashboard(servers: int, seed: int = 1) -> dict:
+    rng = random.Random(seed)
+
+    def categories(keys):
+        return {k: {"vulnerable": rng.randint(0, servers), "total": servers * 10} for k in keys}
+
+    def top(prefix):
+        return [{"server_id": f"{prefix}-{i:03d}", "hostname": f"{prefix}-{i:03d}", "vulnerable_count": rng.randint(1, 40)}
+                for i in range(5)]
+
+    return {
+        "summary": {"company": "BENCH", "last_scan_date": "2026-10-17 09:00:00", "total_servers": servers,
+                    "os_info": [{"name": "Rocky Linux 9", "count": servers // 2}],
+                    "db_info": [{"name": "MySQL 8.0", "count": servers // 3}]},
+        "os_categories": categories(OS_CATEGORIES),
+        "db_categories": categories(DB_CATEGORIES),
+        "unresolved_count": rng.randint(0, servers * 20),
+        "os_top_servers": top("web"),
+        "db_top_servers": top("db"),
+        "risk_distribution": {"high": 10, "medium": 20, "low": 30},
+        "vulnerability_ratio": {"vulnerable": 120, "secure": 880, "vulnerable_percent": 12.0,
+                                "secure_percent": 88.0, "total": 1000},
+    }
+
+
+# ---------------------------------------------------------------------------
+# live payloads
+# ---------------------------------------------------------------------------
+
+def api_request(url: str, token: str | None = None, body: dict | None = None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, method="POST" if body is not None else "GET")
+    req.add_header("Content-Type", "application/json")
+    if token:
+        req.add_header("Authorization", f"Bearer {token}")
+    with urllib.request.urlopen(req, timeout=60) as resp:
+        return json.loads(resp.read())
+
+
+def live_payloads(base: str, user: str, password: str, server_id: str) -> list[tuple[str, object]]:
+    token = api_request(f"{base}/api/auth/login", body={"username": user, "password": password})["access_token"]
+    results = f"{base}/api/analysis/servers/{server_id}/results"
+    return [
+        ("dashboard", api_request(f"{base}/api/dashboard/data", token)),
+        ("server_results", api_request(f"{results}?include_evidence=true", token)),
+        ("server_results (no evidence)", api_request(f"{results}?include_evidence=false", token)),
+    ]
+
+
+# ---------------------------------------------------------------------------
+
+def time_per_op(func, content, repeat: int) -> float:
+    func(content)  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(content)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON encoding and compression of API payloads")
+    parser.add_argument("--items", type=int, default=300, help="check items per server (synthetic)")
+    parser.add_argument("--evidence-bytes", type=int, default=2000, help="raw_evidence size per item (synthetic)")
+    parser.add_argument("--servers", type=int, default=200, help="servers in the dashboard payload (synthetic)")
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--base-url", help="benchmark live payloads from this API instead of synthetic ones")
+    parser.add_argument("--user")
+    parser.add_argument("--password")
+    parser.add_argument("--server-id")
+    args = parser.parse_args()
+
+    if args.base_url:
+        if not (args.user and args.password and args.server_id):
+            parser.error("--base-url requires --user, --password and --server-id")
+        payloads = live_payloads(args.base_url.rstrip("/"), args.user, args.password, args.server_id)
+    else:
+        payloads = [
+            ("dashboard", synthetic_dashboard(args.servers)),
+            ("server_results", synthetic_results(args.items, args.evidence_bytes, include_evidence=True)),
+            ("server_results (no evidence)", synthetic_results(args.items, args.evidence_bytes, include_evidence=False)),
+        ]
+
+    header = f"{'payload':<30} {'default ms':>10} {'orjson ms':>10} {'speedup':>8} {'raw B':>10} {'gzip B':>9} {'gzip ms':>8}"
+    if brotli is not None:
+        header += f" {'br B':>9} {'br ms':>7}"
+    print(header)
+    print("-" * len(header))
+
+    for name, content in payloads:
+        baseline = default_path(content)
+        fast = fast_path(content)
+        if json.loads(baseline) != json.loads(fast):
+            print(f"{name}: encoded bodies differ", file=sys.stderr)
+            return 1
+
+        default_ms = time_per_op(default_path, content, args.repeat)
+        fast_ms = time_per_op(fast_path, content, args.repeat)
+        gz = gzip.compress(fast, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+        gz_ms = time_per_op(lambda b: gzip.compress(b, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0), fast, args.repeat)
+        row = (f"{name:<30} {default_ms:>10.3f} {fast_ms:>10.3f} {default_ms / fast_ms:>7.1f}x "
+               f"{len(fast):>10,} {len(gz):>9,} {gz_ms:>8.3f}")
+        if brotli is not None:
+            br = brotli.compress(fast, quality=COMPRESSION_BROTLI_QUALITY)
+            br_ms = time_per_op(lambda b: brotli.compress(b, quality=COMPRESSION_BROTLI_QUALITY), fast, args.repeat)
+            row += f" {len(br):>9,} {br_ms:>7.3f}"
+        print(row)
+
+    if brotli is None:
+        print("\n(brotli not installed: pip install Brotli to include br sizes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
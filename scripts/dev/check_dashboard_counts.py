@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Consistency check for the dashboard counters.
+
+GET /api/dashboard/data rebuilds its counters from server_category_scores.
+This script recomputes the same counters with the original dashboard queries
+(one aggregate per widget straight from scan_history, same filters) and exits
+non-zero when any of them differ.
+
+--seed creates servers whose OS rows are older than their DB rows (the state
+after "run.sh scan-db"), which is the case a latest-scan_date filter gets wrong.
+It also adds a few 'D-' kisa_items next to the PG-D-/MY-D- ones, so the
+'D-'-only DB category and top-5 widgets are exercised.
+
+Usage examples (run inside venv, DB settings from .env):
+  python3 scripts/dev/check_dashboard_counts.py --seed 20        # seed mixed-date data, refresh scores, check
+  python3 scripts/dev/check_dashboard_counts.py --company NAVER  # check real data (read-only)
+  python3 scripts/dev/check_dashboard_counts.py --cleanup        # remove seeded rows
+
+Original widget rules: OS categories / OS top 5 count 'U-' items, DB categories /
+DB top 5 count 'D-' items only, and the unresolved count, risk distribution and
+vulnerability ratio count every item.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+try:
+    import mysql.connector  # from mysql-connector-python
+except ModuleNotFoundError as e:
+    raise SystemExit(
+        "Missing dependency: mysql-connector-python.\n"
+        "Run inside the project venv:\n"
+        "  source venv/bin/activate\n"
+        "  pip install -r requirements.txt\n"
+    ) from e
+
+try:
+    from dotenv import load_dotenv
+except ModuleNotFoundError as e:
+    raise SystemExit(
+        "Missing dependency: python-dotenv.\n"
+        "Run inside the project venv:\n"
+        "  source venv/bin/activate\n"
+        "  pip install -r requirements.txt\n"
+    ) from e
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "backend"))
+from db.scores import refresh_statements  # noqa: E402  (stdlib-only module)
+
+SEED_COMPANY = "DASHCHECK"
+SEED_PREFIX = "dashcheck-"
+# item_code, category, severity (kisa_items seeds only ship PG-D-/MY-D- codes)
+SEED_D_ITEMS = [("D-91", "account", "상"), ("D-92", "access", "중"), ("D-93", "option", "하")]
+
+# Original dashboard: one aggregate per widget over scan_history
+_HISTORY_FROM = """
+    FROM scan_history sh
+    JOIN kisa_items ki ON sh.item_code = ki.item_code
+    JOIN servers s ON sh.server_id = s.server_id
+    WHERE s.company = %s AND s.is_active = 1 AND ki.category != 'unknown'
+"""
+_HISTORY_VULN = f"{_HISTORY_FROM} AND sh.status = '취약'"
+_OS_ITEMS = "AND SUBSTRING(sh.item_code, 1, 2) = 'U-'"
+_DB_ITEMS = "AND SUBSTRING(sh.item_code, 1, 2) = 'D-'"
+
+# Current dashboard: sums over server_category_scores
+_SCORES_FROM = """
+    FROM server_category_scores scs
+    JOIN servers s ON scs.server_id = s.server_id
+    WHERE s.company = %s AND s.is_active = 1 AND scs.category != 'unknown'
+"""
+
+# name, baseline sql, scores sql  (rows are compared as sets of tuples, zero counts dropped)
+CHECKS = [
+    (
+        "os_categories",
+        f"SELECT ki.category, COUNT(*) {_HISTORY_VULN} {_OS_ITEMS} GROUP BY 1",
+        f"SELECT scs.category, SUM(scs.vulnerable_count) {_SCORES_FROM} AND scs.item_prefix = 'U' GROUP BY 1",
+    ),
+    (
+        "db_categories",
+        f"SELECT ki.category, COUNT(*) {_HISTORY_VULN} {_DB_ITEMS} GROUP BY 1",
+        f"SELECT scs.category, SUM(scs.vulnerable_count) {_SCORES_FROM} AND scs.item_prefix = 'D' GROUP BY 1",
+    ),
+    (
+        "unresolved_count",
+        f"SELECT COUNT(*) {_HISTORY_VULN}",
+        f"SELECT SUM(scs.vulnerable_count) {_SCORES_FROM}",
+    ),
+    (
+        "os_top_servers",
+        f"SELECT sh.server_id, COUNT(*) {_HISTORY_VULN} {_OS_ITEMS} GROUP BY 1",
+        f"SELECT scs.server_id, SUM(scs.vulnerable_count) {_SCORES_FROM} AND scs.item_prefix = 'U' GROUP BY 1",
+    ),
+    (
+        "db_top_servers",
+        f"SELECT sh.server_id, COUNT(*) {_HISTORY_VULN} {_DB_ITEMS} GROUP BY 1",
+        f"SELECT scs.server_id, SUM(scs.vulnerable_count) {_SCORES_FROM} AND scs.item_prefix = 'D' GROUP BY 1",
+    ),
+    (
+        "risk_distribution",
+        f"SELECT SUM(ki.severity = '상'), SUM(ki.severity = '중'), SUM(ki.severity = '하') {_HISTORY_VULN}",
+        f"SELECT SUM(scs.vuln_high), SUM(scs.vuln_medium), SUM(scs.vuln_low) {_SCORES_FROM}",
+    ),
+    (
+        "vulnerability_ratio",
+        f"SELECT SUM(sh.status = '취약'), SUM(sh.status = '양호') {_HISTORY_FROM}",
+        f"SELECT SUM(scs.vulnerable_count), SUM(scs.secure_count) {_SCORES_FROM}",
+    ),
+]
+
+
+def load_db_env() -> dict:
+    load_dotenv()
+    user = os.getenv("DB_USER")
+    password = os.getenv("DB_PASSWORD")
+    if not user or not password:
+        raise SystemExit("Missing DB_USER/DB_PASSWORD in .env")
+    return {
+        "host": os.getenv("DB_HOST", "127.0.0.1"),
+        "port": int(os.getenv("DB_PORT", "3306")),
+        "user": user,
+        "password": password,
+        "database": os.getenv("DB_NAME", "kisa_security"),
+        "charset": "utf8mb4",
+    }
+
+
+def seed(conn, n_servers: int) -> None:
+    cur = conn.cursor()
+    cur.executemany(
+        "INSERT IGNORE INTO kisa_items (item_code, category, title, severity, description, auto_fix, guide) "
+        "VALUES (%s, %s, %s, %s, 'check', 0, 'check')",
+        [(code, category, f"dashcheck {code}", severity) for code, category, severity in SEED_D_ITEMS],
+    )
+    cur.execute("SELECT item_code FROM kisa_items ORDER BY item_code")
+    items = [r[0] for r in cur.fetchall()]
+    if not items:
+        raise SystemExit("kisa_items is empty; load backend/db/seeds/*.sql first")
+
+    now = datetime.now().replace(microsecond=0)
+    os_date = now - timedelta(days=3)  # as after "run.sh scan-db": OS rows older than DB rows
+    rng = random.Random(n_servers)
+    server_ids = [f"{SEED_PREFIX}{i:05d}" for i in range(n_servers)]
+    cur.executemany(
+        "INSERT IGNORE INTO servers (server_id, company, hostname, ip_address, os_type, db_type, db_passwd, "
+        "manager, department) VALUES (%s, %s, %s, '10.0.0.1', 'Rocky Linux 9', 'MySQL 8.0', '', 'check', 'check')",
+        [(sid, SEED_COMPANY, sid) for sid in server_ids],
+    )
+    for sid in server_ids:
+        cur.executemany(
+            "INSERT IGNORE INTO scan_history (server_id, item_code, status, scan_date) VALUES (%s, %s, %s, %s)",
+            [
+                (sid, code, rng.choice(("양호", "취약")), os_date if code.startswith("U-") else now)
+                for code in items
+            ],
+        )
+    for sql, params in refresh_statements(server_ids):
+        cur.execute(sql, params)
+    conn.commit()
+    print(f"seeded {n_servers} servers x {len(items)} items (company={SEED_COMPANY}, OS rows at {os_date})")
+
+
+def cleanup(conn) -> None:
+    cur = conn.cursor()
+    like = SEED_PREFIX + "%"
+    for table in ("server_category_scores", "server_scores", "scan_history", "servers"):
+        cur.execute(f"DELETE FROM {table} WHERE server_id LIKE %s", (like,))
+        print(f"{table}: deleted {cur.rowcount}")
+    codes = [code for code, _, _ in SEED_D_ITEMS]
+    cur.execute(
+        "DELETE FROM kisa_items WHERE title LIKE %s AND item_code IN (" + ", ".join(["%s"] * len(codes)) + ")",
+        ["dashcheck %", *codes],
+    )
+    print(f"kisa_items: deleted {cur.rowcount}")
+    conn.commit()
+
+
+def _normalize(rows) -> set:
+    """Decimal/None -> int; grouped rows with a zero count are dropped (scan_history has no row for them)."""
+    out = set()
+    for row in rows:
+        *keys, last = row
+        values = [int(v or 0) for v in ([last] if keys and isinstance(keys[0], str) else row)]
+        if keys and isinstance(keys[0], str):
+            if values[0]:
+                out.add((*keys, values[0]))
+        else:
+            out.add(tuple(values))
+    return out
+
+
+def check(conn, company: str) -> int:
+    cur = conn.cursor()
+    failures = 0
+    for name, baseline_sql, scores_sql in CHECKS:
+        cur.execute(baseline_sql, (company,))
+        baseline = _normalize(cur.fetchall())
+        cur.execute(scores_sql, (company,))
+        scores = _normalize(cur.fetchall())
+        ok = baseline == scores
+        print(f"[{'ok' if ok else 'FAIL':>4}] {name}")
+        if not ok:
+            for row in sorted(baseline - scores, key=str):
+                print(f"         scan_history only: {row}")
+            for row in sorted(scores - baseline, key=str):
+                print(f"         scores only:       {row}")
+        failures += not ok
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare dashboard counters with scan_history aggregates")
+    parser.add_argument("--company", default=SEED_COMPANY, help="company to check")
+    parser.add_argument("--seed", type=int, metavar="N", help=f"seed N mixed-date servers (company={SEED_COMPANY})")
+    parser.add_argument("--cleanup", action="store_true", help="delete seeded rows and exit")
+    args = parser.parse_args()
+
+    conn = mysql.connector.connect(**load_db_env())
+    try:
+        if args.cleanup:
+            cleanup(conn)
+            return 0
+        if args.seed:
+            seed(conn, args.seed)
+        failures = check(conn, args.company)
+        print(f"\n{len(CHECKS) - failures}/{len(CHECKS)} counters match")
+        return 1 if failures else 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
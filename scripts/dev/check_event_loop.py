@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Event-loop responsiveness check for the running API.
+
+Starts one or more slow requests (report generation by default, optionally a
+fix-result lookup) and, while they are in flight, polls GET /health. If any
+probe takes longer than --max-latency, a handler is blocking the uvicorn event
+loop and the script exits non-zero.
+
+Usage examples (API must be running, e.g. uvicorn main:app --port 8000):
+  python3 scripts/dev/check_event_loop.py --user admin --password '...'
+  python3 scripts/dev/check_event_loop.py --user admin --password '...' --fix-job JOB_ID
+  python3 scripts/dev/check_event_loop.py --base-url http://127.0.0.1:8000 --max-latency 0.2
+
+Uses only the standard library so it can run outside the project venv.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+def request(method: str, url: str, token: str | None = None, body: dict | None = None, timeout: float = 300):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, method=method)
+    req.add_header("Content-Type", "application/json")
+    if token:
+        req.add_header("Authorization", f"Bearer {token}")
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.status, resp.read()
+
+
+def login(base_url: str, user: str, password: str) -> str:
+    _, body = request("POST", f"{base_url}/api/auth/login", body={"username": user, "password": password})
+    return json.loads(body)["access_token"]
+
+
+def run_slow(name: str, method: str, url: str, token: str, results: dict) -> None:
+    started = time.perf_counter()
+    try:
+        status, body = request(method, url, token)
+        results[name] = (status, len(body), time.perf_counter() - started)
+    except urllib.error.HTTPError as e:
+        results[name] = (e.code, 0, time.perf_counter() - started)
+    except Exception as e:  # connection errors etc.
+        results[name] = (repr(e), 0, time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fail if /health stalls while slow requests are in flight")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--user", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--fix-job", help="also fetch /api/fix/result/<job_id> concurrently")
+    parser.add_argument("--max-latency", type=float, default=0.5, help="seconds allowed per /health probe")
+    parser.add_argument("--interval", type=float, default=0.05, help="seconds between /health probes")
+    args = parser.parse_args()
+
+    base = args.base_url.rstrip("/")
+    token = login(base, args.user, args.password)
+
+    slow = [("report", "POST", f"{base}/api/reports/generate")]
+    if args.fix_job:
+        slow.append(("fix_result", "GET", f"{base}/api/fix/result/{args.fix_job}"))
+
+    results: dict = {}
+    threads = [threading.Thread(target=run_slow, args=(*s, token, results)) for s in slow]
+    for t in threads:
+        t.start()
+
+    latencies = []
+    while any(t.is_alive() for t in threads):
+        started = time.perf_counter()
+        request("GET", f"{base}/health", timeout=30)
+        latencies.append(time.perf_counter() - started)
+        time.sleep(args.interval)
+    for t in threads:
+        t.join()
+
+    for name, (status, size, elapsed) in results.items():
+        print(f"{name:<12} status={status} bytes={size} elapsed={elapsed:.2f}s")
+    if not latencies:
+        print("slow requests finished before the first probe; nothing measured")
+        return 1
+
+    worst = max(latencies)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    print(f"/health probes={len(latencies)} p50={p50 * 1000:.1f}ms max={worst * 1000:.1f}ms")
+    if worst > args.max_latency:
+        print(f"FAIL: event loop stalled for {worst:.2f}s (> {args.max_latency}s)")
+        return 1
+    print("ok")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Query-plan regression check for the MySQL schema.
+
+Calls the API handlers, services and pipeline connector methods that issue
+the hot queries, captures every SELECT they send (SQLAlchemy
+before_cursor_execute / DBConnector._fetch) and EXPLAINs exactly those
+statements. It exits non-zero when one of them regresses to a full table scan
+(type=ALL) on a table that is expected to be index-driven, or when a
+scan_results_history query stops pruning partitions. Because the statements
+come from the code itself, there is no copy of the SQL to keep in sync.
+
+The optimizer happily full-scans tiny tables, so run it against a seeded DB:
+
+Usage examples (run inside venv, DB settings from .env):
+  python3 scripts/dev/explain_queries.py --seed 500           # seed EXPLAIN company, check, keep data
+  python3 scripts/dev/explain_queries.py                      # check against existing EXPLAIN data
+  python3 scripts/dev/explain_queries.py --company NAVER      # check against real data (read-only)
+  python3 scripts/dev/explain_queries.py --cleanup            # remove seeded rows
+
+Runs inside the project venv (imports backend/ like the API does).
+Add a CHECKS entry when a new hot query path is added.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+try:
+    import mysql.connector  # from mysql-connector-python
+except ModuleNotFoundError as e:
+    raise SystemExit(
+        "Missing dependency: mysql-connector-python.\n"
+        "Run inside the project venv:\n"
+        "  source venv/bin/activate\n"
+        "  pip install -r requirements.txt\n"
+    ) from e
+
+try:
+    from dotenv import load_dotenv
+except ModuleNotFoundError as e:
+    raise SystemExit(
+        "Missing dependency: python-dotenv.\n"
+        "Run inside the project venv:\n"
+        "  source venv/bin/activate\n"
+        "  pip install -r requirements.txt\n"
+    ) from e
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "backend"))
+try:
+    from sqlalchemy import event
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+    from api import analysis, dashboard, exceptions  # noqa: E402
+    from core import etag  # noqa: E402
+    from core.pagination import encode_cursor  # noqa: E402
+    from db.connector import DBConnector  # noqa: E402
+    from db.models import User  # noqa: E402
+    from db.scores import refresh_statements  # noqa: E402
+    from db.session import SessionLocal, engine  # noqa: E402
+    from services import fix_service  # noqa: E402
+except ModuleNotFoundError as e:
+    raise SystemExit(
+        f"Missing dependency: {e.name}.\n"
+        "Run inside the project venv:\n"
+        "  source venv/bin/activate\n"
+        "  pip install -r requirements.txt\n"
+    ) from e
+
+SEED_COMPANY = "EXPLAIN"
+SEED_PREFIX = "explain-"
+SEED_RUN_ID = "explain".ljust(32, "0")
+
+# Small lookup tables / derived tables that may legitimately be scanned in full.
+ALWAYS_ALLOWED = {"kisa_items"}
+
+
+PAGE = 100
+
+
+class _CapturingConnector(DBConnector):
+    """Pipeline connector that records its SELECTs instead of running them."""
+
+    def __init__(self, captured: list):
+        super().__init__()
+        self._captured = captured
+
+    def _fetch(self, query, params=None):
+        self._captured.append((query, params))
+        return []
+
+
+# name, call(ctx, db, captured), tables allowed to full-scan, expect partition pruning
+CHECKS = [
+    (
+        "dashboard.data",
+        lambda c, db, _: dashboard.get_dashboard_data(current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "analysis.servers",
+        lambda c, db, _: analysis.get_analysis_servers(current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "analysis.servers.etag",
+        lambda c, db, _: etag.company_exception_etag(
+            Request({"type": "http", "headers": []}), Response(), current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "analysis.server_results",
+        lambda c, db, _: analysis.get_server_results(
+            c["server_id"], include_evidence=True, fields=None, current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "analysis.server_results.etag",
+        lambda c, db, _: etag.server_exception_etag(
+            c["server_id"], Request({"type": "http", "headers": []}), Response(), current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "analysis.server_remediation",
+        lambda c, db, _: analysis.get_server_remediation(
+            c["server_id"], include_evidence=True, fields=None, current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "analysis.trend",
+        lambda c, db, _: analysis.get_server_trend(
+            c["server_id"], start=None, end=None, current_user=c["user"], db=db),
+        set(), True,
+    ),
+    (
+        "analysis.as_of",
+        lambda c, db, _: analysis.get_server_results_as_of(c["server_id"], at=None, current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "analysis.history.scans.page",
+        lambda c, db, _: analysis.get_history(
+            kind="scans", server_id=None, item_code=None, status=None, start=None, end=None,
+            cursor=encode_cursor([c["now"], c["server_id"], c["item_codes"][0]]), limit=PAGE, legacy=False,
+            current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "analysis.history.remediations.page",
+        lambda c, db, _: analysis.get_history(
+            kind="remediations", server_id=None, item_code=None, status=None, start=None, end=None,
+            cursor=encode_cursor([c["now"], 2 ** 31]), limit=PAGE, legacy=False,
+            current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "fix.result",
+        lambda c, db, _: fix_service._load_fix_result(
+            "explain", {"run_id": SEED_RUN_ID}, c["server_ids"], c["item_codes"][:2], db),
+        set(), False,
+    ),
+    (
+        "exceptions.list.page",
+        lambda c, db, _: exceptions.get_exceptions(
+            server_id=None, item_code=None, status=None, start=None, end=None,
+            cursor=encode_cursor([c["now"] + timedelta(days=365), 2 ** 31]), limit=PAGE, legacy=False,
+            current_user=c["user"], db=db),
+        set(), False,
+    ),
+    (
+        "pipeline.evidence_digests",
+        lambda c, _, captured: _CapturingConnector(captured).get_evidence_digests(c["server_ids"]),
+        set(), False,
+    ),
+]
+
+
+def capture(call, ctx: dict) -> list:
+    """Run one CHECKS call and return the SELECT statements (sql, params) it sent."""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip()[:6].upper() == "SELECT":
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    db = SessionLocal()
+    try:
+        call(ctx, db, captured)
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+
+def load_db_env() -> dict:
+    load_dotenv()
+    user = os.getenv("DB_USER")
+    password = os.getenv("DB_PASSWORD")
+    if not user or not password:
+        raise SystemExit("Missing DB_USER/DB_PASSWORD in .env")
+    return {
+        "host": os.getenv("DB_HOST", "127.0.0.1"),
+        "port": int(os.getenv("DB_PORT", "3306")),
+        "user": user,
+        "password": password,
+        "database": os.getenv("DB_NAME", "kisa_security"),
+        "charset": "utf8mb4",
+    }
+
+
+def seed(conn, n_servers: int) -> None:
+    cur = conn.cursor()
+    cur.execute("SELECT item_code FROM kisa_items ORDER BY item_code")
+    items = [r[0] for r in cur.fetchall()]
+    if not items:
+        raise SystemExit("kisa_items is empty; load backend/db/seeds/*.sql first")
+
+    now = datetime.now().replace(second=0, microsecond=0)
+    server_ids = [f"{SEED_PREFIX}{i:05d}" for i in range(n_servers)]
+    cur.executemany(
+        "INSERT IGNORE INTO servers (server_id, company, hostname, ip_address, os_type, db_passwd, manager, department) "
+        "VALUES (%s, %s, %s, '10.0.0.1', 'Rocky Linux 9', '', 'explain', 'explain')",
+        [(sid, SEED_COMPANY, sid) for sid in server_ids],
+    )
+
+    statuses = ("양호", "취약")
+    for sid_idx, sid in enumerate(server_ids):
+        rows = [(sid, code, statuses[(sid_idx + i) % 2], now) for i, code in enumerate(items)]
+        cur.executemany(
+            "INSERT IGNORE INTO scan_history (server_id, item_code, status, scan_date) VALUES (%s, %s, %s, %s)",
+            rows,
+        )
+        cur.executemany(
+            "INSERT IGNORE INTO scan_results_history (run_id, server_id, item_code, status, scan_date) "
+            "VALUES (0, %s, %s, %s, %s)",
+            [(sid, code, status, now - timedelta(days=d)) for d in (0, 35, 70) for (_, code, status, _) in rows],
+        )
+        cur.executemany(
+            "INSERT INTO remediation_logs (server_id, item_code, action_date, is_success, run_id) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            [(sid, code, now - timedelta(days=d), d == 0, SEED_RUN_ID if d == 0 else None)
+             for d in (0, 1) for code in items[::10]],
+        )
+        cur.executemany(
+            "INSERT INTO exceptions (server_id, item_code, reason, valid_date) VALUES (%s, %s, 'explain', %s)",
+            [(sid, code, now + timedelta(days=30)) for code in items[::20]],
+        )
+    for sql, params in refresh_statements(server_ids):
+        cur.execute(sql, params)
+    conn.commit()
+
+    for table in ("servers", "scan_history", "scan_results_history", "remediation_logs", "exceptions",
+                  "server_category_scores"):
+        cur.execute(f"ANALYZE TABLE {table}")
+        cur.fetchall()
+    print(f"seeded {n_servers} servers x {len(items)} items (company={SEED_COMPANY})")
+
+
+def cleanup(conn) -> None:
+    cur = conn.cursor()
+    like = SEED_PREFIX + "%"
+    for table in ("server_category_scores", "server_scores", "scan_results_history", "remediation_logs",
+                  "exceptions", "scan_history", "servers"):
+        cur.execute(f"DELETE FROM {table} WHERE server_id LIKE %s", (like,))
+        print(f"{table}: deleted {cur.rowcount}")
+    conn.commit()
+
+
+def build_context(conn, company: str) -> dict:
+    cur = conn.cursor()
+    cur.execute("SELECT server_id FROM servers WHERE company = %s AND is_active = 1 ORDER BY server_id LIMIT 50",
+                (company,))
+    server_ids = [r[0] for r in cur.fetchall()]
+    if not server_ids:
+        raise SystemExit(f"no active servers for company={company} (use --seed N)")
+    cur.execute("SELECT item_code FROM kisa_items ORDER BY item_code LIMIT 2")
+    item_codes = [r[0] for r in cur.fetchall()] or ["U-01", "U-02"]
+    return {
+        "company": company,
+        "user": User(user_id=0, user_name="explain", role="ADMIN", company=company),
+        "server_id": server_ids[0],
+        "server_ids": server_ids,
+        "item_codes": item_codes,
+        "now": datetime.now(),
+    }
+
+
+def history_partitions(conn) -> set[str]:
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'scan_results_history' AND PARTITION_NAME IS NOT NULL"
+    )
+    return {r[0] for r in cur.fetchall()}
+
+
+def explain_plan(cur, sql: str, params, allowed: set, expect_pruning: bool, all_partitions: set[str]):
+    cur.execute("EXPLAIN " + sql, params)
+    plan = cur.fetchall()
+    problems = []
+    for row in plan:
+        table = row.get("table") or ""
+        if row.get("type") == "ALL" and not table.startswith("<") and table not in ALWAYS_ALLOWED | allowed:
+            problems.append(f"full scan on {table} (rows={row.get('rows')})")
+        if expect_pruning and table == "scan_results_history" and all_partitions:
+            used = set((row.get("partitions") or "").split(","))
+            if used >= all_partitions:
+                problems.append("no partition pruning on scan_results_history")
+    return plan, problems
+
+
+def explain(conn, ctx: dict, all_partitions: set[str]) -> int:
+    cur = conn.cursor(dictionary=True)
+    failures = 0
+    for name, call, allowed, expect_pruning in CHECKS:
+        try:
+            statements = capture(call, ctx)
+        except Exception as e:  # e.g. HTTPException(404) when the context has no matching data
+            print(f"[FAIL] {name}\n         !! call failed: {e!r}")
+            failures += 1
+            continue
+        if not statements:
+            print(f"[FAIL] {name}\n         !! no SELECT captured")
+            failures += 1
+            continue
+
+        problems = []
+        print(f"[....] {name} ({len(statements)} statements)")
+        for i, (sql, params) in enumerate(statements, 1):
+            plan, stmt_problems = explain_plan(cur, sql, params, allowed, expect_pruning, all_partitions)
+            print(f"       #{i} {' '.join(sql.split())[:110]}")
+            for row in plan:
+                print(f"         {row.get('table')!s:<24} type={row.get('type')!s:<7} key={row.get('key')} "
+                      f"rows={row.get('rows')} partitions={row.get('partitions')}")
+            for p in stmt_problems:
+                print(f"         !! {p}")
+            problems += stmt_problems
+        print(f"[{'FAIL' if problems else 'ok':>4}] {name}")
+        failures += bool(problems)
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN router/pipeline queries and fail on full scans")
+    parser.add_argument("--company", default=SEED_COMPANY, help="company whose servers are used as parameters")
+    parser.add_argument("--seed", type=int, metavar="N", help=f"seed N synthetic servers (company={SEED_COMPANY})")
+    parser.add_argument("--cleanup", action="store_true", help="delete seeded rows and exit")
+    args = parser.parse_args()
+
+    conn = mysql.connector.connect(**load_db_env())
+    try:
+        if args.cleanup:
+            cleanup(conn)
+            return 0
+        if args.seed:
+            seed(conn, args.seed)
+        failures = explain(conn, build_context(conn, args.company), history_partitions(conn))
+        print(f"\n{len(CHECKS) - failures}/{len(CHECKS)} query paths ok")
+        return 1 if failures else 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
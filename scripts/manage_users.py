@@ -43,6 +43,9 @@ except ModuleNotFoundError as e:
 ROLE_ADMIN = "ADMIN"
 ROLE_VIEWER = "VIEWER"
 
+# Commands that only read users; every other command may change passwords/roles.
+READ_ONLY_COMMANDS = {"list"}
+
 
 def _b64_nopad(b: bytes) -> str:
     return base64.urlsafe_b64encode(b).decode("ascii").rstrip("=")
@@ -298,10 +301,28 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+def invalidate_api_auth_cache() -> None:
+    """
+    Touch the API auth-cache stamp so running API workers drop cached user rows
+    (see backend/core/auth_cache.py). Must match AUTH_CACHE_STAMP_FILE there.
+    """
+    path = os.getenv("AUTH_CACHE_STAMP_FILE", "/tmp/audit/auth_cache.stamp")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a"):
+            pass
+        os.utime(path, None)
+    except OSError as e:
+        print(f"warning: could not touch auth cache stamp {path}: {e}", file=sys.stderr)
+
+
 def main(argv: list[str]) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
-    return int(args.fn(args))
+    rc = int(args.fn(args))
+    if args.cmd not in READ_ONLY_COMMANDS:
+        invalidate_api_auth_cache()
+    return rc
 
 
 def _has_column(conn, col: str) -> bool: